@@ -33,8 +33,7 @@ from .core.update import UpdateError, apply_update, validate_update_payload
 from .core.update_payload import UpdatePayload
 from .history import create_snapshot, restore_snapshot
 from .home import SESSIONS_DIR, initialize_home
-from .logging_utils import log_event, log_session_event
-from .tui import TEXTUAL_AVAILABLE, PlanloopViewApp, SessionViewModel
+from .logging_utils import close_session_log, log_event, log_session_event
 
 app = typer.Typer(help="planloop CLI")
 sessions_app = typer.Typer(help="Manage sessions")
@@ -85,7 +84,7 @@ def _load_session(session_id: str | None) -> tuple[SessionState, Path]:
     state_path = session_dir / "state.json"
     if not state_path.exists():
         raise PlanloopError("state.json missing for session")
-    state = SessionState.model_validate_json(state_path.read_text(encoding="utf-8"))
+    state = SessionState.model_validate_json(state_path.read_bytes())
     return state, session_dir
 
 
@@ -210,6 +209,51 @@ def _get_feedback_request(state: SessionState) -> dict | None:
     }
 
 
+def _status_payload(
+    state: SessionState, session_dir: Path, agent_name: str | None, queue_now: float | None = None
+) -> dict:
+    """Build the ``planloop status`` payload for a loaded, validated session.
+
+    ``queue_now`` is the time stale lock-queue entries are judged against
+    (default: the current time).
+    """
+    lock_status = get_lock_status(session_dir)
+    queue_status = get_lock_queue_status(session_dir, agent=agent_name, now=queue_now)
+
+    # Detect transition: find recently completed tasks
+    transition_detected = False
+    completed_task_id = None
+    from datetime import timedelta
+
+    from .core.state import TaskStatus
+
+    # Check if any DONE task was updated in the last 5 seconds
+    now = datetime.utcnow()
+    for task in state.tasks:
+        if task.status == TaskStatus.DONE and task.last_updated_at:
+            time_since_update = now - task.last_updated_at
+            if time_since_update < timedelta(seconds=5):
+                transition_detected = True
+                completed_task_id = task.id
+                break
+
+    return {
+        "session": state.session,
+        "now": state.now.model_dump(),
+        "agent_instructions": _generate_agent_instructions(state, lock_status, queue_status),
+        "next_action": _generate_next_action(state),
+        "tdd_checklist": _get_tdd_checklist(state),
+        "feedback_request": _get_feedback_request(state),
+        "transition_detected": transition_detected,
+        "completed_task_id": completed_task_id,
+        "tasks": [task.model_dump(mode="json") for task in state.tasks],
+        "signals": [signal.model_dump(mode="json") for signal in state.signals],
+        "lock_info": lock_status.info.to_dict() if lock_status.info else None,
+        "lock_queue": queue_status.to_dict(),
+        "safe_mode_defaults": safe_mode_defaults(),
+    }
+
+
 @app.command()
 def status(session: str | None = typer.Option(None, help="Session ID"), json_output: bool = typer.Option(True, "--json/--no-json", help="JSON output")) -> None:
     """Show the current planloop session status."""
@@ -221,41 +265,8 @@ def status(session: str | None = typer.Option(None, help="Session ID"), json_out
         log_agent_command(session_dir, "status", {"session": session}, agent_name)
 
         validate_state(state)
-        lock_status = get_lock_status(session_dir)
-        queue_status = get_lock_queue_status(session_dir, agent=agent_name)
-
-        # Detect transition: find recently completed tasks
-        transition_detected = False
-        completed_task_id = None
-        from datetime import timedelta
-
-        from .core.state import TaskStatus
-
-        # Check if any DONE task was updated in the last 5 seconds
-        now = datetime.utcnow()
-        for task in state.tasks:
-            if task.status == TaskStatus.DONE and task.last_updated_at:
-                time_since_update = now - task.last_updated_at
-                if time_since_update < timedelta(seconds=5):
-                    transition_detected = True
-                    completed_task_id = task.id
-                    break
-
-        payload = {
-            "session": state.session,
-            "now": state.now.model_dump(),
-            "agent_instructions": _generate_agent_instructions(state, lock_status, queue_status),
-            "next_action": _generate_next_action(state),
-            "tdd_checklist": _get_tdd_checklist(state),
-            "feedback_request": _get_feedback_request(state),
-            "transition_detected": transition_detected,
-            "completed_task_id": completed_task_id,
-            "tasks": [task.model_dump(mode="json") for task in state.tasks],
-            "signals": [signal.model_dump(mode="json") for signal in state.signals],
-            "lock_info": lock_status.info.to_dict() if lock_status.info else None,
-            "lock_queue": queue_status.to_dict(),
-            "safe_mode_defaults": safe_mode_defaults(),
-        }
+        payload = _status_payload(state, session_dir, agent_name)
+        transition_detected = payload["transition_detected"]
 
         # Log agent response
         next_action_dict = payload.get("next_action", {})
@@ -349,6 +360,9 @@ def update(
                 "update",
                 f"version={state.version} tasks={len(payload.tasks)} add={len(payload.add_tasks)} update_tasks={len(payload.update_tasks)} reason={state.now.reason.value}",
             )
+        if state.done:
+            # Finished sessions get no further events; release the log handler
+            close_session_log(session_dir)
     except UpdateError as exc:
         raise typer.Exit(code=1) from exc
     typer.echo(json.dumps({"status": "ok", "version": state.version}, indent=2))
@@ -609,6 +623,9 @@ def reuse(
 
 @app.command()
 def view(session: str | None = typer.Option(None, help="Session ID")) -> None:
+    # Imported here so other commands (and test collection) don't load textual
+    from .tui import TEXTUAL_AVAILABLE, PlanloopViewApp, SessionViewModel
+
     if not TEXTUAL_AVAILABLE:
         typer.echo("textual is not installed. Run `pip install textual` to use planloop view.")
         raise typer.Exit(code=1)
@@ -722,104 +739,124 @@ def suggest(
     try:
         state, session_dir = _load_session(session)
         validate_state(state)
-
-        # Get suggest config
-        config = get_suggest_config()
-        
-        # Apply weekly mode settings
-        if weekly:
-            config.batch_mode = "weekly"
-            config.context_depth = "deep"
-            config.include_coverage_analysis = True
-            config.include_security_analysis = True
-            if not limit:
-                limit = config.get_effective_max_suggestions()
-
-        # Override limit if specified
-        if limit is not None:
-            config.max_suggestions = limit
-
-        # Initialize suggestion engine
-        engine = SuggestionEngine(state, config)
-
-        # Generate suggestions
-        project_root = Path(state.project_root) if state.project_root else session_dir.parent
-        depth_literal: Literal["shallow", "medium", "deep"] | None = None
-        if depth in ("shallow", "medium", "deep"):
-            depth_literal = depth  # type: ignore
-
-        suggestions = engine.generate_suggestions(
-            project_root=project_root,
-            depth=depth_literal
+        _suggest_impl(
+            state,
+            session_dir,
+            depth=depth,
+            limit=limit,
+            dry_run=dry_run,
+            auto_approve=auto_approve,
+            weekly=weekly,
         )
+    except PlanloopError as exc:
+        typer.echo(f"Error: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+    except Exception as exc:
+        typer.echo(f"Unexpected error: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
 
-        if not suggestions:
-            typer.echo("No suggestions generated.")
-            return
 
-        # Display suggestions
-        typer.echo(f"\n🔍 Found {len(suggestions)} suggestion(s)\n")
+def _suggest_impl(
+    state: SessionState,
+    session_dir: Path,
+    *,
+    depth: str = "medium",
+    limit: int | None = None,
+    dry_run: bool = False,
+    auto_approve: bool = False,
+    weekly: bool = False,
+) -> None:
+    """Body of ``planloop suggest`` for an already loaded and validated session."""
+    # Get suggest config; copied so per-run overrides don't leak into the cache
+    config = get_suggest_config().model_copy()
+
+    # Apply weekly mode settings
+    if weekly:
+        config.batch_mode = "weekly"
+        config.context_depth = "deep"
+        config.include_coverage_analysis = True
+        config.include_security_analysis = True
+        if not limit:
+            limit = config.get_effective_max_suggestions()
+
+    # Override limit if specified
+    if limit is not None:
+        config.max_suggestions = limit
+
+    # Initialize suggestion engine
+    engine = SuggestionEngine(state, config)
+
+    # Generate suggestions
+    project_root = Path(state.project_root) if state.project_root else session_dir.parent
+    depth_literal: Literal["shallow", "medium", "deep"] | None = None
+    if depth in ("shallow", "medium", "deep"):
+        depth_literal = depth  # type: ignore
+
+    suggestions = engine.generate_suggestions(
+        project_root=project_root,
+        depth=depth_literal
+    )
+
+    if not suggestions:
+        typer.echo("No suggestions generated.")
+        return
 
-        approved_suggestions = []
+    # Display suggestions
+    typer.echo(f"\n🔍 Found {len(suggestions)} suggestion(s)\n")
 
-        if dry_run:
-            # Just display suggestions in dry-run mode
-            for i, suggestion in enumerate(suggestions, 1):
-                _display_suggestion(i, len(suggestions), suggestion)
-            return
+    approved_suggestions = []
 
-        if auto_approve:
-            # Auto-approve all suggestions
-            approved_suggestions = suggestions
-        else:
-            # Interactive approval
-            for i, suggestion in enumerate(suggestions, 1):
-                _display_suggestion(i, len(suggestions), suggestion)
+    if dry_run:
+        # Just display suggestions in dry-run mode
+        for i, suggestion in enumerate(suggestions, 1):
+            _display_suggestion(i, len(suggestions), suggestion)
+        return
 
-                if typer.confirm("Add this task?"):
-                    approved_suggestions.append(suggestion)
+    if auto_approve:
+        # Auto-approve all suggestions
+        approved_suggestions = suggestions
+    else:
+        # Interactive approval
+        for i, suggestion in enumerate(suggestions, 1):
+            _display_suggestion(i, len(suggestions), suggestion)
 
-        if not approved_suggestions:
-            typer.echo("\nNo tasks added.")
-            return
+            if typer.confirm("Add this task?"):
+                approved_suggestions.append(suggestion)
 
-        # Generate update payload with AddTaskInput objects
-        from .core.update_payload import AddTaskInput
-
-        add_tasks = []
-        for suggestion in approved_suggestions:
-            # Combine rationale and implementation notes into implementation_notes
-            full_notes = f"{suggestion.rationale}\n\nImplementation notes:\n{suggestion.implementation_notes}"
-            if suggestion.affected_files:
-                full_notes += "\n\nAffected files:\n" + "\n".join(f"- {f}" for f in suggestion.affected_files)
-
-            add_task = AddTaskInput(
-                title=suggestion.title,
-                type=suggestion.type,
-                depends_on=suggestion.depends_on,
-                implementation_notes=full_notes
-            )
-            add_tasks.append(add_task)
+    if not approved_suggestions:
+        typer.echo("\nNo tasks added.")
+        return
 
-        # Apply update
-        payload = UpdatePayload(
-            session=state.session,
-            add_tasks=add_tasks
+    # Generate update payload with AddTaskInput objects
+    from .core.update_payload import AddTaskInput
+
+    add_tasks = []
+    for suggestion in approved_suggestions:
+        # Combine rationale and implementation notes into implementation_notes
+        full_notes = f"{suggestion.rationale}\n\nImplementation notes:\n{suggestion.implementation_notes}"
+        if suggestion.affected_files:
+            full_notes += "\n\nAffected files:\n" + "\n".join(f"- {f}" for f in suggestion.affected_files)
+
+        add_task = AddTaskInput(
+            title=suggestion.title,
+            type=suggestion.type,
+            depends_on=suggestion.depends_on,
+            implementation_notes=full_notes
         )
+        add_tasks.append(add_task)
 
-        with acquire_lock(session_dir, operation="suggest"):
-            state = apply_update(state, payload)
-            save_session_state(session_dir, state)
+    # Apply update
+    payload = UpdatePayload(
+        session=state.session,
+        add_tasks=add_tasks
+    )
 
-        typer.echo(f"\n✓ Added {len(approved_suggestions)} task(s) to plan")
-        log_session_event(session_dir, f"Suggest command: added {len(approved_suggestions)} tasks")
+    with acquire_lock(session_dir, operation="suggest"):
+        state = apply_update(state, payload)
+        save_session_state(session_dir, state)
 
-    except PlanloopError as exc:
-        typer.echo(f"Error: {exc}", err=True)
-        raise typer.Exit(code=1) from exc
-    except Exception as exc:
-        typer.echo(f"Unexpected error: {exc}", err=True)
-        raise typer.Exit(code=1) from exc
+    typer.echo(f"\n✓ Added {len(approved_suggestions)} task(s) to plan")
+    log_session_event(session_dir, f"Suggest command: added {len(approved_suggestions)} tasks")
 
 
 def _display_suggestion(index: int, total: int, suggestion: TaskSuggestion) -> None:
@@ -837,10 +874,18 @@ def _display_suggestion(index: int, total: int, suggestion: TaskSuggestion) -> N
 
 
 @app.command()
-def selftest(json_output: bool = typer.Option(True, "--json/--no-json", help="JSON output")) -> None:
+def selftest(
+    json_output: bool = typer.Option(True, "--json/--no-json", help="JSON output"),
+    scenario: list[str] | None = typer.Option(
+        None, "--scenario", help="Run only this scenario (repeatable)"
+    ),
+) -> None:
     """Run planloop's self-test harness."""
     try:
-        results = selftest_module.run_selftest()
+        results = selftest_module.run_selftest(scenario)
+    except ValueError as exc:
+        typer.echo(f"Error: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
     except selftest_module.SelfTestFailure as exc:
         payload = {
             "status": "failed",
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from pathlib import Path
 from typing import Any, Literal
 
 import yaml
@@ -9,14 +10,20 @@ from pydantic import BaseModel
 
 from .home import CONFIG_FILE_NAME, initialize_home
 
+# libyaml-backed safe loader/dumper when PyYAML was built with it
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
-@lru_cache(maxsize=1)
-def load_config() -> dict[str, Any]:
-    home = initialize_home()
-    path = home / CONFIG_FILE_NAME
+
+def _read_config(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {}
-    return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    return yaml.load(path.read_text(encoding="utf-8"), Loader=_SafeLoader) or {}
+
+
+@lru_cache(maxsize=1)
+def load_config() -> dict[str, Any]:
+    return _read_config(initialize_home() / CONFIG_FILE_NAME)
 
 
 def history_enabled() -> bool:
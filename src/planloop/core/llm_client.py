@@ -1,27 +1,39 @@
 """LLM client abstraction for multiple providers."""
 from __future__ import annotations
 
+import importlib
 import json
 import os
 from typing import Any, Literal
 
 from pydantic import BaseModel
 
-# Optional imports for LLM providers
-try:
-    from anthropic import Anthropic
-except ImportError:
-    Anthropic = None
-
-try:
-    from openai import OpenAI
-except ImportError:
-    OpenAI = None
-
-try:
-    import requests  # type: ignore[import-untyped]
-except ImportError:
-    requests = None
+# Optional provider SDKs, imported on first use so importing this module
+# (and everything that imports suggest) doesn't pay for them. Each name is
+# None once resolved if the package isn't installed.
+_UNRESOLVED: Any = object()
+_PROVIDER_IMPORTS = {
+    "Anthropic": ("anthropic", "Anthropic"),
+    "OpenAI": ("openai", "OpenAI"),
+    "requests": ("requests", None),
+}
+Anthropic: Any = _UNRESOLVED
+OpenAI: Any = _UNRESOLVED
+requests: Any = _UNRESOLVED
+
+
+def _provider_sdk(name: str) -> Any:
+    """Return an optional provider SDK object, importing it on first use."""
+    value = globals()[name]
+    if value is _UNRESOLVED:
+        module_name, attr = _PROVIDER_IMPORTS[name]
+        try:
+            module = importlib.import_module(module_name)
+            value = getattr(module, attr) if attr else module
+        except ImportError:
+            value = None
+        globals()[name] = value
+    return value
 
 
 class LLMError(Exception):
@@ -61,8 +73,14 @@ class LLMClient:
                 raise LLMError(f"API key required for {config.provider}")
             self.config = config.model_copy(update={"api_key": api_key})
 
-        # Initialize provider-specific client
-        self._initialize_client()
+        # Provider client is created on first generate() call
+
+    @property
+    def client(self) -> Any:
+        """Provider-specific client, initialized on first use."""
+        if self._client is None:
+            self._initialize_client()
+        return self._client
 
     def _get_api_key_from_env(self, provider: str) -> str | None:
         """Get API key from environment variable."""
@@ -75,28 +93,31 @@ class LLMClient:
     def _initialize_client(self) -> None:
         """Initialize provider-specific client."""
         if self.config.provider == "openai":
-            if OpenAI is None:
+            openai_cls = _provider_sdk("OpenAI")
+            if openai_cls is None:
                 raise LLMError("openai package not installed. Run: pip install openai")
 
             kwargs = {"api_key": self.config.api_key}
             if self.config.base_url:
                 kwargs["base_url"] = self.config.base_url
-            self._client = OpenAI(**kwargs)
+            self._client = openai_cls(**kwargs)
 
         elif self.config.provider == "anthropic":
-            if Anthropic is None:
+            anthropic_cls = _provider_sdk("Anthropic")
+            if anthropic_cls is None:
                 raise LLMError("anthropic package not installed. Run: pip install anthropic")
 
             kwargs = {"api_key": self.config.api_key}
             if self.config.base_url:
                 kwargs["base_url"] = self.config.base_url
-            self._client = Anthropic(**kwargs)
+            self._client = anthropic_cls(**kwargs)
 
         elif self.config.provider == "ollama":
             # Ollama uses REST API via requests module
-            if requests is None:
+            requests_module = _provider_sdk("requests")
+            if requests_module is None:
                 raise LLMError("requests package not installed. Run: pip install requests")
-            self._client = requests
+            self._client = requests_module
 
     def generate(self, prompt: str, schema: dict | None = None) -> str:
         """Generate text from prompt.
@@ -158,7 +179,7 @@ class LLMClient:
         if schema:
             kwargs["response_format"] = {"type": "json_object"}
 
-        response = self._client.chat.completions.create(**kwargs)
+        response = self.client.chat.completions.create(**kwargs)
         content = response.choices[0].message.content
         if content is None:
             raise LLMError("OpenAI returned empty content")
@@ -178,7 +199,7 @@ class LLMClient:
             prompt_with_schema = f"{prompt}\n\nRespond with valid JSON matching this schema:\n{json.dumps(schema)}"
             kwargs["messages"] = [{"role": "user", "content": prompt_with_schema}]
 
-        response = self._client.messages.create(**kwargs)
+        response = self.client.messages.create(**kwargs)
         text = response.content[0].text
         return str(text)
 
@@ -200,7 +221,7 @@ class LLMClient:
             # Ollama supports JSON mode via format parameter
             payload["format"] = "json"
 
-        response = self._client.post(f"{base_url}/api/generate", json=payload)
+        response = self.client.post(f"{base_url}/api/generate", json=payload)
 
         if response.status_code != 200:
             raise LLMError(f"Ollama API error: {response.status_code} {response.text}")
@@ -135,8 +135,11 @@ def _load_raw_queue_entries(session_dir: Path) -> list[QueueEntry]:
     return sorted(entries, key=lambda entry: entry.requested_at)
 
 
-def _prune_stale_entries(session_dir: Path, entries: list[QueueEntry], max_age: float) -> list[QueueEntry]:
-    now = time.time()
+def _prune_stale_entries(
+    session_dir: Path, entries: list[QueueEntry], max_age: float, now: float | None = None
+) -> list[QueueEntry]:
+    if now is None:
+        now = time.time()
     keep: list[QueueEntry] = []
     for entry in entries:
         if now - entry.requested_at > max_age:
@@ -146,13 +149,18 @@ def _prune_stale_entries(session_dir: Path, entries: list[QueueEntry], max_age:
     return keep
 
 
-def _load_queue_entries(session_dir: Path, max_age: float) -> list[QueueEntry]:
+def _load_queue_entries(session_dir: Path, max_age: float, now: float | None = None) -> list[QueueEntry]:
     entries = _load_raw_queue_entries(session_dir)
-    return _prune_stale_entries(session_dir, entries, max_age)
+    return _prune_stale_entries(session_dir, entries, max_age, now)
 
 
-def get_lock_queue_status(session_dir: Path, agent: str | None = None, max_age: float = DEFAULT_TIMEOUT) -> LockQueueStatus:
-    entries = _load_queue_entries(session_dir, max_age)
+def get_lock_queue_status(
+    session_dir: Path,
+    agent: str | None = None,
+    max_age: float = DEFAULT_TIMEOUT,
+    now: float | None = None,
+) -> LockQueueStatus:
+    entries = _load_queue_entries(session_dir, max_age, now)
     position: int | None = None
     if agent:
         for idx, entry in enumerate(entries):
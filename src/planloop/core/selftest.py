@@ -8,6 +8,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from ..home import PLANLOOP_HOME_ENV, SESSIONS_DIR, initialize_home
+from ..logging_utils import close_session_log
 from .session import create_session, load_session_state_from_disk, save_session_state
 from .signals import close_signal, open_signal
 from .state import (
@@ -48,21 +49,36 @@ class SelfTestFailure(RuntimeError):
         self.results = list(results)
 
 
-def run_selftest() -> list[ScenarioResult]:
-    """Execute all scenarios inside a temporary PLANLOOP_HOME."""
+def _select_scenarios(only: Iterable[str] | None) -> list[tuple[str, Callable[[Path], str]]]:
+    if not only:
+        return list(_SCENARIOS)
+    wanted = set(only)
+    unknown = wanted.difference(name for name, _ in _SCENARIOS)
+    if unknown:
+        known = ", ".join(name for name, _ in _SCENARIOS)
+        raise ValueError(f"Unknown scenario(s): {', '.join(sorted(unknown))} (choose from {known})")
+    return [(name, scenario) for name, scenario in _SCENARIOS if name in wanted]
 
+
+def run_selftest(only: Iterable[str] | None = None) -> list[ScenarioResult]:
+    """Execute all scenarios, or just those named in ``only``, inside a temporary PLANLOOP_HOME."""
+
+    scenarios = _select_scenarios(only)
     original_home = os.environ.get(PLANLOOP_HOME_ENV)
     results: list[ScenarioResult] = []
     with tempfile.TemporaryDirectory(prefix="planloop-selftest-") as tmp_home:
         os.environ[PLANLOOP_HOME_ENV] = tmp_home
         home_path = initialize_home()
-        for name, scenario in _SCENARIOS:
+        for name, scenario in scenarios:
             try:
                 detail = scenario(home_path)
             except Exception as exc:  # pragma: no cover - surfaced via CLI tests
                 results.append(ScenarioResult(name=name, passed=False, detail=str(exc)))
             else:
                 results.append(ScenarioResult(name=name, passed=True, detail=detail))
+        # The temporary home is about to go away; release its sessions' log handlers
+        for session_dir in (home_path / SESSIONS_DIR).iterdir():
+            close_session_log(session_dir)
         if original_home is None:
             os.environ.pop(PLANLOOP_HOME_ENV, None)
         else:
@@ -1,6 +1,7 @@
 """Session creation and ID helpers."""
 from __future__ import annotations
 
+import json
 import secrets
 from datetime import datetime
 from pathlib import Path
@@ -18,6 +19,8 @@ from .registry import SessionSummary, upsert_session
 from .render import render_plan
 from .state import Environment, Now, NowReason, PromptMetadata, SessionState
 
+SUMMARY_FILE = "summary.json"
+
 
 def _slugify(text: str) -> str:
     cleaned = "-".join(
@@ -89,11 +92,23 @@ def create_session(name: str, title: str, project_root: Path) -> SessionState:
     return state
 
 
+def summarize_state(state: SessionState) -> dict:
+    """Return the small listing view of a session (id, description, counts)."""
+    return {
+        "id": state.session,
+        "description": state.title or state.purpose,
+        "task_count": len(state.tasks),
+        "signal_count": len(state.signals),
+    }
+
+
 def write_session_files(session_dir: Path, state: SessionState) -> None:
     state_path = session_dir / "state.json"
     plan_path = session_dir / "PLAN.md"
     state_path.write_text(state.model_dump_json(indent=2), encoding="utf-8")
     plan_path.write_text(render_plan(state), encoding="utf-8")
+    # Written after state.json so its mtime marks it as current
+    (session_dir / SUMMARY_FILE).write_text(json.dumps(summarize_state(state)), encoding="utf-8")
 
 
 def save_session_state(session_dir: Path, state: SessionState, message: str = "Update session") -> None:
@@ -107,7 +122,7 @@ def load_session_state_from_disk(session_dir: Path) -> SessionState:
     state_path = session_dir / "state.json"
     if not state_path.exists():  # pragma: no cover - guard
         raise FileNotFoundError(f"Missing state.json in {session_dir}")
-    return SessionState.model_validate_json(state_path.read_text(encoding="utf-8"))
+    return SessionState.model_validate_json(state_path.read_bytes())
 
 
 def update_registry_from_state(state: SessionState) -> None:
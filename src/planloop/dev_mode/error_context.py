@@ -6,17 +6,35 @@ when errors occur: local variables, stack trace, state snapshot, and trace_id.
 from __future__ import annotations
 
 import functools
-import json
-import traceback
 from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, TypeVar
+from typing import Any, TextIO, TypeVar
 
 from .observability import get_current_trace_id
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Fixed error report schema, in output order
+_ERROR_REPORT_KEYS = (
+    "timestamp",
+    "trace_id",
+    "error_type",
+    "error_message",
+    "function",
+    "local_variables",
+    "stack_trace",
+    "state_snapshot_path",
+    "llm_transcript_link",
+)
+# Pre-encoded '  "key": ' prefixes so keys are never re-escaped per report
+_ERROR_REPORT_PREFIXES = tuple(
+    ("{\n" if i == 0 else ",\n") + f'  "{key}": ' for i, key in enumerate(_ERROR_REPORT_KEYS)
+)
+
+# state.json path -> (mtime_ns, size, snapshot file) of its latest snapshot
+_SNAPSHOT_CACHE: dict[Path, tuple[int, int, Path]] = {}
+
 
 def capture_error_context(session_dir: Path | None) -> Callable[[F], F]:
     """Decorator that captures full context on error.
@@ -46,12 +64,15 @@ def capture_error_context(session_dir: Path | None) -> Callable[[F], F]:
             try:
                 return func(*args, **kwargs)
             except Exception as e:
+                # Error-path only imports; keep them off module import time
+                import sys
+                import traceback
+
                 # Capture context
                 trace_id = get_current_trace_id()
                 timestamp = datetime.now(UTC).isoformat()
 
                 # Get local variables from the frame where error occurred
-                import sys
                 frame = sys.exc_info()[2]
                 if frame is not None:
                     tb_frame = frame.tb_frame
@@ -99,13 +120,13 @@ def capture_error_context(session_dir: Path | None) -> Callable[[F], F]:
 
                     # Save error report
                     error_file = error_dir / f"{trace_id}_error.json"
-                    error_file.write_text(json.dumps(error_report, indent=2))
+                    with open(error_file, "w") as fh:
+                        _emit_error_report(fh, error_report)
 
                     # Save state snapshot if it exists
                     if state_snapshot_path:
                         snapshot_file = error_dir / f"{trace_id}_state.json"
-                        state_content = Path(state_snapshot_path).read_text()
-                        snapshot_file.write_text(state_content)
+                        _save_state_snapshot(Path(state_snapshot_path), snapshot_file)
 
                 # Attach context to exception for programmatic access
                 e.__error_context__ = error_report  # type: ignore[attr-defined]
@@ -117,6 +138,66 @@ def capture_error_context(session_dir: Path | None) -> Callable[[F], F]:
     return decorator
 
 
+def _emit_error_report(fh: TextIO, report: dict[str, Any]) -> None:
+    """Stream an error report as indented JSON using the fixed key schema.
+
+    Output is identical to ``json.dumps(report, indent=2)`` but only the
+    values go through the encoder; keys are written from pre-encoded
+    literals and nothing is joined into one intermediate string.
+
+    Args:
+        fh: Text file handle to write to
+        report: Error report with exactly the _ERROR_REPORT_KEYS keys
+    """
+    import json
+
+    for prefix, key in zip(_ERROR_REPORT_PREFIXES, _ERROR_REPORT_KEYS, strict=True):
+        fh.write(prefix)
+        value = report[key]
+        if isinstance(value, (list, dict)) and value:
+            # Nested containers shift one level right of the top-level keys
+            fh.write(json.dumps(value, indent=2).replace("\n", "\n  "))
+        else:
+            fh.write(json.dumps(value))
+    fh.write("\n}")
+
+
+def _save_state_snapshot(state_path: Path, snapshot_file: Path) -> None:
+    """Snapshot state.json, linking to the previous snapshot if unchanged.
+
+    Errors tend to cluster (retry storms), so consecutive reports often see
+    the same state.json. When its mtime and size match the last snapshot we
+    took, symlink to that snapshot instead of copying the file again.
+
+    Args:
+        state_path: Path to the session's state.json
+        snapshot_file: Destination for this error's snapshot
+    """
+    import os
+    import shutil
+
+    stat = state_path.stat()
+    cached = _SNAPSHOT_CACHE.get(state_path)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        prior = cached[2]
+        if prior == snapshot_file:
+            return
+        if prior.exists() and prior.parent == snapshot_file.parent:
+            try:
+                if snapshot_file.is_symlink() or snapshot_file.exists():
+                    snapshot_file.unlink()
+                os.symlink(prior.name, snapshot_file)
+                return
+            except OSError:
+                pass  # Symlinks unsupported; fall back to copying
+
+    # Never write through a stale symlink into an older snapshot
+    if snapshot_file.is_symlink():
+        snapshot_file.unlink()
+    shutil.copyfile(state_path, snapshot_file)
+    _SNAPSHOT_CACHE[state_path] = (stat.st_mtime_ns, stat.st_size, snapshot_file)
+
+
 def _sanitize_value(value: Any) -> str:
     """Remove sensitive data from logged values.
 
@@ -1,12 +1,114 @@
 """Lock operation logging for observability."""
 from __future__ import annotations
 
+import atexit
 import json
+import os
+import queue
+import threading
+from collections import OrderedDict
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 from .observability import get_current_trace_id
 
+LOG_FILENAME = "planloop.jsonl"
+MAX_BATCH = 64
+
+# O_APPEND descriptors for recently used log files. O_APPEND makes each
+# os.write() land atomically at end-of-file, so lines from concurrent writers
+# (threads or other processes) don't interleave. The cache is an LRU capped at
+# MAX_OPEN_LOG_FDS so long-running processes that touch many sessions don't
+# accumulate descriptors; evicted files are simply reopened on the next write.
+MAX_OPEN_LOG_FDS = 32
+_LOG_FDS: OrderedDict[Path, int] = OrderedDict()
+_LOG_FDS_LOCK = threading.Lock()
+
+
+def _get_log_fd(session_dir: Path) -> int:
+    log_file = session_dir / "logs" / LOG_FILENAME
+    with _LOG_FDS_LOCK:
+        fd = _LOG_FDS.get(log_file)
+        if fd is not None:
+            _LOG_FDS.move_to_end(log_file)
+            return fd
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        _LOG_FDS[log_file] = fd
+        while len(_LOG_FDS) > MAX_OPEN_LOG_FDS:
+            _, evicted = _LOG_FDS.popitem(last=False)
+            _close_fd(evicted)
+    return fd
+
+
+def _close_fd(fd: int) -> None:
+    try:
+        os.close(fd)
+    except OSError:
+        pass
+
+
+# Events are serialized and written by a daemon thread so lock callers
+# only pay for a queue put. flush_lock_events() waits for the backlog; it
+# runs at exit, and readers in the same process (tests) call it explicitly.
+_EVENT_QUEUE: queue.Queue[tuple[Path, dict[str, Any]]] = queue.Queue()
+_WORKER: threading.Thread | None = None
+_WORKER_LOCK = threading.Lock()
+
+
+def _write_batch(batch: list[tuple[Path, dict[str, Any]]]) -> None:
+    grouped: dict[Path, list[str]] = {}
+    for session_dir, log_entry in batch:
+        grouped.setdefault(session_dir, []).append(json.dumps(log_entry) + "\n")
+    for session_dir, lines in grouped.items():
+        try:
+            os.write(_get_log_fd(session_dir), "".join(lines).encode("utf-8"))
+        except OSError:
+            pass  # Observability must never take down the caller
+
+
+def _drain_events() -> None:
+    while True:
+        batch = [_EVENT_QUEUE.get()]
+        while len(batch) < MAX_BATCH:
+            try:
+                batch.append(_EVENT_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            _write_batch(batch)
+        finally:
+            for _ in batch:
+                _EVENT_QUEUE.task_done()
+
+
+def _ensure_worker() -> None:
+    global _WORKER
+    if _WORKER is not None and _WORKER.is_alive():
+        return
+    with _WORKER_LOCK:
+        if _WORKER is None or not _WORKER.is_alive():
+            _WORKER = threading.Thread(target=_drain_events, name="planloop-lock-logger", daemon=True)
+            _WORKER.start()
+
+
+def flush_lock_events() -> None:
+    """Block until every queued lock event has been written."""
+    if _WORKER is not None:
+        _EVENT_QUEUE.join()
+
+
+def _close_log_fds() -> None:
+    flush_lock_events()
+    with _LOG_FDS_LOCK:
+        for fd in _LOG_FDS.values():
+            _close_fd(fd)
+        _LOG_FDS.clear()
+
+
+atexit.register(_close_log_fds)
+
 
 def log_lock_event(
     session_dir: Path,
@@ -16,7 +118,10 @@ def log_lock_event(
     wait_ms: float | None = None,
     hold_ms: float | None = None,
 ) -> None:
-    """Log a lock-related event to planloop.jsonl.
+    """Queue a lock-related event for planloop.jsonl.
+
+    The entry is written asynchronously; call flush_lock_events() before
+    reading the log back.
 
     Args:
         session_dir: Path to session directory
@@ -26,8 +131,6 @@ def log_lock_event(
         wait_ms: Wait time in milliseconds (for acquired events)
         hold_ms: Hold time in milliseconds (for released events)
     """
-    from typing import Any
-
     trace_id = get_current_trace_id()
     timestamp = datetime.now(UTC).isoformat()
 
@@ -45,13 +148,8 @@ def log_lock_event(
     if hold_ms is not None:
         log_entry["hold_ms"] = hold_ms
 
-    # Write to planloop.jsonl
-    log_dir = session_dir / "logs"
-    log_dir.mkdir(parents=True, exist_ok=True)
-    log_file = log_dir / "planloop.jsonl"
-
-    with open(log_file, "a") as f:
-        f.write(json.dumps(log_entry) + "\n")
+    _ensure_worker()
+    _EVENT_QUEUE.put((session_dir, log_entry))
 
 
-__all__ = ["log_lock_event"]
+__all__ = ["flush_lock_events", "log_lock_event"]
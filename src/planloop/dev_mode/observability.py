@@ -7,7 +7,6 @@ trace_id that links errors, logs, LLM calls, state diffs, and performance data.
 from __future__ import annotations
 
 import contextvars
-import secrets
 from datetime import UTC, datetime
 
 # Thread-local trace context
@@ -23,6 +22,8 @@ def generate_trace_id() -> str:
     Returns:
         Unique trace ID string
     """
+    import secrets
+
     timestamp = datetime.now(UTC).strftime("%Y%m%d%H%M%S")
     random = secrets.token_hex(3)  # 6 hex characters
     return f"tr_{timestamp}_{random}"
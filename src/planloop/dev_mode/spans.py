@@ -9,7 +9,7 @@ import json
 import time
 from collections.abc import Generator
 from contextlib import contextmanager
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
@@ -43,20 +43,22 @@ def trace_span(
         None
     """
     trace_id = get_current_trace_id()
-    start_time = time.time()
-    start_iso = datetime.now(UTC).isoformat()
+    start_wall = datetime.now(UTC)
+    start_ns = time.perf_counter_ns()
 
     try:
         yield
     finally:
-        end_time = time.time()
-        end_iso = datetime.now(UTC).isoformat()
-        duration_ms = (end_time - start_time) * 1000
+        duration_ns = time.perf_counter_ns() - start_ns
+        duration_ms = duration_ns / 1_000_000
+        # Derive the end timestamp from the monotonic duration so it can't
+        # drift from duration_ms if the wall clock jumps mid-span.
+        end_wall = start_wall + timedelta(microseconds=duration_ns // 1000)
 
         span_data = {
             "name": name,
-            "start_time": start_iso,
-            "end_time": end_iso,
+            "start_time": start_wall.isoformat(),
+            "end_time": end_wall.isoformat(),
             "duration_ms": duration_ms,
             "metadata": metadata,
         }
@@ -7,7 +7,7 @@ Based on production observability patterns using RED and USE metrics.
 """
 
 import os
-import subprocess
+from bisect import bisect_left
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -44,6 +44,14 @@ class BashHealthMonitor:
     # Error recency window (minutes)
     ERROR_RECENCY_MINUTES = 5
     
+    # Penalty tables indexed by how many thresholds a metric exceeds
+    _COMMAND_THRESHOLDS = (COMMAND_COUNT_MEDIUM, COMMAND_COUNT_HIGH, COMMAND_COUNT_CRITICAL)
+    _COMMAND_PENALTIES = (0, 10, 20, 30)
+    _PTY_THRESHOLDS = (PTY_COUNT_MEDIUM, PTY_COUNT_HIGH, PTY_COUNT_CRITICAL)
+    _PTY_PENALTIES = (0, 15, 25, 40)  # HIGHEST IMPACT
+    _AGE_THRESHOLDS = (AGE_WARNING_MINUTES, AGE_CRITICAL_MINUTES)
+    _AGE_PENALTIES = (0, 10, 20)
+    
     def calculate_health_score(self, metrics: dict) -> int:
         """Calculate 0-100 health score for bash session.
         
@@ -57,38 +65,20 @@ class BashHealthMonitor:
         Returns:
             Health score (0-100)
         """
-        score = 100
-        
         command_count = metrics.get("command_count", 0)
         pty_count = metrics.get("pty_count", 0)
         age_minutes = metrics.get("age_minutes", 0)
         last_error = metrics.get("last_error")
         
-        # Command count penalty (0-30 points)
-        if command_count > self.COMMAND_COUNT_CRITICAL:
-            score -= 30  # Critical
-        elif command_count > self.COMMAND_COUNT_HIGH:
-            score -= 20  # High
-        elif command_count > self.COMMAND_COUNT_MEDIUM:
-            score -= 10  # Medium
-        
-        # PTY count penalty (0-40 points) - HIGHEST IMPACT
-        if pty_count > self.PTY_COUNT_CRITICAL:
-            score -= 40  # Critical
-        elif pty_count > self.PTY_COUNT_HIGH:
-            score -= 25  # High
-        elif pty_count > self.PTY_COUNT_MEDIUM:
-            score -= 15  # Medium
-        
-        # Age penalty (0-20 points)
-        if age_minutes > self.AGE_CRITICAL_MINUTES:
-            score -= 20  # Old session
-        elif age_minutes > self.AGE_WARNING_MINUTES:
-            score -= 10  # Aging
-        
-        # Recent error penalty (0-10 points)
-        if last_error and self._is_recent_error(last_error):
-            score -= 10  # Critical - already failing
+        # bisect_left counts thresholds strictly below the value, matching
+        # the "exceeds threshold" semantics without per-tier branches.
+        score = (
+            100
+            - self._COMMAND_PENALTIES[bisect_left(self._COMMAND_THRESHOLDS, command_count)]
+            - self._PTY_PENALTIES[bisect_left(self._PTY_THRESHOLDS, pty_count)]
+            - self._AGE_PENALTIES[bisect_left(self._AGE_THRESHOLDS, age_minutes)]
+            - (10 if last_error and self._is_recent_error(last_error) else 0)
+        )
         
         return max(0, score)
     
@@ -133,6 +123,8 @@ class BashHealthMonitor:
         Returns:
             Number of PTYs, or 0 if lsof not available
         """
+        import subprocess
+        
         try:
             result = subprocess.run(
                 ["lsof", "-p", str(pid)],
@@ -3,55 +3,253 @@
 Analyzes agent-transcript.jsonl files to detect PTY failure patterns,
 calculate session statistics, and generate recommendations.
 """
+from __future__ import annotations
 
-import json
+import io
+import mmap
+import os
+import re
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from ..json_utils import dumps, loads
+
+# Event keys analyze_session reads; everything else is dropped at parse time
+ANALYZED_FIELDS = frozenset(
+    {"event", "timestamp", "error", "cmd_number", "pty_count", "command"}
+)
+
+# Transcripts up to this size are read in one call instead of per line
+BULK_READ_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _decode_lines(
+    lines: Iterable[bytes], fields: AbstractSet[str] | None
+) -> Iterator[dict]:
+    """Decode raw JSONL lines, skipping undecodable ones and projecting fields."""
+    for line in lines:
+        # Both backends accept bytes and ignore surrounding
+        # whitespace; blank lines fail to decode and are skipped
+        try:
+            event = loads(line)
+        except ValueError:
+            continue
+        if fields is not None and isinstance(event, dict):
+            event = {k: event[k] for k in fields if k in event}
+        yield event
+
+
+def _parse_ts(ts_str: Any) -> datetime | None:
+    """Parse an ISO-8601 event timestamp, or None if missing/invalid.
+
+    Python 3.11+ fromisoformat accepts a trailing 'Z' directly.
+    """
+    if not ts_str:
+        return None
+    try:
+        return datetime.fromisoformat(ts_str)
+    except (ValueError, TypeError):
+        return None
+
+
+# Byte-level superset of _is_pty_failure applied to "error" string values, used
+# to pre-screen whole files. Only error payloads count: other keys (pty_count)
+# and words like "empty" elsewhere in an event must not trigger a full check.
+_FAILURE_MARKER_RE = re.compile(
+    rb'"error"\s*:\s*"(?:[^"\\]|\\.)*?(?:posix_spawnp|(?i:pty))'
+)
+
+
+def _is_pty_failure(error: str) -> bool:
+    """Return True if a command error indicates PTY exhaustion."""
+    return "posix_spawnp" in error or "pty" in error.lower()
+
+
+def _has_two(text: str, sub: str) -> bool:
+    """Return True if sub occurs at least twice in text (non-overlapping)."""
+    first = text.find(sub)
+    return first != -1 and text.find(sub, first + len(sub)) != -1
+
+
+@dataclass
+class CommandScan:
+    """Fields the analyzers need, gathered in one pass over the commands.
+    
+    Hot per-command fields are stored as parallel columns rather than read
+    back out of the event dicts, so each analyzer reduces to a few index
+    operations on the columns it needs.
+    """
+    
+    total: int = 0
+    first_timestamp: Any = None
+    last_timestamp: Any = None
+    timestamps: list[datetime] = field(default_factory=list)
+    # Index into the command list of each parsed timestamp (ascending),
+    # packed as machine ints parallel to timestamps
+    timestamp_positions: array[int] = field(default_factory=lambda: array("q"))
+    pty_counts: list[Any] = field(default_factory=list)
+    first_failure: dict | None = None
+    complex_command_chains: bool = False
+    subprocess_spawning: bool = False
+
 
 class TranscriptAnalyzer:
     """Analyze agent transcripts for PTY issues."""
     
-    def parse_transcript(self, transcript_path: str) -> list[dict]:
+    def parse_transcript(
+        self, transcript_path: str, fields: AbstractSet[str] | None = None
+    ) -> list[dict]:
         """Parse JSONL transcript file into list of events.
         
         Args:
             transcript_path: Path to agent-transcript.jsonl file
+            fields: If given, keep only these keys of each event
         
         Returns:
             List of event dictionaries
         """
-        events = []
-        
-        with open(transcript_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        event = json.loads(line)
-                        events.append(event)
-                    except json.JSONDecodeError:
-                        continue
-        
-        return events
+        return list(self._read_events(transcript_path, fields))
+    
+    def _read_events(
+        self, transcript_path: str, fields: AbstractSet[str] | None = None
+    ) -> Iterator[dict]:
+        """Iterate over events, reading files up to BULK_READ_MAX_BYTES in one call.
+
+        Larger files (or ones that can't be stat'ed) go through iter_events,
+        so memory stays bounded by one line plus the events the caller keeps.
+
+        Args:
+            transcript_path: Path to agent-transcript.jsonl file
+            fields: If given, keep only these keys of each event
+
+        Returns:
+            Iterator of event dictionaries
+        """
+        try:
+            small = os.path.getsize(transcript_path) <= BULK_READ_MAX_BYTES
+        except OSError:
+            small = False  # let the streaming reader surface the error
+        if not small:
+            return self.iter_events(transcript_path, fields)
+        with open(transcript_path, 'rb') as f:
+            data = f.read()
+        # Split on b"\n" only, matching the line iterator used for large files
+        return _decode_lines(data.split(b"\n"), fields)
+
+    def iter_events(
+        self, transcript_path: str, fields: AbstractSet[str] | None = None
+    ) -> Iterator[dict]:
+        """Lazily yield events from a JSONL transcript file.
+        
+        Lines are read as raw bytes and decoded one at a time, so callers
+        that filter events never hold the whole transcript in memory.
+        
+        Args:
+            transcript_path: Path to agent-transcript.jsonl file
+            fields: If given, keep only these keys of each event
+        
+        Yields:
+            Event dictionaries
+        """
+        with open(transcript_path, 'rb') as f:
+            yield from _decode_lines(f, fields)
     
-    def extract_bash_commands(self, events: list[dict]) -> list[dict]:
+    def extract_bash_commands(self, events: Iterable[dict]) -> list[dict]:
         """Extract only bash command events from transcript.
         
         Args:
-            events: List of all events
+            events: All events (list or lazy iterator)
         
         Returns:
             List of bash command events only
         """
         return [e for e in events if e.get("event") == "bash_command"]
     
-    def calculate_statistics(self, commands: list[dict]) -> dict:
+    def _quick_failure_scan(self, transcript_path: str) -> bool:
+        """Return False only if the transcript cannot contain a PTY failure.
+        
+        Memory-maps the file and searches it once for an ``"error"`` value
+        that _is_pty_failure could match, so healthy sessions can skip
+        per-command error checks entirely.
+        
+        Args:
+            transcript_path: Path to agent-transcript.jsonl file
+        
+        Returns:
+            True if a failure marker may be present (or the file can't be mapped)
+        """
+        try:
+            if os.stat(transcript_path).st_size == 0:
+                return False
+            with open(transcript_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _FAILURE_MARKER_RE.search(mm) is not None
+        except (OSError, ValueError):
+            return True
+    
+    def _scan_commands(self, commands: list[dict], check_failures: bool = True) -> CommandScan:
+        """Walk the commands once, collecting every field the analyzers use.
+        
+        Each timestamp is parsed exactly once here; the analyzers below are
+        pure functions of the resulting scan.
+        
+        Args:
+            commands: List of bash command events
+            check_failures: False to skip error checks (known failure-free)
+        
+        Returns:
+            CommandScan for the command list
+        """
+        scan = CommandScan(total=len(commands))
+        if commands:
+            scan.first_timestamp = commands[0].get("timestamp")
+            scan.last_timestamp = commands[-1].get("timestamp")
+        
+        timestamps = scan.timestamps
+        positions = scan.timestamp_positions
+        pty_counts = scan.pty_counts
+        first_failure = None
+        complex_chains = False
+        spawning = False
+        
+        for i, cmd in enumerate(commands):
+            ts = _parse_ts(cmd.get("timestamp"))
+            if ts is not None:
+                timestamps.append(ts)
+                positions.append(i)
+            
+            pty_count = cmd.get("pty_count")
+            if pty_count is not None:
+                pty_counts.append(pty_count)
+            
+            if check_failures and first_failure is None and (error := cmd.get("error")) and _is_pty_failure(error):
+                first_failure = cmd
+            
+            # Command-string checks stop once both factors are established
+            if not (complex_chains and spawning):
+                command_str = cmd.get("command") or ""
+                if not complex_chains and (_has_two(command_str, "&&") or _has_two(command_str, ";")):
+                    complex_chains = True
+                if not spawning and "source" in command_str and ("&&" in command_str or ";" in command_str):
+                    spawning = True
+        
+        scan.first_failure = first_failure
+        scan.complex_command_chains = complex_chains
+        scan.subprocess_spawning = spawning
+        return scan
+    
+    def calculate_statistics(self, commands: list[dict], scan: CommandScan | None = None) -> dict:
         """Calculate session statistics from commands.
         
         Args:
             commands: List of bash command events
+            scan: Precomputed scan of commands (computed if omitted)
         
         Returns:
             Statistics dictionary
@@ -63,75 +261,59 @@ class TranscriptAnalyzer:
                 "avg_command_interval_seconds": 0
             }
         
-        total = len(commands)
-        
-        # Parse timestamps
-        timestamps = []
-        for cmd in commands:
-            ts_str = cmd.get("timestamp", "")
-            if ts_str:
-                try:
-                    ts = datetime.fromisoformat(ts_str.replace('Z', '+00:00'))
-                    timestamps.append(ts)
-                except (ValueError, AttributeError):
-                    pass
+        if scan is None:
+            scan = self._scan_commands(commands)
+        timestamps = scan.timestamps
         
-        duration_minutes = 0
-        avg_interval = 0
+        duration_minutes = 0.0
+        avg_interval = 0.0
         
         if len(timestamps) >= 2:
-            duration = timestamps[-1] - timestamps[0]
-            duration_minutes = duration.total_seconds() / 60
-            
-            # Calculate average interval
-            intervals = []
-            for i in range(1, len(timestamps)):
-                interval = (timestamps[i] - timestamps[i-1]).total_seconds()
-                intervals.append(interval)
+            duration_seconds = (timestamps[-1] - timestamps[0]).total_seconds()
+            duration_minutes = duration_seconds / 60
             
-            if intervals:
-                avg_interval = sum(intervals) / len(intervals)
+            # Consecutive intervals telescope: their sum is last - first
+            avg_interval = duration_seconds / (len(timestamps) - 1)
         
         return {
-            "total_commands": total,
+            "total_commands": scan.total,
             "duration_minutes": round(duration_minutes, 1),
             "avg_command_interval_seconds": round(avg_interval, 1),
-            "first_command": commands[0].get("timestamp") if commands else None,
-            "last_command": commands[-1].get("timestamp") if commands else None
+            "first_command": scan.first_timestamp,
+            "last_command": scan.last_timestamp
         }
     
-    def detect_failure_pattern(self, commands: list[dict]) -> dict:
+    def detect_failure_pattern(self, commands: list[dict], scan: CommandScan | None = None) -> dict:
         """Detect PTY failure patterns in command sequence.
         
         Args:
             commands: List of bash command events
+            scan: Precomputed scan of commands (computed if omitted)
         
         Returns:
             Failure analysis dictionary
         """
-        failure_detected = False
-        failure_type = None
-        first_failure_cmd = None
-        
-        for cmd in commands:
-            error = cmd.get("error")
-            if error and ("posix_spawnp" in error or "pty" in error.lower()):
-                failure_detected = True
-                failure_type = "pty_exhaustion"
-                first_failure_cmd = cmd.get("cmd_number")
-                break
+        if scan is not None:
+            failing = scan.first_failure
+        else:
+            # Standalone call: stop at the first failure, no full scan
+            failing = next(
+                (c for c in commands if (e := c.get("error")) and _is_pty_failure(e)),
+                None,
+            )
         
         return {
-            "failure_detected": failure_detected,
-            "failure_type": failure_type,
-            "first_failure_command": first_failure_cmd
+            "failure_detected": failing is not None,
+            "failure_type": "pty_exhaustion" if failing is not None else None,
+            "first_failure_command": failing.get("cmd_number") if failing is not None else None
         }
     
-    def analyze_command_frequency(self, commands: list[dict]) -> dict:
+    def analyze_command_frequency(self, commands: list[dict], scan: CommandScan | None = None) -> dict:
         """Analyze command frequency over time.
         
         Args:
             commands: List of bash command events
+            scan: Precomputed scan of commands (computed if omitted)
         
         Returns:
             Frequency analysis with phases and rate changes
@@ -139,50 +321,47 @@ class TranscriptAnalyzer:
         if len(commands) < 10:
             return {"phases": [], "rate_increased": False}
         
+        if scan is None:
+            scan = self._scan_commands(commands)
+        timestamps = scan.timestamps
+        positions = scan.timestamp_positions
+        
         # Divide into phases (first half vs second half)
-        mid = len(commands) // 2
-        first_half = commands[:mid]
-        second_half = commands[mid:]
+        total = len(commands)
+        mid = total // 2
+        split = bisect_left(positions, mid)
         
-        # Calculate rates for each phase
-        def calc_rate(cmds):
-            if len(cmds) < 2:
+        # Calculate rates for each phase from its slice of the timestamps
+        def calc_rate(count: int, lo: int, hi: int) -> float:
+            if count < 2 or hi - lo < 2:
                 return 0
-            timestamps = []
-            for cmd in cmds:
-                ts_str = cmd.get("timestamp", "")
-                if ts_str:
-                    try:
-                        ts = datetime.fromisoformat(ts_str.replace('Z', '+00:00'))
-                        timestamps.append(ts)
-                    except:
-                        pass
-            if len(timestamps) >= 2:
-                duration = (timestamps[-1] - timestamps[0]).total_seconds() / 60
-                return len(cmds) / duration if duration > 0 else 0
-            return 0
-        
-        first_rate = calc_rate(first_half)
-        second_rate = calc_rate(second_half)
+            duration = (timestamps[hi - 1] - timestamps[lo]).total_seconds() / 60
+            return count / duration if duration > 0 else 0
+        
+        first_rate = calc_rate(mid, 0, split)
+        second_rate = calc_rate(total - mid, split, len(timestamps))
         
         return {
             "phases": [
-                {"commands": len(first_half), "rate_per_minute": round(first_rate, 2)},
-                {"commands": len(second_half), "rate_per_minute": round(second_rate, 2)}
+                {"commands": mid, "rate_per_minute": round(first_rate, 2)},
+                {"commands": total - mid, "rate_per_minute": round(second_rate, 2)}
             ],
             "rate_increased": second_rate > first_rate * 1.5  # 50% increase threshold
         }
     
-    def analyze_pty_growth(self, commands: list[dict]) -> dict:
+    def analyze_pty_growth(self, commands: list[dict], scan: CommandScan | None = None) -> dict:
         """Analyze PTY count growth over time.
         
         Args:
             commands: List of bash command events with pty_count
+            scan: Precomputed scan of commands (computed if omitted)
         
         Returns:
             PTY growth analysis
         """
-        pty_counts = [cmd.get("pty_count") for cmd in commands if cmd.get("pty_count") is not None]
+        if scan is None:
+            scan = self._scan_commands(commands)
+        pty_counts = scan.pty_counts
         
         if not pty_counts:
             return {"start_pty_count": 0, "end_pty_count": 0, "growth_rate": 0}
@@ -190,7 +369,7 @@ class TranscriptAnalyzer:
         start = pty_counts[0]
         end = pty_counts[-1]
         growth = end - start
-        growth_rate = growth / len(pty_counts) if len(pty_counts) > 0 else 0
+        growth_rate = growth / len(pty_counts)
         
         return {
             "start_pty_count": start,
@@ -198,30 +377,25 @@ class TranscriptAnalyzer:
             "growth_rate": round(growth_rate, 2)
         }
     
-    def identify_contributing_factors(self, commands: list[dict]) -> dict:
+    def identify_contributing_factors(self, commands: list[dict], scan: CommandScan | None = None) -> dict:
         """Identify factors that contributed to PTY exhaustion.
         
         Args:
             commands: List of bash command events
+            scan: Precomputed scan of commands (computed if omitted)
         
         Returns:
             Dictionary of contributing factors
         """
-        factors = {
-            "complex_command_chains": False,
-            "subprocess_spawning": False,
+        if scan is None:
+            scan = self._scan_commands(commands)
+        
+        return {
+            # Multiple && or ; in a single command
+            "complex_command_chains": scan.complex_command_chains,
+            "subprocess_spawning": scan.subprocess_spawning,
             "no_session_rotation": True  # Assume true if we got this far
         }
-        
-        # Check for complex command chains (multiple && or ;)
-        for cmd in commands:
-            command_str = cmd.get("command", "")
-            if command_str.count("&&") >= 2 or command_str.count(";") >= 2:
-                factors["complex_command_chains"] = True
-            if "source" in command_str and ("&&" in command_str or ";" in command_str):
-                factors["subprocess_spawning"] = True
-        
-        return factors
     
     def generate_report(self, analysis: dict, format: str = "text") -> str:
         """Generate analysis report in specified format.
@@ -234,7 +408,7 @@ class TranscriptAnalyzer:
             Formatted report string
         """
         if format == "json":
-            return json.dumps(analysis, indent=2)
+            return dumps(analysis, indent=True).decode("utf-8")
         
         elif format == "markdown":
             return self._generate_markdown_report(analysis)
@@ -248,27 +422,33 @@ class TranscriptAnalyzer:
         stats = analysis.get("statistics", {})
         failure = analysis.get("failure_analysis", {})
         recs = analysis.get("recommendations", [])
-        
-        report = []
-        report.append(f"Session Analysis: {session_id}")
-        report.append("=" * 60)
-        report.append("")
-        report.append("Summary:")
-        report.append(f"  Total Commands: {stats.get('total_commands', 0)}")
-        report.append(f"  Duration: {stats.get('duration_minutes', 0)} minutes")
-        report.append("")
+        total_commands = stats.get("total_commands", 0)
+        duration_minutes = stats.get("duration_minutes", 0)
+        
+        # Every line ends in "\n"; the final one is dropped on return
+        report = io.StringIO()
+        write = report.write
+        write(
+            f"Session Analysis: {session_id}\n"
+            f"{'=' * 60}\n"
+            "\n"
+            "Summary:\n"
+            f"  Total Commands: {total_commands}\n"
+            f"  Duration: {duration_minutes} minutes\n"
+            "\n"
+        )
         
         if failure.get("failure_detected"):
-            report.append(f"FAILURE DETECTED: {failure.get('failure_type', 'unknown')}")
-            report.append(f"  First failure at command: {failure.get('first_failure_command', 'N/A')}")
-            report.append("")
+            write(f"FAILURE DETECTED: {failure.get('failure_type', 'unknown')}\n")
+            write(f"  First failure at command: {failure.get('first_failure_command', 'N/A')}\n")
+            write("\n")
         
         if recs:
-            report.append("Recommendations:")
+            write("Recommendations:\n")
             for rec in recs:
-                report.append(f"  - {rec}")
+                write(f"  - {rec}\n")
         
-        return "\n".join(report)
+        return report.getvalue()[:-1]
     
     def _generate_markdown_report(self, analysis: dict) -> str:
         """Generate markdown report."""
@@ -276,27 +456,33 @@ class TranscriptAnalyzer:
         stats = analysis.get("statistics", {})
         failure = analysis.get("failure_analysis", {})
         recs = analysis.get("recommendations", [])
-        
-        report = []
-        report.append(f"# Session Analysis: {session_id}")
-        report.append("")
-        report.append("## Summary")
-        report.append(f"- **Total Commands**: {stats.get('total_commands', 0)}")
-        report.append(f"- **Duration**: {stats.get('duration_minutes', 0)} minutes")
-        report.append("")
+        total_commands = stats.get("total_commands", 0)
+        duration_minutes = stats.get("duration_minutes", 0)
+        
+        # Every line ends in "\n"; the final one is dropped on return
+        report = io.StringIO()
+        write = report.write
+        write(
+            f"# Session Analysis: {session_id}\n"
+            "\n"
+            "## Summary\n"
+            f"- **Total Commands**: {total_commands}\n"
+            f"- **Duration**: {duration_minutes} minutes\n"
+            "\n"
+        )
         
         if failure.get("failure_detected"):
-            report.append("## Failure Detected")
-            report.append(f"**Type**: {failure.get('failure_type', 'unknown')}")
-            report.append(f"**First Failure**: Command {failure.get('first_failure_command', 'N/A')}")
-            report.append("")
+            write("## Failure Detected\n")
+            write(f"**Type**: {failure.get('failure_type', 'unknown')}\n")
+            write(f"**First Failure**: Command {failure.get('first_failure_command', 'N/A')}\n")
+            write("\n")
         
         if recs:
-            report.append("## Recommendations")
+            write("## Recommendations\n")
             for rec in recs:
-                report.append(f"- {rec}")
+                write(f"- {rec}\n")
         
-        return "\n".join(report)
+        return report.getvalue()[:-1]
     
     def analyze_session(self, session_id: str) -> dict:
         """Perform complete analysis of session transcript.
@@ -313,14 +499,18 @@ class TranscriptAnalyzer:
         if not transcript_path.exists():
             raise FileNotFoundError(f"Transcript not found: {transcript_path}")
         
-        # Parse and analyze
-        events = self.parse_transcript(str(transcript_path))
-        commands = self.extract_bash_commands(events)
-        
-        statistics = self.calculate_statistics(commands)
-        failure_analysis = self.detect_failure_pattern(commands)
-        frequency_analysis = self.analyze_command_frequency(commands)
-        factors = self.identify_contributing_factors(commands)
+        # Parse and analyze; non-command events are dropped as they're decoded
+        commands = self.extract_bash_commands(
+            self._read_events(str(transcript_path), ANALYZED_FIELDS)
+        )
+        scan = self._scan_commands(
+            commands, check_failures=self._quick_failure_scan(str(transcript_path))
+        )
+        
+        statistics = self.calculate_statistics(commands, scan)
+        failure_analysis = self.detect_failure_pattern(commands, scan)
+        frequency_analysis = self.analyze_command_frequency(commands, scan)
+        factors = self.identify_contributing_factors(commands, scan)
         
         # Generate recommendations
         recommendations = []
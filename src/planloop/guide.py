@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from pathlib import Path
 
 from .core.prompts import load_prompt
@@ -10,8 +11,17 @@ GUIDE_HEADER = "planloop Agent Instructions"
 GUIDE_VERSION = "2.0"  # Increment when prompts change significantly
 MARKER = f"<!-- PLANLOOP-INSTALLED v{GUIDE_VERSION} -->"
 
+_MARKER_TOKEN = "PLANLOOP-INSTALLED"
+_VERSION_RE = re.compile(r"PLANLOOP-INSTALLED v([\d.]+)")
+# Marker comment with its version (if any) captured in the same pass
+_MARKER_WITH_VERSION_RE = re.compile(r"<!--\s*PLANLOOP-INSTALLED(?: v([\d.]+))?[^>]*-->")
+_CUSTOM_SECTION_RE = re.compile(r"\n## (?!Goal|Handshake|Summary|Reuse)")
 
+
+@lru_cache(maxsize=16)
 def render_guide(prompt_set: str = "core-v1") -> str:
+    # Prompt templates are packaged resources, so the rendered guide is
+    # fixed per prompt set for the life of the process
     goal = load_prompt(prompt_set, "goal")
     handshake = load_prompt(prompt_set, "handshake")
     summary = load_prompt(prompt_set, "summary")
@@ -34,7 +44,7 @@ def render_guide(prompt_set: str = "core-v1") -> str:
 
 def detect_marker(text: str) -> bool:
     """Check if any planloop marker exists in text."""
-    return "PLANLOOP-INSTALLED" in text
+    return _MARKER_TOKEN in text
 
 
 def get_guide_version() -> str:
@@ -44,8 +54,12 @@ def get_guide_version() -> str:
 
 def is_guide_outdated(text: str) -> bool:
     """Check if installed guide version is older than current."""
+    # Cheap substring reject before running the version regex
+    if _MARKER_TOKEN not in text:
+        return True
+
     # Extract version from marker
-    match = re.search(r"PLANLOOP-INSTALLED v([\d.]+)", text)
+    match = _VERSION_RE.search(text)
     if not match:
         # No version marker = very old, needs update
         return True
@@ -62,40 +76,51 @@ def insert_guide(path: Path, content: str, force: bool = False) -> None:
         content: Guide content to insert
         force: If True, replace existing guide content
     """
-    if path.exists():
+    try:
         original = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        path.write_text(content + "\n", encoding="utf-8")
+        return
 
-        if detect_marker(original):
-            if not force and not is_guide_outdated(original):
+    if not detect_marker(original):
+        # No marker, append to existing content
+        new_text = original.rstrip() + "\n\n" + content + "\n"
+    else:
+        # Find start of guide (marker comment) and its version in one pass
+        match = _MARKER_WITH_VERSION_RE.search(original)
+
+        if not force:
+            if (
+                match is not None
+                and match.group(1) is not None
+                and original.find(_MARKER_TOKEN) > match.start()
+            ):
+                # The first marker token is this comment's, so its version
+                # is the one is_guide_outdated would find
+                outdated = match.group(1) != GUIDE_VERSION
+            else:
+                outdated = is_guide_outdated(original)
+            if not outdated:
                 # Up-to-date, no action needed
                 return
 
-            # Replace old guide content, preserve custom additions
-            # Find start of guide (marker) and end (next ## or EOF)
-            marker_pattern = r"<!--\s*PLANLOOP-INSTALLED[^>]*-->"
-            match = re.search(marker_pattern, original)
-
-            if match:
-                # Find where guide content ends (before custom sections)
-                start_pos = match.start()
-                # Look for user's custom content after guide
-                custom_section = re.search(r"\n## (?!Goal|Handshake|Summary|Reuse)", original[start_pos:])
-
-                if custom_section:
-                    end_pos = start_pos + custom_section.start()
-                    custom_content = original[end_pos:]
-                    new_text = original[:start_pos] + content + "\n" + custom_content
-                else:
-                    # No custom content, just replace from marker to EOF
-                    new_text = original[:start_pos] + content + "\n"
+        # Replace old guide content, preserve custom additions
+        if match:
+            # Find where guide content ends (before custom sections)
+            start_pos = match.start()
+            # Look for user's custom content after guide
+            custom_section = _CUSTOM_SECTION_RE.search(original, start_pos)
+
+            if custom_section:
+                end_pos = custom_section.start()
+                custom_content = original[end_pos:]
+                new_text = original[:start_pos] + content + "\n" + custom_content
             else:
-                # Marker exists but can't find position, append
-                new_text = original.rstrip() + "\n\n" + content + "\n"
+                # No custom content, just replace from marker to EOF
+                new_text = original[:start_pos] + content + "\n"
         else:
-            # No marker, append to existing content
+            # Marker exists but can't find position, append
             new_text = original.rstrip() + "\n\n" + content + "\n"
-    else:
-        new_text = content + "\n"
 
     path.write_text(new_text, encoding="utf-8")
 
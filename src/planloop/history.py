@@ -1,20 +1,42 @@
 """Session history helpers using git."""
 from __future__ import annotations
 
+import importlib
 import shutil
 import subprocess
 from pathlib import Path
+from typing import Any
 
 from .config import history_enabled
 
-GITIGNORE_CONTENT = """# planloop session history\nartifacts/\nlogs/\n*.log\n*.tmp\n"""
+# Optional in-process git backend; the git CLI is used when it's missing
+try:
+    pygit2: Any = importlib.import_module("pygit2")
+except ImportError:  # pragma: no cover - optional dependency
+    pygit2 = None
+
+# summary.json is derived from state.json on every save, so it isn't versioned
+GITIGNORE_CONTENT = """# planloop session history\nartifacts/\nlogs/\n*.log\n*.tmp\nsummary.json\n"""
 
 GIT_AUTHOR = "planloop"
 GIT_EMAIL = "planloop@example.com"
 
 
 def _git_available() -> bool:
-    return shutil.which("git") is not None
+    return pygit2 is not None or shutil.which("git") is not None
+
+
+# Each git step sequence runs in a single `sh -c` so a snapshot costs one
+# process spawn instead of one per git command. Values are passed as
+# positional parameters, never interpolated into the script.
+_INIT_SCRIPT = 'git init -q && git config user.name "$1" && git config user.email "$2"'
+# Commit exit status 1 means "nothing to commit" and is not an error
+_COMMIT_SCRIPT = 'msg="$1"; shift; git add -- "$@" && {{ git commit {flags}-m "$msg" || [ $? -eq 1 ]; }}'
+_REV_PARSE_SCRIPT = " && git rev-parse HEAD"
+
+
+def _git_chain(session_dir: Path, script: str, *args: str, **kwargs: Any) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(["sh", "-c", script, "sh", *args], cwd=session_dir, text=True, **kwargs)
 
 
 def ensure_repo(session_dir: Path) -> bool:
@@ -22,42 +44,77 @@ def ensure_repo(session_dir: Path) -> bool:
         return False
     git_dir = session_dir / ".git"
     if not git_dir.exists():
-        subprocess.run(["git", "init"], cwd=session_dir, check=True)
-        subprocess.run(["git", "config", "user.name", GIT_AUTHOR], cwd=session_dir, check=True)
-        subprocess.run(["git", "config", "user.email", GIT_EMAIL], cwd=session_dir, check=True)
+        if pygit2 is not None:
+            repo = pygit2.init_repository(str(session_dir))
+            repo.config["user.name"] = GIT_AUTHOR
+            repo.config["user.email"] = GIT_EMAIL
+        else:
+            _git_chain(session_dir, _INIT_SCRIPT, GIT_AUTHOR, GIT_EMAIL, check=True)
         gitignore = session_dir / ".gitignore"
         if not gitignore.exists():
             gitignore.write_text(GITIGNORE_CONTENT, encoding="utf-8")
     return True
 
 
-def commit_state(session_dir: Path, message: str, allow_empty: bool = False) -> None:
-    if not ensure_repo(session_dir):
-        return
+def _tracked_files(session_dir: Path) -> list[str]:
     tracked = ["state.json", "PLAN.md"]
     gitignore = session_dir / ".gitignore"
     if gitignore.exists():
         tracked.append(".gitignore")
-    subprocess.run(["git", "add", *tracked], cwd=session_dir, check=True)
-    cmd = ["git", "commit", "-m", message]
-    if allow_empty:
-        cmd.insert(2, "--allow-empty")
-    result = subprocess.run(cmd, cwd=session_dir)
-    if result.returncode not in (0, 1):
-        result.check_returncode()
+    return tracked
+
+
+def _pygit2_commit(session_dir: Path, message: str, allow_empty: bool) -> str:
+    """Stage tracked files and commit in-process; returns the HEAD sha."""
+    repo = pygit2.Repository(str(session_dir))
+    for name in _tracked_files(session_dir):
+        repo.index.add(name)
+    repo.index.write()
+    tree = repo.index.write_tree()
+    parents = [] if repo.head_is_unborn else [repo.head.target]
+    if not allow_empty and parents and repo[parents[0]].tree_id == tree:
+        # Nothing to commit
+        return str(parents[0])
+    signature = pygit2.Signature(GIT_AUTHOR, GIT_EMAIL)
+    return str(repo.create_commit("HEAD", signature, signature, message, tree, parents))
+
+
+def commit_state(session_dir: Path, message: str, allow_empty: bool = False) -> None:
+    if not ensure_repo(session_dir):
+        return
+    if pygit2 is not None:
+        _pygit2_commit(session_dir, message, allow_empty)
+        return
+    script = _COMMIT_SCRIPT.format(flags="--allow-empty " if allow_empty else "")
+    _git_chain(session_dir, script, message, *_tracked_files(session_dir), check=True)
 
 
 def create_snapshot(session_dir: Path, note: str) -> str:
     if not ensure_repo(session_dir):
         raise RuntimeError("History not enabled")
-    commit_state(session_dir, f"Snapshot: {note}", allow_empty=True)
-    sha = subprocess.run(["git", "rev-parse", "HEAD"], cwd=session_dir, text=True, capture_output=True, check=True)
-    return sha.stdout.strip()
+    if pygit2 is not None:
+        return _pygit2_commit(session_dir, f"Snapshot: {note}", allow_empty=True)
+    # add + commit + rev-parse in one process; -q keeps stdout to the sha
+    script = _COMMIT_SCRIPT.format(flags="--allow-empty -q ") + _REV_PARSE_SCRIPT
+    result = _git_chain(
+        session_dir,
+        script,
+        f"Snapshot: {note}",
+        *_tracked_files(session_dir),
+        capture_output=True,
+        check=True,
+    )
+    return result.stdout.strip().splitlines()[-1]
 
 
 def restore_snapshot(session_dir: Path, ref: str) -> None:
     if not ensure_repo(session_dir):
         raise RuntimeError("History not enabled")
+    if pygit2 is not None:
+        repo = pygit2.Repository(str(session_dir))
+        commit = repo.revparse_single(ref).peel(pygit2.Commit)
+        repo.reset(commit.id, pygit2.GIT_RESET_HARD)
+        return
     subprocess.run(["git", "reset", "--hard", ref], cwd=session_dir, check=True)
 
 
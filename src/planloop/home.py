@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from importlib import resources
 from pathlib import Path
 
@@ -27,14 +28,28 @@ def _expand_path(raw_path: str) -> Path:
     return Path(raw_path).expanduser().resolve()
 
 
+@lru_cache(maxsize=8)
+def _resolve_home(env_override: str | None, user_home: str) -> Path:
+    """Resolve PLANLOOP_HOME for one set of inputs.
+
+    Keyed on the raw override and user home so env changes (tests, selftest)
+    still pick up a new directory; repeat calls skip resolve().
+    """
+    if env_override:
+        return _expand_path(env_override)
+    return (Path(user_home) / DEFAULT_HOME_NAME).resolve()
+
+
 def get_home() -> Path:
     """Return the PLANLOOP_HOME directory, creating it when missing."""
     env_override = os.environ.get(PLANLOOP_HOME_ENV)
     if env_override:
-        home_path = _expand_path(env_override)
+        home_path = _resolve_home(env_override, "")
     else:
-        home_path = (Path.home() / DEFAULT_HOME_NAME).resolve()
-    home_path.mkdir(parents=True, exist_ok=True)
+        home_path = _resolve_home(None, str(Path.home()))
+    # Checked on every call (one stat) so a removed home is recreated
+    if not home_path.is_dir():
+        home_path.mkdir(parents=True, exist_ok=True)
     return home_path
 
 
@@ -0,0 +1,48 @@
+"""JSON encoding helpers backed by orjson when it is installed."""
+from __future__ import annotations
+
+import importlib
+import json
+from collections.abc import Callable
+from datetime import date, time
+from enum import Enum
+from typing import Any
+
+# Optional fast JSON backend (the "fast" extra); stdlib json is used when it's
+# not installed
+try:
+    orjson: Any = importlib.import_module("orjson")
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Bound directly rather than wrapped, since callers parse line by line
+loads: Callable[[bytes | str], Any] = orjson.loads if orjson is not None else json.loads
+
+
+def _default(obj: Any) -> Any:
+    """Encode the non-JSON types orjson handles natively (e.g. model_dump() datetimes)."""
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON bytes without ASCII escaping.
+
+    Compact by default, as Starlette's JSONResponse renders; ``indent=True``
+    pretty-prints with two-space indentation instead. Datetimes are written
+    in ``isoformat()`` form (``+00:00`` for UTC) with or without orjson.
+    """
+    if orjson is not None:
+        encoded: bytes = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+        return encoded
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2, default=_default).encode("utf-8")
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), default=_default
+    ).encode("utf-8")
+
+
+__all__ = ["dumps", "loads", "orjson"]
@@ -50,13 +50,30 @@ def _ensure_session_handler(logger: logging.Logger, session_dir: Path) -> loggin
     logs_dir = session_dir / "logs"
     logs_dir.mkdir(parents=True, exist_ok=True)
     log_path = logs_dir / LOG_FILENAME
-    handler = logging.FileHandler(log_path)
+    # delay=True: the file is only opened on the first record that passes
+    # the level filter, so quiet sessions don't hold a descriptor
+    handler = logging.FileHandler(log_path, delay=True)
     handler.setFormatter(_FORMATTER)
     logger.addHandler(handler)
     _SESSION_HANDLERS[session_dir] = handler
     return handler
 
 
+def close_session_log(session_dir: Path) -> None:
+    """Detach and close the log handler for a session, if one is open.
+
+    Long-running processes that touch many sessions should call this when
+    done with a session so its file handle is released and later records
+    aren't dispatched to it.
+    """
+
+    handler = _SESSION_HANDLERS.pop(session_dir.resolve(), None)
+    if handler is None:
+        return
+    get_logger().removeHandler(handler)
+    handler.close()
+
+
 def log_event(message: str, *, level: int = logging.INFO) -> None:
     """Log a global event (not tied to a specific session)."""
 
@@ -72,4 +89,12 @@ def log_session_event(session_dir: Path, message: str, *, level: int = logging.I
     logger.log(level, message)
 
 
-__all__ = ["get_logger", "log_event", "log_session_event", "set_level", "LOG_FILENAME", "LOGGER_NAME"]
+__all__ = [
+    "close_session_log",
+    "get_logger",
+    "log_event",
+    "log_session_event",
+    "set_level",
+    "LOG_FILENAME",
+    "LOGGER_NAME",
+]
@@ -7,14 +7,32 @@ are therefore gated by ``FASTAPI_AVAILABLE`` and consumers should use
 """
 from __future__ import annotations
 
+import heapq
+import os
+import stat
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import UTC
+from email.utils import formatdate, parsedate_to_datetime
+from functools import lru_cache
+from html import escape
+from pathlib import Path
+
+from ..core.session import SUMMARY_FILE, summarize_state
 from ..core.state import SessionState
-from ..home import CURRENT_SESSION_POINTER, SESSIONS_DIR, initialize_home
+from ..home import CURRENT_SESSION_POINTER, PLANLOOP_HOME_ENV, SESSIONS_DIR, initialize_home
+from ..json_utils import dumps, loads
 from ..tui.app import SessionViewModel
 
 try:  # pragma: no cover - optional dependency guard
-    from fastapi import FastAPI, HTTPException
+    from fastapi import FastAPI, HTTPException, Request
     from fastapi.middleware.cors import CORSMiddleware
-    from fastapi.responses import FileResponse, HTMLResponse
+    from fastapi.responses import (
+        FileResponse,
+        HTMLResponse,
+        Response,
+        StreamingResponse,
+    )
     from fastapi.staticfiles import StaticFiles
 
     FASTAPI_AVAILABLE = True
@@ -22,17 +40,271 @@ except ImportError:  # pragma: no cover
     FastAPI = None
     HTMLResponse = None
     HTTPException = None
+    Request = None
     FileResponse = None
+    Response = None
+    StreamingResponse = None
     StaticFiles = None
     CORSMiddleware = None
     FASTAPI_AVAILABLE = False
 
 
+@lru_cache(maxsize=4)
+def _initialized_home(env_override: str | None) -> Path:
+    return initialize_home()
+
+
+def _home() -> Path:
+    """Run initialize_home() once per PLANLOOP_HOME value instead of per request."""
+    return _initialized_home(os.environ.get(PLANLOOP_HOME_ENV))
+
+
+@dataclass
+class _CachedState:
+    mtime_ns: int
+    size: int
+    state: SessionState
+    # Pre-rendered JSON bodies keyed by part ("session", "tasks", "signals")
+    rendered: dict[str, bytes] = field(default_factory=dict)
+
+
+# state.json path -> latest parse of that file
+_STATE_CACHE: dict[Path, _CachedState] = {}
+
+
+def _cached_state(state_path: Path, state_stat: os.stat_result | None = None) -> _CachedState:
+    if state_stat is None:
+        state_stat = state_path.stat()
+    cached = _STATE_CACHE.get(state_path)
+    if cached is not None and cached.mtime_ns == state_stat.st_mtime_ns and cached.size == state_stat.st_size:
+        return cached
+    state = SessionState.model_validate_json(state_path.read_bytes())
+    cached = _CachedState(state_stat.st_mtime_ns, state_stat.st_size, state)
+    _STATE_CACHE[state_path] = cached
+    return cached
+
+
+def _read_session_state(state_path: Path) -> SessionState:
+    """Parse ``state.json``, reusing the previous parse while the file is unchanged."""
+    return _cached_state(state_path).state
+
+
+def _render_state_json(
+    state_path: Path, part: str, state_stat: os.stat_result | None = None
+) -> bytes:
+    """Return JSON for the whole state (``"session"``) or its tasks/signals list.
+
+    Rendered once per parse of ``state.json`` and served from the cache after.
+    Pass ``state_stat`` when the caller already stat'ed the file (e.g. for an ETag).
+    Encoded from ``model_dump()`` through json_utils, like the task endpoints,
+    so datetimes have the same ``isoformat()`` form on every route.
+    """
+    cached = _cached_state(state_path, state_stat)
+    body = cached.rendered.get(part)
+    if body is None:
+        if part == "session":
+            body = dumps(cached.state.model_dump())
+        else:
+            body = dumps([item.model_dump() for item in getattr(cached.state, part)])
+        cached.rendered[part] = body
+    return body
+
+
+def _read_session_summary(session_dir: Path) -> dict | None:
+    """Return a session's listing summary, or None if it has no state.json.
+
+    Uses ``summary.json`` when it is at least as new as ``state.json`` and
+    falls back to parsing the full state otherwise.
+    """
+    state_path = session_dir / "state.json"
+    try:
+        state_mtime = state_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    summary_path = session_dir / SUMMARY_FILE
+    try:
+        if summary_path.stat().st_mtime_ns >= state_mtime:
+            summary: dict = loads(summary_path.read_bytes())
+            summary["id"] = session_dir.name
+            return summary
+    except (OSError, ValueError):
+        pass
+    summary = summarize_state(_read_session_state(state_path))
+    summary["id"] = session_dir.name
+    return summary
+
+
+def _iter_session_summaries_json(
+    sessions_path: Path, limit: int | None = None, offset: int = 0
+) -> Iterator[bytes]:
+    """Yield the session listing as a JSON array, one session at a time.
+
+    Only directory names are collected up front (for the newest-first sort);
+    summaries are read and encoded as they are sent. With ``limit``, only the
+    requested page of names is selected (heap, not a full sort) and read.
+    """
+    with os.scandir(sessions_path) as entries:
+        dir_names = (e.name for e in entries if e.is_dir())
+        if limit is None:
+            names = sorted(dir_names, reverse=True)[offset:]
+        else:
+            names = heapq.nlargest(offset + limit, dir_names)[offset:]
+    yield b"["
+    separator = b""
+    for name in names:
+        try:
+            summary = _read_session_summary(sessions_path / name)
+        except Exception:
+            continue
+        if summary is not None:
+            yield separator + dumps(summary)
+            separator = b","
+    yield b"]"
+
+
+def _iter_session_states(sessions_path: Path) -> Iterator[tuple[str, SessionState]]:
+    """Yield ``(session id, state)`` for every readable session directory.
+
+    One scandir pass (DirEntry.is_dir uses the cached d_type) and no separate
+    exists() check: a missing or invalid state.json is skipped when read.
+    """
+    with os.scandir(sessions_path) as entries:
+        session_dirs = [(e.name, e.path) for e in entries if e.is_dir()]
+    for name, path in session_dirs:
+        try:
+            state = _read_session_state(Path(path, "state.json"))
+        except Exception:
+            continue
+        yield name, state
+
+
+def _all_task_dicts(sessions_path: Path) -> list[dict]:
+    """Return every task across sessions, tagged with its session id and name."""
+    all_tasks = []
+    for name, state in _iter_session_states(sessions_path):
+        session_name = state.title or name
+        for task in state.tasks:
+            task_dict = task.model_dump()
+            task_dict["session"] = name
+            task_dict["session_name"] = session_name
+            all_tasks.append(task_dict)
+    return all_tasks
+
+
+# Vite emits content-hashed asset names, so a given URL never changes content
+_IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _file_etag(stat_result: os.stat_result) -> str:
+    """Return a strong ETag derived from a file's mtime and size."""
+    return f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return True if an If-None-Match header value matches ``etag``."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, as RFC 9110 requires for If-None-Match
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(",")
+    )
+
+
+def _is_plain_relative_path(full_path: str) -> bool:
+    """Return True if ``full_path`` is a non-empty relative path without ``..``.
+
+    A pure string check, so traversal attempts are rejected before any
+    filesystem call touches the user-supplied segments.
+    """
+    if not full_path or "\x00" in full_path or "\\" in full_path or full_path.startswith("/"):
+        return False
+    return all(segment not in ("", ".", "..") for segment in full_path.split("/"))
+
+
+def _not_modified_since(if_modified_since: str | None, mtime: float) -> bool:
+    """Return True if an If-Modified-Since value covers ``mtime``.
+
+    HTTP dates have one-second resolution, so ``mtime`` is compared floored.
+    """
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    return int(mtime) <= since.timestamp()
+
+
+# Catch-all paths under these prefixes 404 instead of falling back to index.html
+_NON_SPA_PREFIXES = ("api/", "legacy/")
+
+# Vite build output of the repo's frontend/ (present in source checkouts only)
+_FRONTEND_DIR = Path(__file__).parents[3] / "frontend" / "dist"
+
+# Pre-encoded so the 503 fallback doesn't re-encode the page per request
+_FRONTEND_NOT_BUILT_HTML = b"""
+                <h1>Planloop Web Dashboard</h1>
+                <p>Frontend not built yet. Run <code>cd frontend && npm run build</code></p>
+                <p>Or use legacy view: <a href="/legacy">/legacy</a></p>
+                """
+
+
+def _render_legacy_index(session_names: list[str]) -> str:
+    """Render the legacy session list page."""
+    parts = ["<h1>planloop Sessions</h1><ul>"]
+    append = parts.append
+    for name in session_names:
+        name = escape(name)
+        append("<li><a href='/legacy/sessions/")
+        append(name)
+        append("'>")
+        append(name)
+        append("</a></li>")
+    append("</ul>")
+    return "".join(parts)
+
+
+def _render_legacy_session(model: SessionViewModel) -> str:
+    """Render the legacy single-session page (task and signal tables).
+
+    Every interpolated value is HTML-escaped; titles come from agent input.
+    """
+    parts = [
+        "\n        <h1>", escape(model.title), "</h1>",
+        "\n        <p><strong>Session:</strong> ", escape(model.session), "</p>",
+        "\n        <p><strong>Now:</strong> ", escape(model.now_reason), "</p>",
+        "\n        <h2>Tasks</h2>",
+        "\n        <table border='1'><tr><th>ID</th><th>Title</th><th>Status</th></tr>",
+    ]
+    append = parts.append
+    for tid, title, status in model.tasks:
+        append("<tr><td>")
+        append(escape(tid))
+        append("</td><td>")
+        append(escape(title))
+        append("</td><td>")
+        append(escape(status))
+        append("</td></tr>")
+    append("</table>\n        <h2>Signals</h2>")
+    append("\n        <table border='1'><tr><th>Signal</th><th>State</th></tr>")
+    for title, status in model.signals:
+        append("<tr><td>")
+        append(escape(title))
+        append("</td><td>")
+        append(escape(status))
+        append("</td></tr>")
+    append("</table>\n        ")
+    return "".join(parts)
+
+
 app: FastAPI | None = None
 
 if FASTAPI_AVAILABLE:  # pragma: no cover - exercised in integration tests
-    from pathlib import Path
-
     app = FastAPI()
 
     # Add CORS middleware for development
@@ -44,11 +316,8 @@ if FASTAPI_AVAILABLE:  # pragma: no cover - exercised in integration tests
         allow_headers=["*"],
     )
 
-    # Get frontend build directory
-    frontend_dir = Path(__file__).parent.parent.parent.parent / "frontend" / "dist"
-
-    def load_state(session_id: str | None) -> SessionState:
-        home = initialize_home()
+    def _state_path(session_id: str | None) -> Path:
+        home = _home()
         session = session_id
         if not session:
             pointer_path = home / CURRENT_SESSION_POINTER
@@ -59,55 +328,61 @@ if FASTAPI_AVAILABLE:  # pragma: no cover - exercised in integration tests
         state_path = home / SESSIONS_DIR / session / "state.json"
         if not state_path.exists():
             raise HTTPException(status_code=404, detail="Session not found")
-        return SessionState.model_validate_json(state_path.read_text(encoding="utf-8"))
+        return state_path
+
+    def load_state(session_id: str | None) -> SessionState:
+        return _read_session_state(_state_path(session_id))
+
+    def _state_json_response(session_id: str, part: str, request: Request) -> Response:
+        state_path = _state_path(session_id)
+        state_stat = state_path.stat()
+        # Weak: the body is derived from state.json, not the file bytes themselves
+        headers = {"ETag": "W/" + _file_etag(state_stat), "Cache-Control": "no-cache"}
+        if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        body = _render_state_json(state_path, part, state_stat)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    def _json_response(payload: dict) -> Response:
+        # Encoded by json_utils (orjson when installed) instead of JSONResponse
+        return Response(content=dumps(payload), media_type="application/json")
 
     # API endpoints
+    # Handlers are plain ``def``: every one touches the filesystem, and FastAPI
+    # runs sync handlers in its threadpool instead of on the event loop.
     @app.get("/api/sessions")
-    async def list_sessions():
-        """List all sessions."""
-        home = initialize_home()
+    def list_sessions(limit: int | None = None, offset: int = 0):
+        """List sessions newest first, optionally one page at a time."""
+        home = _home()
         sessions_path = home / SESSIONS_DIR
         if not sessions_path.exists():
             return []
 
-        sessions = []
-        for session_dir in sorted(sessions_path.iterdir(), key=lambda p: p.name, reverse=True):
-            if session_dir.is_dir():
-                state_file = session_dir / "state.json"
-                if state_file.exists():
-                    try:
-                        state = SessionState.model_validate_json(state_file.read_text(encoding="utf-8"))
-                        sessions.append({
-                            "id": session_dir.name,
-                            "description": state.title or state.purpose,
-                            "task_count": len(state.tasks),
-                            "signal_count": len(state.signals),
-                        })
-                    except Exception:
-                        pass
-        return sessions
+        # Plain generator: Starlette iterates it in a worker thread, keeping
+        # the per-session file reads off the event loop
+        return StreamingResponse(
+            _iter_session_summaries_json(sessions_path, limit, max(offset, 0)),
+            media_type="application/json",
+        )
 
     @app.get("/api/sessions/{session_id}")
-    async def get_session(session_id: str):
+    def get_session(session_id: str, request: Request):
         """Get session details."""
-        state = load_state(session_id)
-        return state.model_dump()
+        return _state_json_response(session_id, "session", request)
 
     @app.get("/api/sessions/{session_id}/tasks")
-    async def get_session_tasks(session_id: str):
+    def get_session_tasks(session_id: str, request: Request):
         """Get tasks for a specific session."""
-        state = load_state(session_id)
-        return [task.model_dump() for task in state.tasks]
+        return _state_json_response(session_id, "tasks", request)
 
     @app.get("/api/sessions/{session_id}/signals")
-    async def get_session_signals(session_id: str):
+    def get_session_signals(session_id: str, request: Request):
         """Get signals for a specific session."""
-        state = load_state(session_id)
-        return [signal.model_dump() for signal in state.signals]
+        return _state_json_response(session_id, "signals", request)
 
     # Task management endpoints
     @app.get("/api/tasks")
-    async def list_tasks(
+    def list_tasks(
         page: int = 1,
         pageSize: int = 50,
         search: str | None = None,
@@ -118,25 +393,12 @@ if FASTAPI_AVAILABLE:  # pragma: no cover - exercised in integration tests
         sortDir: str = "desc",
     ):
         """List all tasks across all sessions with filtering and pagination."""
-        home = initialize_home()
+        home = _home()
         sessions_path = home / SESSIONS_DIR
         if not sessions_path.exists():
             return {"tasks": [], "total": 0, "page": page, "pageSize": pageSize}
 
-        all_tasks = []
-        for session_dir in sessions_path.iterdir():
-            if session_dir.is_dir():
-                state_file = session_dir / "state.json"
-                if state_file.exists():
-                    try:
-                        state = SessionState.model_validate_json(state_file.read_text(encoding="utf-8"))
-                        for task in state.tasks:
-                            task_dict = task.model_dump()
-                            task_dict["session"] = session_dir.name
-                            task_dict["session_name"] = state.title or session_dir.name
-                            all_tasks.append(task_dict)
-                    except Exception:
-                        pass
+        all_tasks = _all_task_dicts(sessions_path)
 
         # Apply filters
         filtered_tasks = all_tasks
@@ -178,35 +440,22 @@ if FASTAPI_AVAILABLE:  # pragma: no cover - exercised in integration tests
         end = start + pageSize
         paginated_tasks = filtered_tasks[start:end]
 
-        return {
+        return _json_response({
             "tasks": paginated_tasks,
             "total": total,
             "page": page,
             "pageSize": pageSize,
-        }
+        })
 
     @app.get("/api/tasks/search")
-    async def search_tasks(q: str):
+    def search_tasks(q: str):
         """Search tasks for autocomplete."""
-        home = initialize_home()
+        home = _home()
         sessions_path = home / SESSIONS_DIR
         if not sessions_path.exists():
             return {"tasks": []}
 
-        all_tasks = []
-        for session_dir in sessions_path.iterdir():
-            if session_dir.is_dir():
-                state_file = session_dir / "state.json"
-                if state_file.exists():
-                    try:
-                        state = SessionState.model_validate_json(state_file.read_text(encoding="utf-8"))
-                        for task in state.tasks:
-                            task_dict = task.model_dump()
-                            task_dict["session"] = session_dir.name
-                            task_dict["session_name"] = state.title or session_dir.name
-                            all_tasks.append(task_dict)
-                    except Exception:
-                        pass
+        all_tasks = _all_task_dicts(sessions_path)
 
         # Filter by search query
         q_lower = q.lower()
@@ -216,70 +465,79 @@ if FASTAPI_AVAILABLE:  # pragma: no cover - exercised in integration tests
         ]
 
         # Return top 10
-        return {"tasks": results[:10]}
+        return _json_response({"tasks": results[:10]})
 
     # Legacy HTML endpoints (kept for backward compatibility)
     @app.get("/legacy", response_class=HTMLResponse)
-    async def legacy_index() -> str:
-        home = initialize_home()
-        sessions = sorted((home / SESSIONS_DIR).iterdir(), key=lambda p: p.name)
-        links = "".join(
-            f"<li><a href='/legacy/sessions/{path.name}'>{path.name}</a></li>" for path in sessions
-        )
-        return f"<h1>planloop Sessions</h1><ul>{links}</ul>"
+    def legacy_index(request: Request):
+        sessions_path = _home() / SESSIONS_DIR
+        # Adding or removing a session changes the directory mtime, and the
+        # page lists nothing but directory names
+        mtime = sessions_path.stat().st_mtime
+        headers = {"Last-Modified": formatdate(mtime, usegmt=True)}
+        if _not_modified_since(request.headers.get("if-modified-since"), mtime):
+            return Response(status_code=304, headers=headers)
+        html = _render_legacy_index(sorted(path.name for path in sessions_path.iterdir()))
+        return HTMLResponse(content=html, headers=headers)
 
     @app.get("/legacy/sessions/{session_id}", response_class=HTMLResponse)
-    async def legacy_session_view(session_id: str) -> str:
+    def legacy_session_view(session_id: str) -> str:
         state = load_state(session_id)
         model = SessionViewModel.from_state(state)
-        tasks = "".join(
-            f"<tr><td>{tid}</td><td>{title}</td><td>{status}</td></tr>"
-            for tid, title, status in model.tasks
-        )
-        signals = "".join(
-            f"<tr><td>{title}</td><td>{status}</td></tr>"
-            for title, status in model.signals
-        )
-        return f"""
-        <h1>{model.title}</h1>
-        <p><strong>Session:</strong> {model.session}</p>
-        <p><strong>Now:</strong> {model.now_reason}</p>
-        <h2>Tasks</h2>
-        <table border='1'><tr><th>ID</th><th>Title</th><th>Status</th></tr>{tasks}</table>
-        <h2>Signals</h2>
-        <table border='1'><tr><th>Signal</th><th>State</th></tr>{signals}</table>
-        """
+        return _render_legacy_session(model)
 
     # Serve React frontend (if built)
-    if frontend_dir.exists():
-        app.mount("/assets", StaticFiles(directory=frontend_dir / "assets"), name="assets")
+    if _FRONTEND_DIR.is_dir():
+
+        class _ImmutableStaticFiles(StaticFiles):
+            """Static files served with a far-future, immutable Cache-Control."""
+
+            def file_response(self, *args, **kwargs):
+                response = super().file_response(*args, **kwargs)
+                response.headers["Cache-Control"] = _IMMUTABLE_CACHE_CONTROL
+                return response
+
+        app.mount("/assets", _ImmutableStaticFiles(directory=_FRONTEND_DIR / "assets"), name="assets")
+
+        index_path = _FRONTEND_DIR / "index.html"
+
+        def _conditional_file_response(path: Path, stat_result: os.stat_result, request: Request):
+            etag = _file_etag(stat_result)
+            if _etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers={"ETag": etag})
+            # Reuse the stat we already have instead of letting FileResponse stat again
+            return FileResponse(path, stat_result=stat_result, headers={"ETag": etag})
 
         @app.get("/{full_path:path}")
-        async def serve_frontend(full_path: str):
+        def serve_frontend(full_path: str, request: Request):
             """Serve React app for all non-API routes."""
-            # API routes handled above
-            if full_path.startswith("api/") or full_path.startswith("legacy/"):
+            # Registered API/legacy routes matched earlier; anything else under
+            # those prefixes is an unknown endpoint, not an SPA route
+            if full_path.startswith(_NON_SPA_PREFIXES):
                 raise HTTPException(status_code=404, detail="Not found")
 
-            # Try to serve the requested file
-            file_path = frontend_dir / full_path
-            if file_path.is_file():
-                return FileResponse(file_path)
-
-            # Otherwise serve index.html (SPA fallback)
-            index_path = frontend_dir / "index.html"
-            if index_path.exists():
-                return FileResponse(index_path)
+            # Try to serve the requested file; anything that could escape
+            # _FRONTEND_DIR goes straight to the SPA fallback
+            if _is_plain_relative_path(full_path):
+                file_path = _FRONTEND_DIR / full_path
+                try:
+                    file_stat = file_path.stat()
+                except OSError:
+                    file_stat = None
+                if file_stat is not None and stat.S_ISREG(file_stat.st_mode):
+                    return _conditional_file_response(file_path, file_stat, request)
+
+            # Otherwise serve index.html (SPA fallback). Stat it per request
+            # rather than caching existence: the ETag must follow rebuilds.
+            try:
+                index_stat = index_path.stat()
+            except OSError:
+                index_stat = None
+            if index_stat is not None:
+                return _conditional_file_response(index_path, index_stat, request)
 
             # Frontend not built yet
-            return HTMLResponse(
-                content="""
-                <h1>Planloop Web Dashboard</h1>
-                <p>Frontend not built yet. Run <code>cd frontend && npm run build</code></p>
-                <p>Or use legacy view: <a href="/legacy">/legacy</a></p>
-                """,
-                status_code=503
-            )
+            return HTMLResponse(content=_FRONTEND_NOT_BUILT_HTML, status_code=503)
 
 else:
 
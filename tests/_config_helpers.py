@@ -0,0 +1,43 @@
+"""config.yml helpers for tests that change planloop settings."""
+from __future__ import annotations
+
+from typing import Any
+
+import yaml
+
+from planloop.config import _read_config, _SafeDumper, reset_config_cache
+from planloop.home import CONFIG_FILE_NAME, initialize_home
+
+
+def _merge(base: dict[str, Any], updates: dict[str, Any]) -> dict[str, Any]:
+    merged = dict(base)
+    for key, value in updates.items():
+        current = merged.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            merged[key] = _merge(current, value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def update_config(updates: dict[str, Any]) -> dict[str, Any]:
+    """Deep-merge ``updates`` into config.yml and return the new config.
+
+    The file is read fresh rather than through the ``load_config`` cache,
+    which may still hold another home's config.
+    """
+    path = initialize_home() / CONFIG_FILE_NAME
+    config = _merge(_read_config(path), updates)
+    path.write_text(
+        yaml.dump(config, Dumper=_SafeDumper, sort_keys=False), encoding="utf-8"
+    )
+    reset_config_cache()
+    return config
+
+
+def set_safe_mode(**kwargs: bool) -> None:
+    """Set ``safe_modes.update`` defaults in the current home's config.yml."""
+    update_config({"safe_modes": {"update": kwargs}})
+
+
+__all__ = ["set_safe_mode", "update_config"]
@@ -0,0 +1,35 @@
+"""JSON and state.json helpers for CLI test assertions."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+# orjson when it is installed, stdlib json otherwise; re-exported for tests
+from planloop.json_utils import dumps, loads
+
+
+def write_json(path: Path, data: Any) -> None:
+    """Write ``data`` to ``path`` as compact JSON bytes."""
+    path.write_bytes(dumps(data))
+
+
+def parse_json(stdout: str | bytes) -> Any:
+    """Parse JSON printed by the CLI.
+
+    Prefer ``result.stdout_bytes`` so orjson reads the captured bytes
+    without a decode/encode round trip.
+    """
+    return loads(stdout)
+
+
+def read_state(session_dir: Path) -> dict[str, Any]:
+    """Load a session's state.json as a plain dict, straight from bytes."""
+    return loads((session_dir / "state.json").read_bytes())
+
+
+def assert_state_contains(session_dir: Path, needle: bytes) -> None:
+    """Assert that a session's state.json contains ``needle``, without decoding it."""
+    assert needle in (session_dir / "state.json").read_bytes()
+
+
+__all__ = ["assert_state_contains", "dumps", "loads", "parse_json", "read_state", "write_json"]
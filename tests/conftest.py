@@ -0,0 +1,275 @@
+"""Shared pytest fixtures."""
+from __future__ import annotations
+
+import os
+import shlex
+import shutil
+import sys
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import pytest
+import typer
+from typer.testing import CliRunner, Result
+
+from planloop.config import reset_config_cache
+from planloop.core import registry
+from planloop.core.registry import SessionSummary
+from planloop.core.session import (
+    _initial_state,
+    create_session,
+    load_session_state_from_disk,
+    new_session_id,
+    update_registry_from_state,
+)
+from planloop.core.state import SessionState
+from planloop.home import SESSIONS_DIR, initialize_home
+
+from ._config_helpers import update_config
+from ._json_helpers import parse_json
+
+CliInvoke = Callable[..., Result]
+
+_RUNNER = CliRunner()
+
+TMPFS_ENV = "PLANLOOP_TEST_TMPFS"
+_SHM_DIR = Path("/dev/shm")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Put tmp_path trees on tmpfs when PLANLOOP_TEST_TMPFS=1 and /dev/shm is usable.
+
+    The session, snapshot and lock tests rewrite many small files; keeping
+    them in memory avoids disk syncs. An explicit --basetemp still wins.
+    """
+    if os.environ.get(TMPFS_ENV) != "1" or config.option.basetemp:
+        return
+    if _SHM_DIR.is_dir() and os.access(_SHM_DIR, os.W_OK):
+        config.option.basetemp = str(_SHM_DIR / f"planloop-pytest-{os.getuid()}")
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """The CliRunner shared by every CLI test; it holds no per-test state."""
+    return _RUNNER
+
+
+@pytest.fixture(scope="session")
+def cli_invoke() -> CliInvoke:
+    """Invoke the planloop CLI like ``CliRunner().invoke(cli.app, ...)``.
+
+    ``CliRunner.invoke`` rebuilds the whole Click command tree from the Typer
+    app on every call; here it is built once per test session and reused.
+    Don't use this for tests that monkeypatch a command function itself, since
+    the cached tree keeps the original callbacks.
+    """
+    from planloop import cli
+
+    command = typer.main.get_command(cli.app)
+    runner = _RUNNER
+    prog_name = runner.get_default_prog_name(command)
+
+    def invoke(args: str | Sequence[str] = (), input: str | bytes | None = None) -> Result:
+        if isinstance(args, str):
+            args = shlex.split(args)
+        exit_code = 0
+        exception: BaseException | None = None
+        exc_info = None
+        with runner.isolation(input=input) as (stdout, stderr, output):
+            # Mirrors CliRunner.invoke's exit-code and exception handling
+            try:
+                command.main(args=list(args), prog_name=prog_name)
+            except SystemExit as exc:
+                exc_info = sys.exc_info()
+                code = exc.code if exc.code is not None else 0
+                if code != 0:
+                    exception = exc
+                if not isinstance(code, int):
+                    sys.stdout.write(f"{code}\n")
+                    code = 1
+                exit_code = code
+            except Exception as exc:
+                exception = exc
+                exit_code = 1
+                exc_info = sys.exc_info()
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                stdout_bytes = stdout.getvalue()
+                stderr_bytes = stderr.getvalue()
+                output_bytes = output.getvalue()
+        return Result(
+            runner=runner,
+            stdout_bytes=stdout_bytes,
+            stderr_bytes=stderr_bytes,
+            output_bytes=output_bytes,
+            return_value=None,
+            exit_code=exit_code,
+            exception=exception,
+            exc_info=exc_info,  # type: ignore[arg-type]
+        )
+
+    return invoke
+
+
+@pytest.fixture(scope="session")
+def run_cli(cli_invoke: CliInvoke) -> Callable[..., Any]:
+    """Run a CLI command that must succeed and return its parsed JSON output.
+
+    ``parse="raw"`` returns stdout as text and ``parse=None`` the Result.
+    """
+
+    def run(*args: str, input: str | None = None, parse: str | None = "json") -> Any:
+        result = cli_invoke(list(args), input=input)
+        assert result.exit_code == 0, result.stdout
+        if parse == "json":
+            return parse_json(result.stdout_bytes)
+        if parse == "raw":
+            return result.stdout
+        return result
+
+    return run
+
+
+@pytest.fixture(scope="session")
+def current_guide() -> str:
+    """The rendered agents guide; it can't change during a test run."""
+    from planloop.guide import render_guide
+
+    return render_guide()
+
+
+@pytest.fixture(scope="session")
+def _empty_home_template(tmp_path_factory) -> Path:
+    home = tmp_path_factory.mktemp("home_template") / "home"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("PLANLOOP_HOME", str(home))
+        initialize_home()
+    return home
+
+
+@pytest.fixture(scope="session")
+def _session_home_template(tmp_path_factory, _empty_home_template) -> tuple[Path, str]:
+    home = tmp_path_factory.mktemp("session_home_template") / "home"
+    shutil.copytree(_empty_home_template, home)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("PLANLOOP_HOME", str(home))
+        state = create_session("Template", "Template Work", project_root=Path("/repo"))
+    return home, state.session
+
+
+@pytest.fixture(scope="session")
+def _history_home_template(tmp_path_factory, _empty_home_template) -> tuple[Path, str]:
+    home = tmp_path_factory.mktemp("history_home_template") / "home"
+    shutil.copytree(_empty_home_template, home)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("PLANLOOP_HOME", str(home))
+        update_config({"history": {"enabled": True}})
+        try:
+            # Runs git init and the initial commit once for the whole run
+            state = create_session("Snap", "Snapshot Test", project_root=Path("/repo"))
+        finally:
+            reset_config_cache()
+    return home, state.session
+
+
+@contextmanager
+def _fresh_config(monkeypatch: pytest.MonkeyPatch, home: Path) -> Iterator[None]:
+    """Point PLANLOOP_HOME at ``home`` with the config cache cleared on entry and exit.
+
+    Tests can then change config.yml freely (see _config_helpers.update_config)
+    without resetting the cache themselves.
+    """
+    monkeypatch.setenv("PLANLOOP_HOME", str(home))
+    reset_config_cache()
+    try:
+        yield
+    finally:
+        reset_config_cache()
+
+
+@pytest.fixture
+def planloop_home(_empty_home_template, tmp_path, monkeypatch) -> Iterator[Path]:
+    """An initialized, empty PLANLOOP_HOME, copied from a per-run template."""
+    home = tmp_path / "home"
+    shutil.copytree(_empty_home_template, home)
+    with _fresh_config(monkeypatch, home):
+        yield home
+
+
+@pytest.fixture
+def planloop_session(
+    _session_home_template, tmp_path, monkeypatch
+) -> Iterator[tuple[Path, SessionState]]:
+    """A PLANLOOP_HOME holding one fresh session, as ``(home, state)``.
+
+    The session is created once per run and copied, which is much cheaper
+    than calling create_session() in every test.
+    """
+    template, session_id = _session_home_template
+    home = tmp_path / "home"
+    shutil.copytree(template, home)
+    with _fresh_config(monkeypatch, home):
+        yield home, load_session_state_from_disk(home / SESSIONS_DIR / session_id)
+
+
+@pytest.fixture
+def history_session(
+    _history_home_template, tmp_path, monkeypatch
+) -> Iterator[tuple[Path, SessionState]]:
+    """Like ``planloop_session``, but with history enabled and the session's git repo set up.
+
+    Copying the template repo avoids a ``git init`` and initial commit per test.
+    """
+    template, session_id = _history_home_template
+    home = tmp_path / "home"
+    shutil.copytree(template, home, symlinks=True)
+    with _fresh_config(monkeypatch, home):
+        yield home, load_session_state_from_disk(home / SESSIONS_DIR / session_id)
+
+
+class FakeSessionStore:
+    """Dict-backed stand-in for the session registry (index.json)."""
+
+    def __init__(self) -> None:
+        self.entries: dict[str, SessionSummary] = {}
+
+    def load_registry(self) -> list[SessionSummary]:
+        return list(self.entries.values())
+
+    def save_registry(self, entries: list[SessionSummary]) -> None:
+        self.entries = {entry.session: entry for entry in entries}
+
+    def create(self, name: str, title: str, project_root: Path = Path("/repo")) -> SessionState:
+        """Build a new session and register it without writing anything to disk."""
+        state = _initial_state(new_session_id(name), name, title, project_root)
+        update_registry_from_state(state)
+        return state
+
+
+def _install_fake_store(mp: pytest.MonkeyPatch, home: Path) -> FakeSessionStore:
+    store = FakeSessionStore()
+    # Anything that still reaches for the home directory lands in a temp dir
+    mp.setenv("PLANLOOP_HOME", str(home))
+    mp.setattr(registry, "load_registry", store.load_registry)
+    mp.setattr(registry, "save_registry", store.save_registry)
+    return store
+
+
+@pytest.fixture
+def fake_session_store(tmp_path, monkeypatch) -> FakeSessionStore:
+    """An in-memory registry for tests that only read session summaries.
+
+    Commands that load state.json still need a real session; use
+    ``planloop_session`` for those.
+    """
+    return _install_fake_store(monkeypatch, tmp_path / "home")
+
+
+@pytest.fixture(scope="module")
+def module_session_store(tmp_path_factory) -> Iterator[FakeSessionStore]:
+    """Like ``fake_session_store``, but shared by a module's read-only tests."""
+    with pytest.MonkeyPatch.context() as mp:
+        yield _install_fake_store(mp, tmp_path_factory.mktemp("store") / "home")
@@ -9,7 +9,7 @@ from planloop.core.session import save_session_state
 from planloop.core.state import SessionState, Task, TaskStatus
 
 
-def test_status_suggests_next_task_after_completion(tmp_path, monkeypatch):
+def test_status_suggests_next_task_after_completion(tmp_path, monkeypatch, runner):
     """When a task is completed, status should suggest the next TODO task."""
     monkeypatch.setenv("PLANLOOP_HOME", str(tmp_path))
 
@@ -41,11 +41,8 @@ def test_status_suggests_next_task_after_completion(tmp_path, monkeypatch):
     save_session_state(session_dir, state)
 
     # Run status command
-    from typer.testing import CliRunner
-
     from planloop.cli import app
 
-    runner = CliRunner()
     result = runner.invoke(app, ["status", "--session", "test-continuation", "--json"])
 
     assert result.exit_code == 0
@@ -62,7 +59,7 @@ def test_status_suggests_next_task_after_completion(tmp_path, monkeypatch):
     assert "Second task" in next_action["message"]
 
 
-def test_status_suggests_planloop_suggest_when_all_done(tmp_path, monkeypatch):
+def test_status_suggests_planloop_suggest_when_all_done(tmp_path, monkeypatch, runner):
     """When all tasks are done, status should suggest running planloop suggest."""
     monkeypatch.setenv("PLANLOOP_HOME", str(tmp_path))
 
@@ -91,11 +88,8 @@ def test_status_suggests_planloop_suggest_when_all_done(tmp_path, monkeypatch):
     session_dir.mkdir(parents=True)
     save_session_state(session_dir, state)
 
-    from typer.testing import CliRunner
-
     from planloop.cli import app
 
-    runner = CliRunner()
     result = runner.invoke(app, ["status", "--session", "test-all-done", "--json"])
 
     assert result.exit_code == 0
@@ -108,7 +102,7 @@ def test_status_suggests_planloop_suggest_when_all_done(tmp_path, monkeypatch):
     assert "suggest" in next_action["message"].lower()
 
 
-def test_status_no_next_action_when_signal_blocking(tmp_path, monkeypatch):
+def test_status_no_next_action_when_signal_blocking(tmp_path, monkeypatch, runner):
     """When a signal is blocking, next_action should reflect that."""
     monkeypatch.setenv("PLANLOOP_HOME", str(tmp_path))
 
@@ -155,11 +149,8 @@ def test_status_no_next_action_when_signal_blocking(tmp_path, monkeypatch):
     session_dir.mkdir(parents=True)
     save_session_state(session_dir, state)
 
-    from typer.testing import CliRunner
-
     from planloop.cli import app
 
-    runner = CliRunner()
     result = runner.invoke(app, ["status", "--session", "test-blocked", "--json"])
 
     assert result.exit_code == 0
@@ -172,7 +163,7 @@ def test_status_no_next_action_when_signal_blocking(tmp_path, monkeypatch):
     assert "S1" in next_action.get("signal_id", "")
 
 
-def test_status_includes_next_action_always(tmp_path, monkeypatch):
+def test_status_includes_next_action_always(tmp_path, monkeypatch, runner):
     """Status always includes next_action field for agent guidance."""
     monkeypatch.setenv("PLANLOOP_HOME", str(tmp_path))
 
@@ -202,11 +193,8 @@ def test_status_includes_next_action_always(tmp_path, monkeypatch):
     session_dir.mkdir(parents=True)
     save_session_state(session_dir, state)
 
-    from typer.testing import CliRunner
-
     from planloop.cli import app
 
-    runner = CliRunner()
     result = runner.invoke(app, ["status", "--session", "test-next-action", "--json"])
 
     assert result.exit_code == 0
@@ -129,7 +129,7 @@ def test_read_transcript_nonexistent(tmp_path):
     assert entries == []
 
 
-def test_logs_command_integration(tmp_path, monkeypatch):
+def test_logs_command_integration(tmp_path, monkeypatch, runner):
     """Test the logs CLI command."""
     monkeypatch.setenv("PLANLOOP_HOME", str(tmp_path))
 
@@ -159,11 +159,8 @@ def test_logs_command_integration(tmp_path, monkeypatch):
     log_agent_command(session_dir, "status", {}, "copilot")
     log_agent_response(session_dir, "status", True, {"reason": "idle"})
 
-    from typer.testing import CliRunner
-
     from planloop.cli import app
 
-    runner = CliRunner()
     result = runner.invoke(app, ["logs", "--session", "test-logs", "--json"])
 
     assert result.exit_code == 0
@@ -3,20 +3,26 @@
 Following TDD approach - tests written first to define expected behavior.
 """
 
+import subprocess
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta
 
+from planloop.diagnostics.bash_health import BashHealthMonitor
+
+
+@pytest.fixture(scope="module")
+def monitor():
+    """One monitor shared by the module; BashHealthMonitor is stateless."""
+    return BashHealthMonitor()
+
 
 class TestBashHealthMonitor:
     """Test suite for BashHealthMonitor class."""
 
-    def test_calculate_health_score_healthy_session(self):
+    def test_calculate_health_score_healthy_session(self, monitor):
         """Test health score calculation for healthy session (80-100)."""
-        from planloop.diagnostics.bash_health import BashHealthMonitor
-        
-        monitor = BashHealthMonitor()
-        
         # Healthy session: low command count, few PTYs, recent
         metrics = {
             "command_count": 10,
@@ -29,12 +35,8 @@ class TestBashHealthMonitor:
         
         assert 80 <= score <= 100, f"Healthy session should score 80-100, got {score}"
 
-    def test_calculate_health_score_degraded_session(self):
+    def test_calculate_health_score_degraded_session(self, monitor):
         """Test health score calculation for degraded session (40-59)."""
-        from planloop.diagnostics.bash_health import BashHealthMonitor
-        
-        monitor = BashHealthMonitor()
-        
         # Degraded session: high command count, elevated PTYs
         metrics = {
             "command_count": 38,
@@ -47,12 +49,8 @@ class TestBashHealthMonitor:
         
         assert 40 <= score <= 59, f"Degraded session should score 40-59, got {score}"
 
-    def test_calculate_health_score_critical_session(self):
+    def test_calculate_health_score_critical_session(self, monitor):
         """Test health score calculation for critical session (20-39)."""
-        from planloop.diagnostics.bash_health import BashHealthMonitor
-        
-        monitor = BashHealthMonitor()
-        
         # Critical session: high command count, many PTYs, old
         # Penalties: 30 (command) + 40 (pty) + 10 (age) = 80 total
         # Score: 100 - 80 = 20 (bottom of critical range)
@@ -67,12 +65,8 @@ class TestBashHealthMonitor:
         
         assert 20 <= score <= 39, f"Critical session should score 20-39, got {score}"
 
-    def test_calculate_health_score_with_recent_error(self):
+    def test_calculate_health_score_with_recent_error(self, monitor):
         """Test that recent errors reduce health score."""
-        from planloop.diagnostics.bash_health import BashHealthMonitor
-        
-        monitor = BashHealthMonitor()
-        
         # Session with recent error should score lower
         metrics_no_error = {
             "command_count": 25,
@@ -97,68 +91,70 @@ class TestBashHealthMonitor:
         assert score_with_error < score_no_error, "Recent error should reduce score"
         assert score_no_error - score_with_error >= 10, "Error penalty should be at least 10 points"
 
-    @patch('subprocess.run')
-    def test_count_ptys_using_lsof(self, mock_run):
+    def test_calculate_health_score_threshold_boundaries(self, monitor):
+        """Test that penalties apply only once a metric exceeds its threshold."""
+        # Exactly at every threshold: no penalty yet
+        at_threshold = {"command_count": 20, "pty_count": 4, "age_minutes": 40}
+        assert monitor.calculate_health_score(at_threshold) == 100
+
+        # One past every threshold: medium penalties (10 + 15 + 10)
+        past_threshold = {"command_count": 21, "pty_count": 5, "age_minutes": 41}
+        assert monitor.calculate_health_score(past_threshold) == 65
+
+        # Past every critical threshold: maximum penalties (30 + 40 + 20)
+        critical = {"command_count": 51, "pty_count": 11, "age_minutes": 61}
+        assert monitor.calculate_health_score(critical) == 10
+
+    def test_count_ptys_using_lsof(self, monkeypatch, monitor):
         """Test PTY counting using lsof command."""
-        from planloop.diagnostics.bash_health import BashHealthMonitor
-        
-        # Mock lsof output
-        mock_run.return_value = Mock(
-            stdout="/dev/pts/0\n/dev/pts/1\n/dev/pts/2\n",
-            returncode=0
-        )
-        
-        monitor = BashHealthMonitor()
+        calls = []
+
+        def fake_run(args, **kwargs):
+            calls.append(args)
+            return subprocess.CompletedProcess(
+                args, 0, stdout="/dev/pts/0\n/dev/pts/1\n/dev/pts/2\n", stderr=""
+            )
+
+        monkeypatch.setattr(subprocess, "run", fake_run)
+
         pty_count = monitor.count_ptys(pid=12345)
-        
+
         assert pty_count == 3, f"Should count 3 PTYs, got {pty_count}"
-        mock_run.assert_called_once()
+        assert calls == [["lsof", "-p", "12345"]]
 
-    @patch('subprocess.run')
-    def test_count_ptys_handles_missing_lsof(self, mock_run):
+    def test_count_ptys_handles_missing_lsof(self, monkeypatch, monitor):
         """Test graceful handling when lsof is not available."""
-        from planloop.diagnostics.bash_health import BashHealthMonitor
-        
-        # Mock lsof not found
-        mock_run.side_effect = FileNotFoundError("lsof not found")
-        
-        monitor = BashHealthMonitor()
+        def missing_lsof(args, **kwargs):
+            raise FileNotFoundError("lsof not found")
+
+        monkeypatch.setattr(subprocess, "run", missing_lsof)
+
         pty_count = monitor.count_ptys(pid=12345)
-        
+
         assert pty_count == 0, "Should return 0 when lsof not available"
 
     @patch('os.listdir')
-    def test_count_fds_from_proc(self, mock_listdir):
+    def test_count_fds_from_proc(self, mock_listdir, monitor):
         """Test file descriptor counting from /proc."""
-        from planloop.diagnostics.bash_health import BashHealthMonitor
-        
         # Mock /proc/<pid>/fd directory listing
         mock_listdir.return_value = ['0', '1', '2', '3', '4', '5']
         
-        monitor = BashHealthMonitor()
         fd_count = monitor.count_fds(pid=12345)
         
         assert fd_count == 6, f"Should count 6 FDs, got {fd_count}"
 
     @patch('os.listdir')
-    def test_count_fds_handles_missing_proc(self, mock_listdir):
+    def test_count_fds_handles_missing_proc(self, mock_listdir, monitor):
         """Test graceful handling when /proc is not available (macOS)."""
-        from planloop.diagnostics.bash_health import BashHealthMonitor
-        
         # Mock /proc not available
         mock_listdir.side_effect = FileNotFoundError("/proc not found")
         
-        monitor = BashHealthMonitor()
         fd_count = monitor.count_fds(pid=12345)
         
         assert fd_count == 0, "Should return 0 when /proc not available"
 
-    def test_get_recommendations_for_healthy_session(self):
+    def test_get_recommendations_for_healthy_session(self, monitor):
         """Test recommendations for healthy session."""
-        from planloop.diagnostics.bash_health import BashHealthMonitor
-        
-        monitor = BashHealthMonitor()
-        
         recommendations = monitor.get_recommendations(
             health_score=90,
             metrics={
@@ -173,12 +169,8 @@ class TestBashHealthMonitor:
         assert any("healthy" in rec.lower() or "good" in rec.lower() 
                   for rec in recommendations), "Should acknowledge healthy state"
 
-    def test_get_recommendations_for_degraded_session(self):
+    def test_get_recommendations_for_degraded_session(self, monitor):
         """Test recommendations for degraded session."""
-        from planloop.diagnostics.bash_health import BashHealthMonitor
-        
-        monitor = BashHealthMonitor()
-        
         recommendations = monitor.get_recommendations(
             health_score=50,
             metrics={
@@ -193,12 +185,8 @@ class TestBashHealthMonitor:
         assert any("rotate" in rec.lower() for rec in recommendations), \
             "Should recommend rotation for degraded session"
 
-    def test_get_recommendations_for_critical_session(self):
+    def test_get_recommendations_for_critical_session(self, monitor):
         """Test recommendations for critical session."""
-        from planloop.diagnostics.bash_health import BashHealthMonitor
-        
-        monitor = BashHealthMonitor()
-        
         recommendations = monitor.get_recommendations(
             health_score=30,
             metrics={
@@ -216,66 +204,36 @@ class TestBashHealthMonitor:
         assert any("rotate" in rec.lower() for rec in recommendations), \
             "Should definitely recommend rotation"
 
-    def test_status_classification_healthy(self):
-        """Test status classification for healthy score."""
-        from planloop.diagnostics.bash_health import BashHealthMonitor
-        
-        monitor = BashHealthMonitor()
-        
-        assert monitor.classify_status(85) == "healthy"
-        assert monitor.classify_status(100) == "healthy"
-        assert monitor.classify_status(80) == "healthy"
-
-    def test_status_classification_watch(self):
-        """Test status classification for watch score."""
-        from planloop.diagnostics.bash_health import BashHealthMonitor
-        
-        monitor = BashHealthMonitor()
-        
-        assert monitor.classify_status(70) == "watch"
-        assert monitor.classify_status(79) == "watch"
-        assert monitor.classify_status(60) == "watch"
-
-    def test_status_classification_degraded(self):
-        """Test status classification for degraded score."""
-        from planloop.diagnostics.bash_health import BashHealthMonitor
-        
-        monitor = BashHealthMonitor()
-        
-        assert monitor.classify_status(50) == "degraded"
-        assert monitor.classify_status(59) == "degraded"
-        assert monitor.classify_status(40) == "degraded"
-
-    def test_status_classification_critical(self):
-        """Test status classification for critical score."""
-        from planloop.diagnostics.bash_health import BashHealthMonitor
-        
-        monitor = BashHealthMonitor()
-        
-        assert monitor.classify_status(30) == "critical"
-        assert monitor.classify_status(39) == "critical"
-        assert monitor.classify_status(20) == "critical"
-
-    def test_status_classification_failed(self):
-        """Test status classification for failed score."""
-        from planloop.diagnostics.bash_health import BashHealthMonitor
-        
-        monitor = BashHealthMonitor()
-        
-        assert monitor.classify_status(10) == "failed"
-        assert monitor.classify_status(19) == "failed"
-        assert monitor.classify_status(0) == "failed"
+    @pytest.mark.parametrize(
+        "score,expected",
+        [
+            (85, "healthy"),
+            (100, "healthy"),
+            (80, "healthy"),
+            (70, "watch"),
+            (79, "watch"),
+            (60, "watch"),
+            (50, "degraded"),
+            (59, "degraded"),
+            (40, "degraded"),
+            (30, "critical"),
+            (39, "critical"),
+            (20, "critical"),
+            (10, "failed"),
+            (19, "failed"),
+            (0, "failed"),
+        ],
+    )
+    def test_status_classification(self, monitor, score, expected):
+        """Test status classification across every score band."""
+        assert monitor.classify_status(score) == expected
 
 
 class TestHealthMetricsIntegration:
     """Integration tests for health metrics collection."""
 
-    def test_check_health_returns_complete_report(self):
+    def test_check_health_returns_complete_report(self, monitor):
         """Test that check_health returns all required fields."""
-        from planloop.diagnostics.bash_health import BashHealthMonitor
-        
-        monitor = BashHealthMonitor()
-        
         # Mock environment
         with patch.object(monitor, 'get_current_session_pid', return_value=12345), \
              patch.object(monitor, 'count_ptys', return_value=3), \
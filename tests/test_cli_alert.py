@@ -1,31 +1,13 @@
 """Tests for planloop alert command."""
 from __future__ import annotations
 
-from pathlib import Path
+from ._json_helpers import assert_state_contains
 
-from typer.testing import CliRunner
 
-from planloop import cli
-from planloop.core.session import create_session, save_session_state
+def test_alert_opens_signal(planloop_session, cli_invoke):
+    home, state = planloop_session
 
-runner = CliRunner()
-
-
-def setup_session(tmp_path: Path):
-    home = tmp_path / "home"
-    home.mkdir()
-    (home / "sessions").mkdir()
-    return home
-
-
-def test_alert_opens_signal(monkeypatch, tmp_path):
-    home = setup_session(tmp_path)
-    monkeypatch.setenv("PLANLOOP_HOME", str(home))
-    state = create_session("Test", "Demo", project_root=Path("/repo"))
-    save_session_state(home / "sessions" / state.session, state, message="setup")
-
-    result = runner.invoke(
-        cli.app,
+    result = cli_invoke(
         [
             "alert",
             "--session",
@@ -41,19 +23,13 @@ def test_alert_opens_signal(monkeypatch, tmp_path):
         ],
     )
     assert result.exit_code == 0
-    saved = (home / "sessions" / state.session / "state.json").read_text()
-    assert "ci-1" in saved
+    assert_state_contains(home / "sessions" / state.session, b"ci-1")
 
 
-def test_alert_close(monkeypatch, tmp_path):
-    home = setup_session(tmp_path)
-    monkeypatch.setenv("PLANLOOP_HOME", str(home))
-    state = create_session("Test", "Demo", project_root=Path("/repo"))
-    state.signals = []
-    save_session_state(home / "sessions" / state.session, state, message="setup")
+def test_alert_close(planloop_session, cli_invoke):
+    home, state = planloop_session
 
-    runner.invoke(
-        cli.app,
+    cli_invoke(
         [
             "alert",
             "--session",
@@ -68,8 +44,7 @@ def test_alert_close(monkeypatch, tmp_path):
             "Tests failing",
         ],
     )
-    result = runner.invoke(
-        cli.app,
+    result = cli_invoke(
         [
             "alert",
             "--session",
@@ -86,5 +61,4 @@ def test_alert_close(monkeypatch, tmp_path):
         ],
     )
     assert result.exit_code == 0
-    saved = (home / "sessions" / state.session / "state.json").read_text()
-    assert '"open": false' in saved
+    assert_state_contains(home / "sessions" / state.session, b'"open": false')
@@ -1,84 +1,33 @@
-"""End-to-end CLI loop integration test."""
+"""End-to-end CLI loop integration test, one test per step."""
 from __future__ import annotations
 
-import json
+import shutil
+from dataclasses import dataclass
 from pathlib import Path
 
-from typer.testing import CliRunner
+import pytest
 
-from planloop import cli
-from planloop.core.session import create_session, load_session_state_from_disk
+from planloop.core.session import load_session_state_from_disk
 from planloop.home import SESSIONS_DIR
 
-runner = CliRunner()
+from ._json_helpers import dumps, parse_json
 
 
-def _set_planloop_home(monkeypatch, tmp_path) -> Path:
-    home = tmp_path / "home"
-    monkeypatch.setenv("PLANLOOP_HOME", str(home))
-    return home
-
-
-def _run_status(session_id: str) -> dict:
-    result = runner.invoke(cli.app, ["status", "--session", session_id])
+def _run_status(cli_invoke, session_id: str) -> dict:
+    result = cli_invoke(["status", "--session", session_id])
     assert result.exit_code == 0, result.stdout
-    return json.loads(result.stdout)
+    return parse_json(result.stdout_bytes)
 
 
-def _run_update(payload: dict) -> int:
-    result = runner.invoke(cli.app, ["update"], input=json.dumps(payload))
+def _run_update(cli_invoke, payload: dict) -> int:
+    result = cli_invoke(["update"], input=dumps(payload))
     assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = parse_json(result.stdout_bytes)
     return data["version"]
 
 
-def test_cli_loop_status_update_alert(monkeypatch, tmp_path):
-    home = _set_planloop_home(monkeypatch, tmp_path)
-    state = create_session("Loop", "Integration", project_root=Path("/repo"))
-    session_id = state.session
-    session_dir = home / SESSIONS_DIR / session_id
-
-    status = _run_status(session_id)
-    assert status["session"] == session_id
-    assert status["tasks"] == []
-
-    payload_add = {
-        "session": session_id,
-        "last_seen_version": str(state.version),
-        "add_tasks": [
-            {"title": "Bootstrap CLI", "type": "feature"},
-            {"title": "Write tests", "type": "test"},
-        ],
-        "context_notes": ["Initial plan"],
-        "next_steps": ["Run status before coding"],
-    }
-    version = _run_update(payload_add)
-
-    saved = load_session_state_from_disk(session_dir)
-    assert len(saved.tasks) == 2
-    assert saved.context_notes == ["Initial plan"]
-
-    status = _run_status(session_id)
-    assert status["now"]["reason"] == "task"
-    assert status["now"]["task_id"] == 1
-
-    payload_progress = {
-        "session": session_id,
-        "last_seen_version": str(version),
-        "tasks": [
-            {"id": 1, "status": "DONE"},
-            {"id": 2, "status": "IN_PROGRESS"},
-        ],
-        "context_notes": ["Task 1 done"],
-    }
-    version = _run_update(payload_progress)
-
-    status = _run_status(session_id)
-    assert status["tasks"][0]["status"] == "DONE"
-    assert status["now"]["task_id"] == 2
-
-    result = runner.invoke(
-        cli.app,
+def _alert(cli_invoke, session_id: str, *extra: str):
+    return cli_invoke(
         [
             "alert",
             "--session",
@@ -91,48 +40,106 @@ def test_cli_loop_status_update_alert(monkeypatch, tmp_path):
             "CI failing",
             "--message",
             "Fix tests",
+            *extra,
         ],
     )
-    assert result.exit_code == 0
 
-    blocked = _run_status(session_id)
-    assert blocked["now"]["reason"] == "ci_blocker"
-    assert any(sig["open"] for sig in blocked["signals"])
 
-    result = runner.invoke(
-        cli.app,
-        [
-            "alert",
-            "--session",
-            session_id,
-            "--id",
-            "ci-loop",
-            "--kind",
-            "build",
-            "--title",
-            "CI failing",
-            "--message",
-            "Fix tests",
-            "--close",
-        ],
-    )
-    assert result.exit_code == 0
-
-    status = _run_status(session_id)
-    assert status["now"]["reason"] == "task"
+@dataclass
+class LoopContext:
+    session_dir: Path
+    session_id: str
+    version: int
 
-    payload_complete = {
-        "session": session_id,
-        "last_seen_version": str(version),
-        "tasks": [
-            {"id": 2, "status": "DONE"},
-        ],
-        "final_summary": "Loop wrapped",
-    }
-    _ = _run_update(payload_complete)
-
-    final_status = _run_status(session_id)
-    assert final_status["now"]["reason"] == "completed"
 
-    final_state = load_session_state_from_disk(session_dir)
-    assert final_state.final_summary == "Loop wrapped"
+@pytest.fixture(scope="class")
+def loop_ctx(_session_home_template, tmp_path_factory):
+    """One session that the TestLoopFlow steps advance in order."""
+    template, session_id = _session_home_template
+    home = tmp_path_factory.mktemp("loop") / "home"
+    shutil.copytree(template, home)
+    session_dir = home / SESSIONS_DIR / session_id
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("PLANLOOP_HOME", str(home))
+        state = load_session_state_from_disk(session_dir)
+        yield LoopContext(session_dir, session_id, state.version)
+
+
+class TestLoopFlow:
+    """Steps run in definition order and share the loop_ctx session."""
+
+    def test_01_initial_status(self, loop_ctx, cli_invoke):
+        status = _run_status(cli_invoke, loop_ctx.session_id)
+        assert status["session"] == loop_ctx.session_id
+        assert status["tasks"] == []
+
+    def test_02_add_tasks(self, loop_ctx, cli_invoke):
+        payload_add = {
+            "session": loop_ctx.session_id,
+            "last_seen_version": str(loop_ctx.version),
+            "add_tasks": [
+                {"title": "Bootstrap CLI", "type": "feature"},
+                {"title": "Write tests", "type": "test"},
+            ],
+            "context_notes": ["Initial plan"],
+            "next_steps": ["Run status before coding"],
+        }
+        loop_ctx.version = _run_update(cli_invoke, payload_add)
+
+        saved = load_session_state_from_disk(loop_ctx.session_dir)
+        assert len(saved.tasks) == 2
+        assert saved.context_notes == ["Initial plan"]
+
+    def test_03_first_task_is_next(self, loop_ctx, cli_invoke):
+        status = _run_status(cli_invoke, loop_ctx.session_id)
+        assert status["now"]["reason"] == "task"
+        assert status["now"]["task_id"] == 1
+
+    def test_04_progress(self, loop_ctx, cli_invoke):
+        payload_progress = {
+            "session": loop_ctx.session_id,
+            "last_seen_version": str(loop_ctx.version),
+            "tasks": [
+                {"id": 1, "status": "DONE"},
+                {"id": 2, "status": "IN_PROGRESS"},
+            ],
+            "context_notes": ["Task 1 done"],
+        }
+        loop_ctx.version = _run_update(cli_invoke, payload_progress)
+
+        status = _run_status(cli_invoke, loop_ctx.session_id)
+        assert status["tasks"][0]["status"] == "DONE"
+        assert status["now"]["task_id"] == 2
+
+    def test_05_alert_blocks(self, loop_ctx, cli_invoke):
+        result = _alert(cli_invoke, loop_ctx.session_id)
+        assert result.exit_code == 0
+
+        blocked = _run_status(cli_invoke, loop_ctx.session_id)
+        assert blocked["now"]["reason"] == "ci_blocker"
+        assert any(sig["open"] for sig in blocked["signals"])
+
+    def test_06_close_alert_unblocks(self, loop_ctx, cli_invoke):
+        result = _alert(cli_invoke, loop_ctx.session_id, "--close")
+        assert result.exit_code == 0
+
+        status = _run_status(cli_invoke, loop_ctx.session_id)
+        assert status["now"]["reason"] == "task"
+
+    def test_07_complete(self, loop_ctx, cli_invoke):
+        payload_complete = {
+            "session": loop_ctx.session_id,
+            "last_seen_version": str(loop_ctx.version),
+            "tasks": [
+                {"id": 2, "status": "DONE"},
+            ],
+            "final_summary": "Loop wrapped",
+        }
+        loop_ctx.version = _run_update(cli_invoke, payload_complete)
+
+        final_status = _run_status(cli_invoke, loop_ctx.session_id)
+        assert final_status["now"]["reason"] == "completed"
+
+    def test_08_final_summary_saved(self, loop_ctx):
+        final_state = load_session_state_from_disk(loop_ctx.session_dir)
+        assert final_state.final_summary == "Loop wrapped"
@@ -1,18 +1,34 @@
 """Tests for planloop selftest command."""
 from __future__ import annotations
 
-import json
+import pytest
 
-from typer.testing import CliRunner
+from planloop import logging_utils
+from planloop.core.selftest import _SCENARIOS, run_selftest
 
-from planloop import cli
 
-runner = CliRunner()
+def test_selftest_runs_successfully(run_cli):
+    # One scenario is enough to check the command end-to-end
+    payload = run_cli("selftest", "--json", "--scenario", "clean_run")
+    assert payload["status"] == "ok"
+    assert [scenario["name"] for scenario in payload["scenarios"]] == ["clean_run"]
 
 
-def test_selftest_runs_successfully():
-    result = runner.invoke(cli.app, ["selftest", "--json"])
-    assert result.exit_code == 0, result.stdout
-    payload = json.loads(result.stdout)
-    assert payload["status"] == "ok"
-    assert payload["scenarios"], "Expected at least one scenario"
+def test_selftest_rejects_unknown_scenario(cli_invoke):
+    result = cli_invoke(["selftest", "--scenario", "nope"])
+    assert result.exit_code == 1
+    assert "Unknown scenario" in result.stderr
+
+
+@pytest.mark.parametrize("name", [name for name, _ in _SCENARIOS])
+def test_selftest_scenario_passes(name):
+    # The CLI test above only runs clean_run; exercise every scenario directly
+    results = run_selftest([name])
+    assert [(result.name, result.passed) for result in results] == [(name, True)]
+
+
+def test_selftest_releases_session_logs():
+    before = set(logging_utils._SESSION_HANDLERS)
+    run_selftest(["clean_run"])
+    # Handlers for the deleted temporary sessions must not linger
+    assert set(logging_utils._SESSION_HANDLERS) == before
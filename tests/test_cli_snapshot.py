@@ -1,57 +1,66 @@
 """Tests for snapshot and restore commands."""
 from __future__ import annotations
 
-import json
 import shutil
 from pathlib import Path
 
 import pytest
-import yaml
-from typer.testing import CliRunner
 
-from planloop import cli
-from planloop.config import reset_config_cache
-from planloop.core.session import create_session
-from planloop.home import initialize_home
+from ._json_helpers import parse_json
 
-pytestmark = pytest.mark.skipif(
+requires_git = pytest.mark.skipif(
     shutil.which("git") is None,
     reason="git is required for history snapshots",
 )
 
-runner = CliRunner()
 
-
-def enable_history(home: Path) -> None:
-    config_path = home / "config.yml"
-    cfg = yaml.safe_load(config_path.read_text())
-    cfg.setdefault("history", {})["enabled"] = True
-    config_path.write_text(yaml.safe_dump(cfg))
-    reset_config_cache()
-
-
-def test_snapshot_and_restore(monkeypatch, tmp_path):
-    home = tmp_path / "home"
-    home.mkdir()
-    monkeypatch.setenv("PLANLOOP_HOME", str(home))
-    initialize_home()
-    enable_history(home)
-
-    state = create_session("Snap", "Snapshot Test", project_root=Path("/repo"))
+@requires_git
+def test_snapshot_and_restore(history_session, cli_invoke):
+    home, state = history_session
     session_dir = home / "sessions" / state.session
     gitignore = session_dir / ".gitignore"
     assert gitignore.exists()
 
-    result = runner.invoke(cli.app, ["snapshot", "--session", state.session])
+    result = cli_invoke(["snapshot", "--session", state.session])
     assert result.exit_code == 0
-    sha = json.loads(result.stdout)["snapshot"]
+    sha = parse_json(result.stdout_bytes)["snapshot"]
 
     state_path = session_dir / "state.json"
     content = state_path.read_text().replace("Snapshot Test", "Changed")
     state_path.write_text(content)
 
-    result = runner.invoke(cli.app, ["restore", sha, "--session", state.session])
+    result = cli_invoke(["restore", sha, "--session", state.session])
     assert result.exit_code == 0
     assert "restored" in result.stdout
     restored = state_path.read_text()
     assert "Snapshot Test" in restored
+
+
+def test_snapshot_and_restore_cli_path(planloop_session, monkeypatch, cli_invoke):
+    """The snapshot/restore commands, with an in-memory store standing in for git."""
+    home, state = planloop_session
+    snapshots: dict[str, str] = {}
+
+    def fake_create_snapshot(session_dir: Path, note: str) -> str:
+        sha = f"{len(snapshots) + 1:040x}"
+        snapshots[sha] = (session_dir / "state.json").read_text()
+        return sha
+
+    def fake_restore_snapshot(session_dir: Path, ref: str) -> None:
+        (session_dir / "state.json").write_text(snapshots[ref])
+
+    monkeypatch.setattr("planloop.cli.create_snapshot", fake_create_snapshot)
+    monkeypatch.setattr("planloop.cli.restore_snapshot", fake_restore_snapshot)
+
+    result = cli_invoke(["snapshot", "--session", state.session])
+    assert result.exit_code == 0
+    sha = parse_json(result.stdout_bytes)["snapshot"]
+    assert sha in snapshots
+
+    state_path = home / "sessions" / state.session / "state.json"
+    state_path.write_text(state_path.read_text().replace(state.title, "Changed"))
+
+    result = cli_invoke(["restore", sha, "--session", state.session])
+    assert result.exit_code == 0
+    assert "restored" in result.stdout
+    assert state.title in state_path.read_text()
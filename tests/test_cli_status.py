@@ -1,97 +1,89 @@
 """Integration tests for planloop status command."""
 from __future__ import annotations
 
-import json
 import time
 from pathlib import Path
 
-import yaml
-from typer.testing import CliRunner
+import pytest
 
-from planloop import cli
-from planloop.config import reset_config_cache
-from planloop.core.session import create_session
+from planloop.cli import _status_payload
+from planloop.core.state import SessionState
+from planloop.home import SESSIONS_DIR
 
-runner = CliRunner()
+from ._config_helpers import set_safe_mode
+from ._json_helpers import parse_json, write_json
 
+# Fixed so the queue entry is reproducible; status is evaluated just after it
+QUEUED_AT = 1_700_000_000.0
 
-def bootstrap_session(tmp_path: Path) -> str:
-    home = tmp_path / "home"
-    home.mkdir()
-    (home / "sessions").mkdir()
-    return str(home)
 
+# Setup steps for test_status_reports; each returns the agent name to report for
 
-def set_safe_mode(home: Path, **kwargs) -> None:
-    config_path = home / "config.yml"
-    cfg = yaml.safe_load(config_path.read_text()) or {}
-    update_cfg = cfg.setdefault("safe_modes", {}).setdefault("update", {})
-    update_cfg.update(kwargs)
-    config_path.write_text(yaml.safe_dump(cfg))
-    reset_config_cache()
+def _enable_dry_run(home: Path, state: SessionState) -> str | None:
+    set_safe_mode(dry_run=True)
+    return None
 
 
-def test_status_requires_session(monkeypatch, tmp_path):
-    monkeypatch.setenv("PLANLOOP_HOME", str(tmp_path / "home"))
-    result = runner.invoke(cli.app, ["status"])
-    assert result.exit_code != 0
+def _write_queue_entry(home: Path, state: SessionState, requested_at: float) -> str:
+    queue_dir = home / SESSIONS_DIR / state.session / ".lock_queue"
+    queue_dir.mkdir(parents=True, exist_ok=True)
+    write_json(
+        queue_dir / "entry.json",
+        {
+            "id": "entry",
+            "agent": "agent-test",
+            "operation": "update",
+            "requested_at": requested_at,
+        },
+    )
+    return "agent-test"
 
 
-def test_status_json_output(monkeypatch, tmp_path):
-    home = tmp_path / "home"
-    monkeypatch.setenv("PLANLOOP_HOME", str(home))
-    state = create_session("Test", "title", project_root=Path("/repo"))
-    result = runner.invoke(cli.app, ["status", "--session", state.session])
-    assert result.exit_code == 0
-    data = json.loads(result.stdout)
-    assert data["session"] == state.session
-    assert "tasks" in data
+def _queue_agent(home: Path, state: SessionState) -> str | None:
+    return _write_queue_entry(home, state, QUEUED_AT)
 
 
-def test_status_includes_safe_mode_defaults(monkeypatch, tmp_path):
-    home = tmp_path / "home"
-    monkeypatch.setenv("PLANLOOP_HOME", str(home))
-    state = create_session("Test", "title", project_root=Path("/repo"))
-    set_safe_mode(home, dry_run=True)
-    result = runner.invoke(cli.app, ["status", "--session", state.session])
-    assert result.exit_code == 0
-    data = json.loads(result.stdout)
-    assert data["safe_mode_defaults"]["dry_run"] is True
-    reset_config_cache()
+def test_status_requires_session(planloop_home, cli_invoke):
+    result = cli_invoke(["status"])
+    assert result.exit_code != 0
 
 
-def test_status_includes_lock_queue(monkeypatch, tmp_path):
-    home = tmp_path / "home"
-    monkeypatch.setenv("PLANLOOP_HOME", str(home))
-    state = create_session("Test", "title", project_root=Path("/repo"))
-    result = runner.invoke(cli.app, ["status", "--session", state.session])
+def test_status_json_output(planloop_session, cli_invoke):
+    home, state = planloop_session
+    result = cli_invoke(["status", "--session", state.session])
     assert result.exit_code == 0
-    data = json.loads(result.stdout)
-    queue = data["lock_queue"]
-    assert queue["pending"] == []
-    assert queue["position"] is None
+    data = parse_json(result.stdout_bytes)
+    assert data["session"] == state.session
+    assert data["tasks"] == []
 
 
-def test_status_reports_queue_position(monkeypatch, tmp_path):
-    home = tmp_path / "home"
-    monkeypatch.setenv("PLANLOOP_HOME", str(home))
-    state = create_session("Test", "title", project_root=Path("/repo"))
-    queue_dir = home / "sessions" / state.session / ".lock_queue"
-    queue_dir.mkdir(parents=True, exist_ok=True)
-    entry = queue_dir / "entry.json"
-    entry.write_text(
-        json.dumps(
-            {
-                "id": "entry",
-                "agent": "agent-test",
-                "operation": "update",
-                "requested_at": time.time(),
-            }
-        ),
-        encoding="utf-8",
-    )
-    monkeypatch.setenv("PLANLOOP_AGENT_NAME", "agent-test")
-    result = runner.invoke(cli.app, ["status", "--session", state.session])
+def test_status_reports_queue_position_for_agent(planloop_session, cli_invoke, monkeypatch):
+    """The CLI reads the agent name from PLANLOOP_AGENT_NAME."""
+    home, state = planloop_session
+    # The CLI judges staleness by the real clock, so queue the entry now
+    monkeypatch.setenv("PLANLOOP_AGENT_NAME", _write_queue_entry(home, state, time.time()))
+    result = cli_invoke(["status", "--session", state.session])
     assert result.exit_code == 0
-    data = json.loads(result.stdout)
-    assert data["lock_queue"]["position"] == 1
+    assert parse_json(result.stdout_bytes)["lock_queue"]["position"] == 1
+
+
+@pytest.mark.parametrize(
+    "mutate,keys,expected",
+    [
+        (_enable_dry_run, ("safe_mode_defaults", "dry_run"), True),
+        (None, ("lock_queue",), {"pending": [], "position": None}),
+        (_queue_agent, ("lock_queue", "position"), 1),
+    ],
+    ids=["safe-mode-defaults", "lock-queue", "queue-position"],
+)
+def test_status_reports(planloop_session, mutate, keys, expected):
+    """Each variant tweaks the copied session, then checks one field of the status payload."""
+    home, state = planloop_session
+    agent_name = mutate(home, state) if mutate is not None else None
+    session_dir = home / SESSIONS_DIR / state.session
+    data = _status_payload(state, session_dir, agent_name, queue_now=QUEUED_AT + 1)
+    assert data["session"] == state.session
+    value = data
+    for key in keys:
+        value = value[key]
+    assert value == expected
@@ -1,25 +1,26 @@
 """Tests for suggest CLI command."""
 from __future__ import annotations
 
+from datetime import datetime
 from unittest.mock import Mock, patch
 
 import pytest
-from typer.testing import CliRunner
 
-from planloop.cli import app
-from planloop.core.state import TaskType
+from planloop.cli import _suggest_impl, app
+from planloop.core.state import (
+    Environment,
+    Now,
+    NowReason,
+    PromptMetadata,
+    SessionState,
+    TaskType,
+)
 from planloop.core.suggest import TaskSuggestion
 
 
-@pytest.fixture
-def runner():
-    """CLI test runner."""
-    return CliRunner()
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_suggestions():
-    """Mock task suggestions."""
+    """Mock task suggestions; shared by the module, so tests must not mutate them."""
     return [
         TaskSuggestion(
             title="Add error handling",
@@ -42,6 +43,38 @@ def mock_suggestions():
     ]
 
 
+# Validated once; tests get cheap copies pointing at their own tmp_path
+_TEMPLATE_STATE = SessionState(
+    session="test-session",
+    name="Test",
+    title="Test",
+    purpose="Testing",
+    created_at=datetime.now(),
+    last_updated_at=datetime.now(),
+    project_root="/repo",
+    prompts=PromptMetadata(set="default"),
+    environment=Environment(os="test"),
+    now=Now(reason=NowReason.IDLE),
+    tasks=[]
+)
+
+
+@pytest.fixture
+def mock_state(tmp_path):
+    """An in-memory session state; _suggest_impl never loads it from disk."""
+    return _TEMPLATE_STATE.model_copy(update={"project_root": str(tmp_path), "tasks": []})
+
+
+@pytest.fixture
+def mock_engine(mock_suggestions):
+    """Patch SuggestionEngine so it returns ``mock_suggestions``."""
+    with patch("planloop.cli.SuggestionEngine") as MockEngine:
+        engine = Mock()
+        engine.generate_suggestions.return_value = mock_suggestions
+        MockEngine.return_value = engine
+        yield MockEngine
+
+
 def test_suggest_command_exists(runner):
     """Suggest command should be available."""
     result = runner.invoke(app, ["--help"])
@@ -49,170 +82,66 @@ def test_suggest_command_exists(runner):
     assert "suggest" in result.stdout
 
 
-def test_suggest_dry_run_mode(runner, mock_suggestions, tmp_path):
+def test_suggest_dry_run_mode(mock_engine, mock_state, tmp_path, capsys):
     """Suggest with --dry-run should not modify state."""
-    with patch("planloop.cli.SuggestionEngine") as MockEngine:
-        mock_engine = Mock()
-        mock_engine.generate_suggestions.return_value = mock_suggestions
-        MockEngine.return_value = mock_engine
-
-        with patch("planloop.cli._load_session") as mock_load:
-                # Create a mock session state
-                from datetime import datetime
-
-                from planloop.core.state import (
-                    Environment,
-                    Now,
-                    NowReason,
-                    PromptMetadata,
-                    SessionState,
-                )
-
-                mock_state = SessionState(
-                    session="test-session",
-                    name="Test",
-                    title="Test",
-                    purpose="Testing",
-                    created_at=datetime.now(),
-                    last_updated_at=datetime.now(),
-                    project_root=str(tmp_path),
-                    prompts=PromptMetadata(set="default"),
-                    environment=Environment(os="test"),
-                    now=Now(reason=NowReason.IDLE),
-                    tasks=[]
-                )
-                mock_load.return_value = (mock_state, tmp_path)
-
-                result = runner.invoke(app, ["suggest", "--dry-run"])
-
-                assert result.exit_code == 0
-                # Should display suggestions
-                assert "Add error handling" in result.stdout
-                assert "Add tests" in result.stdout
-
-
-def test_suggest_generates_update_payload(runner, mock_suggestions, tmp_path):
+    with patch("planloop.cli.apply_update") as mock_apply:
+        _suggest_impl(mock_state, tmp_path, dry_run=True)
+
+    out = capsys.readouterr().out
+    # Should display suggestions
+    assert "Add error handling" in out
+    assert "Add tests" in out
+    assert not mock_apply.called
+
+
+def test_suggest_generates_update_payload(mock_engine, mock_state, tmp_path):
     """Suggest should generate proper update payload for approved tasks."""
-    with patch("planloop.cli.SuggestionEngine") as MockEngine:
-        mock_engine = Mock()
-        mock_engine.generate_suggestions.return_value = mock_suggestions
-        MockEngine.return_value = mock_engine
-
-        with patch("planloop.cli._load_session") as mock_load:
-                from datetime import datetime
-
-                from planloop.core.state import (
-                    Environment,
-                    Now,
-                    NowReason,
-                    PromptMetadata,
-                    SessionState,
-                )
-
-                mock_state = SessionState(
-                    session="test-session",
-                    name="Test",
-                    title="Test",
-                    purpose="Testing",
-                    created_at=datetime.now(),
-                    last_updated_at=datetime.now(),
-                    project_root=str(tmp_path),
-                    prompts=PromptMetadata(set="default"),
-                    environment=Environment(os="test"),
-                    now=Now(reason=NowReason.IDLE),
-                    tasks=[]
-                )
-                mock_load.return_value = (mock_state, tmp_path)
-
-                # Mock the apply_update to verify payload
-                with patch("planloop.cli.apply_update") as mock_apply:
-                    # apply_update returns modified state
-                    mock_apply.return_value = mock_state
-                    with patch("planloop.cli.acquire_lock"):
-                        result = runner.invoke(app, ["suggest", "--auto-approve"])
-
-                        assert result.exit_code == 0
-                        # Should have called apply_update
-                        assert mock_apply.called
-
-
-def test_suggest_respects_limit_option(runner, mock_suggestions, tmp_path):
+    # Mock the apply_update to verify payload
+    with patch("planloop.cli.apply_update") as mock_apply, \
+            patch("planloop.cli.acquire_lock"), \
+            patch("planloop.cli.save_session_state"):
+        # apply_update returns modified state
+        mock_apply.return_value = mock_state
+        _suggest_impl(mock_state, tmp_path, auto_approve=True)
+
+    assert mock_apply.called
+    payload = mock_apply.call_args[0][1]
+    assert [task.title for task in payload.add_tasks] == ["Add error handling", "Add tests"]
+
+
+def test_suggest_respects_limit_option(mock_engine, mock_state, tmp_path):
     """Suggest should respect --limit option."""
-    # Create more suggestions than limit
-    many_suggestions = mock_suggestions * 5  # 10 suggestions
+    _suggest_impl(mock_state, tmp_path, dry_run=True, limit=3)
 
-    with patch("planloop.cli.SuggestionEngine") as MockEngine:
-        mock_engine = Mock()
-        mock_engine.generate_suggestions.return_value = many_suggestions[:3]  # Engine limits it
-        MockEngine.return_value = mock_engine
-
-        with patch("planloop.cli._load_session") as mock_load:
-                from datetime import datetime
-
-                from planloop.core.state import (
-                    Environment,
-                    Now,
-                    NowReason,
-                    PromptMetadata,
-                    SessionState,
-                )
-
-                mock_state = SessionState(
-                    session="test-session",
-                    name="Test",
-                    title="Test",
-                    purpose="Testing",
-                    created_at=datetime.now(),
-                    last_updated_at=datetime.now(),
-                    project_root=str(tmp_path),
-                    prompts=PromptMetadata(set="default"),
-                    environment=Environment(os="test"),
-                    now=Now(reason=NowReason.IDLE),
-                    tasks=[]
-                )
-                mock_load.return_value = (mock_state, tmp_path)
-
-                result = runner.invoke(app, ["suggest", "--dry-run", "--limit", "3"])
-
-                assert result.exit_code == 0
-
-
-def test_suggest_uses_specified_depth(runner, mock_suggestions, tmp_path):
+    config = mock_engine.call_args[0][1]
+    assert config.max_suggestions == 3
+
+
+def test_suggest_uses_specified_depth(mock_engine, mock_state, tmp_path):
     """Suggest should pass depth parameter to engine."""
-    with patch("planloop.cli.SuggestionEngine") as MockEngine:
-        mock_engine = Mock()
-        mock_engine.generate_suggestions.return_value = mock_suggestions
-        MockEngine.return_value = mock_engine
-
-        with patch("planloop.cli._load_session") as mock_load:
-                from datetime import datetime
-
-                from planloop.core.state import (
-                    Environment,
-                    Now,
-                    NowReason,
-                    PromptMetadata,
-                    SessionState,
-                )
-
-                mock_state = SessionState(
-                    session="test-session",
-                    name="Test",
-                    title="Test",
-                    purpose="Testing",
-                    created_at=datetime.now(),
-                    last_updated_at=datetime.now(),
-                    project_root=str(tmp_path),
-                    prompts=PromptMetadata(set="default"),
-                    environment=Environment(os="test"),
-                    now=Now(reason=NowReason.IDLE),
-                    tasks=[]
-                )
-                mock_load.return_value = (mock_state, tmp_path)
-
-                result = runner.invoke(app, ["suggest", "--dry-run", "--depth", "deep"])
-
-                assert result.exit_code == 0
-                # Verify depth was passed to engine
-                call_args = mock_engine.generate_suggestions.call_args
-                assert call_args[1]["depth"] == "deep"
+    _suggest_impl(mock_state, tmp_path, dry_run=True, depth="deep")
+
+    # Verify depth was passed to engine
+    call_args = mock_engine.return_value.generate_suggestions.call_args
+    assert call_args[1]["depth"] == "deep"
+
+
+def test_suggest_cli_delegates_to_impl(planloop_session, cli_invoke):
+    """The suggest command loads the session and hands its options to _suggest_impl."""
+    home, state = planloop_session
+    with patch("planloop.cli._suggest_impl") as mock_impl:
+        result = cli_invoke(
+            ["suggest", "--session", state.session, "--dry-run", "--depth", "deep", "--limit", "3"]
+        )
+
+    assert result.exit_code == 0
+    loaded_state, session_dir = mock_impl.call_args[0]
+    assert loaded_state.session == state.session
+    assert session_dir == home / "sessions" / state.session
+    assert mock_impl.call_args[1] == {
+        "depth": "deep",
+        "limit": 3,
+        "dry_run": True,
+        "auto_approve": False,
+        "weekly": False,
+    }
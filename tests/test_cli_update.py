@@ -1,42 +1,16 @@
 """CLI tests for planloop update."""
 from __future__ import annotations
 
-import json
-from pathlib import Path
-
-import yaml
-from typer.testing import CliRunner
-
-from planloop import cli
-from planloop.config import reset_config_cache
-from planloop.core.session import create_session, save_session_state
+from planloop import logging_utils
+from planloop.core.session import save_session_state
 from planloop.core.state import Task, TaskType
-from planloop.home import initialize_home
-
-runner = CliRunner()
-
-
-def setup_session(tmp_path: Path):
-    home = tmp_path / "home"
-    home.mkdir()
-    (home / "sessions").mkdir()
-    return home
-
 
-def configure_safe_mode(home: Path, **kwargs) -> None:
-    initialize_home()
-    config_path = home / "config.yml"
-    cfg = yaml.safe_load(config_path.read_text()) or {}
-    update_cfg = cfg.setdefault("safe_modes", {}).setdefault("update", {})
-    update_cfg.update(kwargs)
-    config_path.write_text(yaml.safe_dump(cfg))
-    reset_config_cache()
+from ._config_helpers import set_safe_mode
+from ._json_helpers import dumps, parse_json, read_state
 
 
-def test_update_changes_task_status(monkeypatch, tmp_path):
-    home = setup_session(tmp_path)
-    monkeypatch.setenv("PLANLOOP_HOME", str(home))
-    state = create_session("Test", "Demo", project_root=Path("/repo"))
+def test_update_changes_task_status(planloop_session, cli_invoke):
+    home, state = planloop_session
     state.tasks = [Task(id=1, title="Do work", type=TaskType.CHORE)]
     save_session_state(home / "sessions" / state.session, state, message="setup")
 
@@ -44,78 +18,81 @@ def test_update_changes_task_status(monkeypatch, tmp_path):
         "session": state.session,
         "tasks": [{"id": 1, "status": "DONE"}]
     }
-    result = runner.invoke(cli.app, ["update"], input=json.dumps(payload))
+    result = cli_invoke(["update"], input=dumps(payload))
 
     assert result.exit_code == 0
-    data = json.loads((home / "sessions" / state.session / "state.json").read_text())
+    data = read_state(home / "sessions" / state.session)
     assert data["tasks"][0]["status"] == "DONE"
     log_path = home / "sessions" / state.session / "logs" / "planloop.log"
     assert log_path.exists()
     assert "Update command" in log_path.read_text()
 
 
-def test_update_rejects_bad_version(monkeypatch, tmp_path):
-    home = setup_session(tmp_path)
-    monkeypatch.setenv("PLANLOOP_HOME", str(home))
-    state = create_session("Test", "Demo", project_root=Path("/repo"))
+def test_update_releases_session_log_when_done(planloop_session, cli_invoke):
+    home, state = planloop_session
+    session_dir = (home / "sessions" / state.session).resolve()
+
+    result = cli_invoke(["update"], input=dumps({"session": state.session, "next_steps": ["Wrap up"]}))
+    assert result.exit_code == 0
+    assert session_dir in logging_utils._SESSION_HANDLERS
+
+    payload = {"session": state.session, "final_summary": "Shipped", "done": True}
+    result = cli_invoke(["update"], input=dumps(payload))
+    assert result.exit_code == 0
+    assert session_dir not in logging_utils._SESSION_HANDLERS
+
+
+def test_update_rejects_bad_version(planloop_session, cli_invoke):
+    home, state = planloop_session
     payload = {
         "session": state.session,
         "last_seen_version": "999"
     }
-    result = runner.invoke(cli.app, ["update"], input=json.dumps(payload))
+    result = cli_invoke(["update"], input=dumps(payload))
     assert result.exit_code != 0
 
 
-def test_config_default_no_plan_edit(monkeypatch, tmp_path):
-    home = setup_session(tmp_path)
-    monkeypatch.setenv("PLANLOOP_HOME", str(home))
-    configure_safe_mode(home, no_plan_edit=True)
-    state = create_session("Test", "Demo", project_root=Path("/repo"))
+def test_config_default_no_plan_edit(planloop_session, cli_invoke):
+    home, state = planloop_session
+    set_safe_mode(no_plan_edit=True)
     payload = {
         "session": state.session,
         "add_tasks": [{"title": "Task", "type": "feature"}],
     }
-    result = runner.invoke(cli.app, ["update"], input=json.dumps(payload))
+    result = cli_invoke(["update"], input=dumps(payload))
     assert result.exit_code != 0
 
-    result = runner.invoke(cli.app, ["update", "--allow-plan-edit"], input=json.dumps(payload))
+    result = cli_invoke(["update", "--allow-plan-edit"], input=dumps(payload))
     assert result.exit_code == 0
-    reset_config_cache()
 
 
-def test_update_dry_run(monkeypatch, tmp_path):
-    home = setup_session(tmp_path)
-    monkeypatch.setenv("PLANLOOP_HOME", str(home))
-    state = create_session("Test", "Demo", project_root=Path("/repo"))
+def test_update_dry_run(planloop_session, cli_invoke):
+    home, state = planloop_session
     payload = {
         "session": state.session,
         "add_tasks": [{"title": "Task", "type": "feature"}],
     }
-    result = runner.invoke(cli.app, ["update", "--dry-run"], input=json.dumps(payload))
+    result = cli_invoke(["update", "--dry-run"], input=dumps(payload))
     assert result.exit_code == 0
-    data = json.loads(result.stdout)
+    data = parse_json(result.stdout_bytes)
     assert data["dry_run"]["tasks"]["added"]
     # ensure original state unchanged
-    saved = json.loads((home / "sessions" / state.session / "state.json").read_text())
+    saved = read_state(home / "sessions" / state.session)
     assert saved["tasks"] == []
 
 
-def test_update_no_plan_edit_blocks_structural(monkeypatch, tmp_path):
-    home = setup_session(tmp_path)
-    monkeypatch.setenv("PLANLOOP_HOME", str(home))
-    state = create_session("Test", "Demo", project_root=Path("/repo"))
+def test_update_no_plan_edit_blocks_structural(planloop_session, cli_invoke):
+    home, state = planloop_session
     payload = {
         "session": state.session,
         "add_tasks": [{"title": "Task", "type": "feature"}],
     }
-    result = runner.invoke(cli.app, ["update", "--no-plan-edit"], input=json.dumps(payload))
+    result = cli_invoke(["update", "--no-plan-edit"], input=dumps(payload))
     assert result.exit_code != 0
 
 
-def test_update_strict_rejects_unknown(monkeypatch, tmp_path):
-    home = setup_session(tmp_path)
-    monkeypatch.setenv("PLANLOOP_HOME", str(home))
-    state = create_session("Test", "Demo", project_root=Path("/repo"))
+def test_update_strict_rejects_unknown(planloop_session, cli_invoke):
+    home, state = planloop_session
     state.tasks = [Task(id=1, title="Existing", type=TaskType.CHORE)]
     save_session_state(home / "sessions" / state.session, state, message="setup")
     payload = {
@@ -123,18 +100,16 @@ def test_update_strict_rejects_unknown(monkeypatch, tmp_path):
         "tasks": [{"id": 1, "status": "DONE"}],
         "extra_field": True,
     }
-    result = runner.invoke(cli.app, ["update"], input=json.dumps(payload))
+    result = cli_invoke(["update"], input=dumps(payload))
     assert result.exit_code == 0
 
-    result = runner.invoke(cli.app, ["update", "--strict"], input=json.dumps(payload))
+    result = cli_invoke(["update", "--strict"], input=dumps(payload))
     assert result.exit_code != 0
 
 
-def test_config_default_strict(monkeypatch, tmp_path):
-    home = setup_session(tmp_path)
-    monkeypatch.setenv("PLANLOOP_HOME", str(home))
-    configure_safe_mode(home, strict=True)
-    state = create_session("Test", "Demo", project_root=Path("/repo"))
+def test_config_default_strict(planloop_session, cli_invoke):
+    home, state = planloop_session
+    set_safe_mode(strict=True)
     state.tasks = [Task(id=1, title="Existing", type=TaskType.CHORE)]
     save_session_state(home / "sessions" / state.session, state, message="setup")
     payload = {
@@ -142,9 +117,8 @@ def test_config_default_strict(monkeypatch, tmp_path):
         "tasks": [{"id": 1, "status": "DONE"}],
         "extra": True,
     }
-    result = runner.invoke(cli.app, ["update"], input=json.dumps(payload))
+    result = cli_invoke(["update"], input=dumps(payload))
     assert result.exit_code != 0
 
-    result = runner.invoke(cli.app, ["update", "--allow-extra-fields"], input=json.dumps(payload))
+    result = cli_invoke(["update", "--allow-extra-fields"], input=dumps(payload))
     assert result.exit_code == 0
-    reset_config_cache()
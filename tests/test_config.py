@@ -0,0 +1,20 @@
+"""Tests for planloop.config helpers."""
+from __future__ import annotations
+
+import yaml
+
+from planloop.config import load_config, safe_mode_defaults
+
+from ._config_helpers import update_config
+
+
+def test_update_config_merges_nested_keys(planloop_home):
+    update_config({"safe_modes": {"update": {"dry_run": True}}})
+    update_config({"safe_modes": {"update": {"strict": True}}})
+
+    assert safe_mode_defaults() == {"dry_run": True, "no_plan_edit": False, "strict": True}
+    # Keys written by initialize_home survive the merge
+    on_disk = yaml.safe_load((planloop_home / "config.yml").read_text())
+    assert on_disk["safe_modes"]["update"]["dry_run"] is True
+    assert on_disk.keys() >= {"history", "logging"}
+    assert load_config() == on_disk
@@ -5,7 +5,23 @@ from unittest.mock import patch
 
 import pytest
 
-from planloop.config import SuggestConfig, get_suggest_config
+from planloop.config import SuggestConfig, get_suggest_config, reset_config_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_cache():
+    """get_suggest_config is cached; start and end every test with a clean cache."""
+    reset_config_cache()
+    yield
+    reset_config_cache()
+
+
+@pytest.fixture
+def config_data(monkeypatch) -> dict:
+    """The dict load_config() returns for this test; fill it before reading config."""
+    data: dict = {}
+    monkeypatch.setattr("planloop.config.load_config", lambda: data)
+    return data
 
 
 @pytest.fixture
@@ -42,19 +58,16 @@ def test_suggest_config_defaults():
     assert config.focus_paths == []
 
 
-def test_get_suggest_config_returns_defaults_when_no_file():
+def test_get_suggest_config_returns_defaults_when_no_file(config_data):
     """get_suggest_config should return defaults if no config file exists."""
-    with patch("planloop.config.load_config", return_value={}):
-        config = get_suggest_config()
+    config = get_suggest_config()
 
-        assert config.llm_provider == "openai"
-        assert config.context_depth == "medium"
+    assert config.llm_provider == "openai"
+    assert config.context_depth == "medium"
 
 
-def test_get_suggest_config_loads_from_file():
+def test_get_suggest_config_loads_from_file(config_data):
     """get_suggest_config should load settings from config file."""
-    from planloop.config import reset_config_cache
-
     mock_config = {
         "suggest": {
             "llm": {
@@ -75,38 +88,32 @@ def test_get_suggest_config_loads_from_file():
         }
     }
 
-    reset_config_cache()  # Clear cache before patching
-    with patch("planloop.config.load_config", return_value=mock_config):
-        config = get_suggest_config()
-
-        assert config.llm_provider == "anthropic"
-        assert config.llm_model == "claude-3-sonnet"
-        assert config.llm_temperature == 0.5
-        assert config.llm_max_tokens == 2000
-        assert config.context_depth == "deep"
-        assert config.include_git_history is False
-        assert config.max_recent_commits == 20
-        assert "*.log" in config.ignore_patterns
-        assert "src/" in config.focus_paths
+    config_data.update(mock_config)
+    config = get_suggest_config()
 
-    reset_config_cache()  # Clear cache after
+    assert config.llm_provider == "anthropic"
+    assert config.llm_model == "claude-3-sonnet"
+    assert config.llm_temperature == 0.5
+    assert config.llm_max_tokens == 2000
+    assert config.context_depth == "deep"
+    assert config.include_git_history is False
+    assert config.max_recent_commits == 20
+    assert "*.log" in config.ignore_patterns
+    assert "src/" in config.focus_paths
 
 
-def test_get_suggest_config_api_key_from_env(monkeypatch):
+def test_get_suggest_config_api_key_from_env(monkeypatch, config_data):
     """get_suggest_config should load API key from environment."""
     monkeypatch.setenv("OPENAI_API_KEY", "test-key-123")
 
-    with patch("planloop.config.load_config", return_value={}):
-        config = get_suggest_config()
+    config = get_suggest_config()
 
-        # Should have the env var name stored
-        assert config.llm_api_key_env == "OPENAI_API_KEY"
+    # Should have the env var name stored
+    assert config.llm_api_key_env == "OPENAI_API_KEY"
 
 
-def test_get_suggest_config_api_key_from_config():
+def test_get_suggest_config_api_key_from_config(config_data):
     """get_suggest_config should load API key env var name from config."""
-    from planloop.config import reset_config_cache
-
     mock_config = {
         "suggest": {
             "llm": {
@@ -116,19 +123,14 @@ def test_get_suggest_config_api_key_from_config():
         }
     }
 
-    reset_config_cache()
-    with patch("planloop.config.load_config", return_value=mock_config):
-        config = get_suggest_config()
-
-        assert config.llm_api_key_env == "MY_CUSTOM_KEY"
+    config_data.update(mock_config)
+    config = get_suggest_config()
 
-    reset_config_cache()
+    assert config.llm_api_key_env == "MY_CUSTOM_KEY"
 
 
-def test_get_suggest_config_partial_settings():
+def test_get_suggest_config_partial_settings(config_data):
     """get_suggest_config should merge partial settings with defaults."""
-    from planloop.config import reset_config_cache
-
     mock_config = {
         "suggest": {
             "llm": {
@@ -137,17 +139,14 @@ def test_get_suggest_config_partial_settings():
         }
     }
 
-    reset_config_cache()
-    with patch("planloop.config.load_config", return_value=mock_config):
-        config = get_suggest_config()
-
-        # Should override model but keep other defaults
-        assert config.llm_model == "gpt-4-turbo"
-        assert config.llm_provider == "openai"  # default
-        assert config.llm_temperature == 0.7  # default
-        assert config.context_depth == "medium"  # default
+    config_data.update(mock_config)
+    config = get_suggest_config()
 
-    reset_config_cache()
+    # Should override model but keep other defaults
+    assert config.llm_model == "gpt-4-turbo"
+    assert config.llm_provider == "openai"  # default
+    assert config.llm_temperature == 0.7  # default
+    assert config.context_depth == "medium"  # default
 
 
 def test_suggest_config_validates_provider():
@@ -176,12 +175,8 @@ def test_suggest_config_validates_depth():
         SuggestConfig(context_depth="invalid")
 
 
-def test_get_suggest_config_uses_cache(monkeypatch):
+def test_get_suggest_config_uses_cache(planloop_home):
     """get_suggest_config should cache results."""
-    from planloop.config import reset_config_cache
-
-    reset_config_cache()
-
     # First call loads from config
     config1 = get_suggest_config()
     # Second call should use cache
@@ -189,5 +184,3 @@ def test_get_suggest_config_uses_cache(monkeypatch):
 
     # Should be the same object (cached)
     assert config1 is config2
-
-    reset_config_cache()
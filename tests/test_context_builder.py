@@ -1,18 +1,49 @@
 """Tests for codebase context builder."""
 from __future__ import annotations
 
+import shutil
 import subprocess
 from pathlib import Path
-from unittest.mock import Mock, patch
 
 import pytest
 
 from planloop.core.context_builder import CodebaseContext, ContextBuilder, TodoComment
 
 
-@pytest.fixture
-def temp_project(tmp_path):
-    """Create a temporary project structure for testing."""
+def _git_output(stdout: str = ""):
+    """A subprocess.run stand-in returning ``stdout`` as git's output."""
+
+    def run(args, **kwargs):
+        return subprocess.CompletedProcess(args, 0, stdout=stdout, stderr="")
+
+    return run
+
+
+@pytest.fixture(autouse=True)
+def _fake_git(monkeypatch):
+    """Never fork git here: by default the project has no git history.
+
+    Tests that need git output set their own subprocess.run with monkeypatch.
+    """
+    monkeypatch.setattr(subprocess, "run", _git_output())
+
+
+def _tree_snapshot(root: Path) -> dict[str, bytes]:
+    return {
+        str(path.relative_to(root)): path.read_bytes()
+        for path in sorted(root.rglob("*"))
+        if path.is_file()
+    }
+
+
+@pytest.fixture(scope="module")
+def temp_project(tmp_path_factory):
+    """Create a temporary project structure shared by the read-only tests.
+
+    Tests that add files must use ``temp_project_mutable`` instead; teardown
+    fails if this tree was changed.
+    """
+    tmp_path = tmp_path_factory.mktemp("context_project")
     # Create directory structure
     src = tmp_path / "src"
     src.mkdir()
@@ -47,7 +78,30 @@ def test_hello():
     # Create a README
     (tmp_path / "README.md").write_text("# Test Project")
 
-    return tmp_path
+    snapshot = _tree_snapshot(tmp_path)
+    yield tmp_path
+    assert _tree_snapshot(tmp_path) == snapshot, "a test modified the shared temp_project"
+
+
+@pytest.fixture(scope="module")
+def built_context(temp_project):
+    """Build the shared project's context once per depth; treat results as read-only."""
+    cache: dict[str, CodebaseContext] = {}
+
+    def get(depth: str) -> CodebaseContext:
+        if depth not in cache:
+            cache[depth] = ContextBuilder(temp_project).build(depth=depth)
+        return cache[depth]
+
+    return get
+
+
+@pytest.fixture
+def temp_project_mutable(temp_project, tmp_path):
+    """A private copy of ``temp_project`` that a test may add files to."""
+    project = tmp_path / "proj"
+    shutil.copytree(temp_project, project)
+    return project
 
 
 def test_todo_comment_model():
@@ -82,10 +136,9 @@ def test_context_builder_initializes_with_path(temp_project):
     assert builder.project_root == temp_project
 
 
-def test_context_builder_parses_file_structure(temp_project):
+def test_context_builder_parses_file_structure(built_context):
     """ContextBuilder should parse file structure."""
-    builder = ContextBuilder(temp_project)
-    context = builder.build(depth="shallow")
+    context = built_context("shallow")
 
     # Should find the directories and files
     assert context.structure is not None
@@ -94,10 +147,9 @@ def test_context_builder_parses_file_structure(temp_project):
     assert "src" in structure_str or "main.py" in structure_str
 
 
-def test_context_builder_extracts_todo_comments(temp_project):
+def test_context_builder_extracts_todo_comments(built_context):
     """ContextBuilder should find TODO/FIXME/NOTE comments."""
-    builder = ContextBuilder(temp_project)
-    context = builder.build(depth="medium")
+    context = built_context("medium")
 
     # Should find the TODO, FIXME, and NOTE comments
     assert len(context.todos) >= 3
@@ -108,10 +160,9 @@ def test_context_builder_extracts_todo_comments(temp_project):
     assert "NOTE" in types
 
 
-def test_context_builder_counts_language_stats(temp_project):
+def test_context_builder_counts_language_stats(built_context):
     """ContextBuilder should count files by extension."""
-    builder = ContextBuilder(temp_project)
-    context = builder.build(depth="shallow")
+    context = built_context("shallow")
 
     # Should count Python and Markdown files
     assert "py" in context.language_stats
@@ -122,37 +173,30 @@ def test_context_builder_counts_language_stats(temp_project):
 
 def test_context_builder_gets_git_history(temp_project, monkeypatch):
     """ContextBuilder should get recent changed files from git."""
-    # Mock git command
-    mock_result = Mock()
-    mock_result.stdout = "src/main.py\nsrc/utils.py\n"
-    mock_result.returncode = 0
+    monkeypatch.setattr(subprocess, "run", _git_output("src/main.py\nsrc/utils.py\n"))
 
-    with patch("subprocess.run", return_value=mock_result):
-        builder = ContextBuilder(temp_project)
-        context = builder.build(depth="medium")
+    builder = ContextBuilder(temp_project)
+    context = builder.build(depth="medium")
 
-        # Should have recent changes
-        assert len(context.recent_changes) >= 2
-        assert "src/main.py" in context.recent_changes or "main.py" in context.recent_changes
+    # Should have recent changes
+    assert len(context.recent_changes) >= 2
+    assert "src/main.py" in context.recent_changes or "main.py" in context.recent_changes
 
 
-def test_context_builder_includes_current_tasks(temp_project):
+def test_context_builder_includes_current_tasks(built_context):
     """ContextBuilder should include current plan tasks."""
     # For now, context builder returns empty tasks (will be enhanced later)
     # This test validates the structure exists
-    builder = ContextBuilder(temp_project)
-    context = builder.build(depth="shallow")
+    context = built_context("shallow")
 
     # Should have a tasks list (even if empty)
     assert isinstance(context.current_tasks, list)
 
 
-def test_context_builder_shallow_depth_is_fast(temp_project):
+def test_context_builder_shallow_depth_is_fast(built_context):
     """Shallow depth should scan less than deep depth."""
-    builder = ContextBuilder(temp_project)
-
-    shallow = builder.build(depth="shallow")
-    deep = builder.build(depth="deep")
+    shallow = built_context("shallow")
+    deep = built_context("deep")
 
     # Shallow should have less detail (fewer TODOs or simpler structure)
     # This is a basic check - in practice, shallow might skip subdirectories
@@ -160,19 +204,23 @@ def test_context_builder_shallow_depth_is_fast(temp_project):
     assert deep.language_stats is not None
 
 
-def test_context_builder_handles_no_git_gracefully(temp_project):
+def test_context_builder_handles_no_git_gracefully(temp_project, monkeypatch):
     """ContextBuilder should handle non-git projects."""
-    # Mock git command to fail
-    with patch("subprocess.run", side_effect=subprocess.CalledProcessError(1, "git")):
-        builder = ContextBuilder(temp_project)
-        context = builder.build(depth="medium")
 
-        # Should still work, just with empty git history
-        assert context.recent_changes == []
+    def fail(args, **kwargs):
+        raise subprocess.CalledProcessError(128, args)
+
+    monkeypatch.setattr(subprocess, "run", fail)
+    builder = ContextBuilder(temp_project)
+    context = builder.build(depth="medium")
+
+    # Should still work, just with empty git history
+    assert context.recent_changes == []
 
 
-def test_context_builder_filters_ignored_patterns(temp_project):
+def test_context_builder_filters_ignored_patterns(temp_project_mutable):
     """ContextBuilder should respect ignore patterns."""
+    temp_project = temp_project_mutable
     # Create some files that should be ignored
     (temp_project / "__pycache__").mkdir()
     (temp_project / "__pycache__" / "main.pyc").write_text("compiled")
@@ -1,23 +1,13 @@
 """Tests for deadlock detection."""
 from __future__ import annotations
 
-from pathlib import Path
-
 from planloop.core.deadlock import DeadlockTracker, check_deadlock
-from planloop.core.session import create_session
 from planloop.core.state import NowReason
 
 
-def create_state(tmp_path: Path, monkeypatch):
-    home = tmp_path / "home"
-    monkeypatch.setenv("PLANLOOP_HOME", str(home))
-    state = create_session("Test", "Deadlock", project_root=Path("/repo"))
+def test_deadlock_tracker_counts(planloop_session):
+    home, state = planloop_session
     session_dir = home / "sessions" / state.session
-    return state, session_dir
-
-
-def test_deadlock_tracker_counts(tmp_path, monkeypatch):
-    state, session_dir = create_state(tmp_path, monkeypatch)
 
     for _ in range(5):
         state = check_deadlock(state, session_dir, threshold=3)
@@ -159,3 +159,45 @@ class TestErrorContextCapture:
         error_dir = session_dir / "logs" / "errors"
         if error_dir.exists():
             assert len(list(error_dir.glob("*.json"))) == 0
+
+    def test_decorator_links_unchanged_state_snapshot(self, tmp_path: Path):
+        """Repeated errors against an unchanged state.json reuse the first snapshot."""
+        session_dir = tmp_path / "session"
+        session_dir.mkdir()
+        (session_dir / "state.json").write_text(json.dumps({"version": 7}))
+
+        @capture_error_context(session_dir)
+        def failing() -> None:
+            raise RuntimeError("Retry storm")
+
+        set_trace_id("tr_test_dedupe_001")
+        with pytest.raises(RuntimeError):
+            failing()
+        set_trace_id("tr_test_dedupe_002")
+        with pytest.raises(RuntimeError):
+            failing()
+
+        error_dir = session_dir / "logs" / "errors"
+        first = error_dir / "tr_test_dedupe_001_state.json"
+        second = error_dir / "tr_test_dedupe_002_state.json"
+        assert not first.is_symlink()
+        assert second.is_symlink()
+        assert json.loads(second.read_text()) == {"version": 7}
+
+    def test_error_report_matches_indented_json(self, tmp_path: Path):
+        """Error reports keep the exact json.dumps(indent=2) layout."""
+        session_dir = tmp_path / "session"
+        session_dir.mkdir()
+
+        set_trace_id("tr_test_layout_001")
+
+        @capture_error_context(session_dir)
+        def failing_layout(text: str) -> None:
+            raise ValueError("multi\nline \"quoted\"")
+
+        with pytest.raises(ValueError) as exc_info:
+            failing_layout("value")
+
+        error_file = session_dir / "logs" / "errors" / "tr_test_layout_001_error.json"
+        expected = json.dumps(exc_info.value.__error_context__, indent=2)
+        assert error_file.read_text() == expected
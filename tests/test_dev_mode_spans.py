@@ -98,3 +98,15 @@ class TestTraceSpan:
         assert outer_span["name"] == "outer"
         # Outer should take longer than inner
         assert outer_span["duration_ms"] >= inner_span["duration_ms"]
+
+    def test_trace_span_records_trace_id_metadata(self, tmp_path: Path) -> None:
+        """Test that a trace_id keyword is span metadata, not the trace file's ID."""
+        set_trace_id("tr_test_context")
+
+        with trace_span("tagged", session_dir=tmp_path, trace_id="tr_test_upstream"):
+            pass
+
+        traces_dir = tmp_path / "logs" / "traces"
+        assert not (traces_dir / "tr_test_upstream.json").exists()
+        trace_data = json.loads((traces_dir / "tr_test_context.json").read_text())
+        assert trace_data["spans"][0]["metadata"] == {"trace_id": "tr_test_upstream"}
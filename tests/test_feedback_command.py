@@ -19,7 +19,7 @@ from planloop.core.state import (
 )
 
 
-def test_feedback_command_stores_feedback(tmp_path, monkeypatch):
+def test_feedback_command_stores_feedback(tmp_path, monkeypatch, runner):
     """Feedback command stores agent feedback in session directory."""
     monkeypatch.setenv("PLANLOOP_HOME", str(tmp_path))
 
@@ -41,11 +41,8 @@ def test_feedback_command_stores_feedback(tmp_path, monkeypatch):
     session_dir.mkdir(parents=True)
     save_session_state(session_dir, state)
 
-    from typer.testing import CliRunner
-
     from planloop.cli import app
 
-    runner = CliRunner()
     result = runner.invoke(
         app,
         [
@@ -69,7 +66,7 @@ def test_feedback_command_stores_feedback(tmp_path, monkeypatch):
     assert "agent" in feedback
 
 
-def test_feedback_with_rating(tmp_path, monkeypatch):
+def test_feedback_with_rating(tmp_path, monkeypatch, runner):
     """Feedback can include optional rating."""
     monkeypatch.setenv("PLANLOOP_HOME", str(tmp_path))
 
@@ -91,11 +88,8 @@ def test_feedback_with_rating(tmp_path, monkeypatch):
     session_dir.mkdir(parents=True)
     save_session_state(session_dir, state)
 
-    from typer.testing import CliRunner
-
     from planloop.cli import app
 
-    runner = CliRunner()
     result = runner.invoke(
         app,
         [
@@ -116,7 +110,7 @@ def test_feedback_with_rating(tmp_path, monkeypatch):
     assert feedback["rating"] == 4
 
 
-def test_status_prompts_feedback_when_all_done(tmp_path, monkeypatch):
+def test_status_prompts_feedback_when_all_done(tmp_path, monkeypatch, runner):
     """Status prompts for feedback when all tasks are complete."""
     monkeypatch.setenv("PLANLOOP_HOME", str(tmp_path))
 
@@ -141,11 +135,8 @@ def test_status_prompts_feedback_when_all_done(tmp_path, monkeypatch):
     session_dir.mkdir(parents=True)
     save_session_state(session_dir, state)
 
-    from typer.testing import CliRunner
-
     from planloop.cli import app
 
-    runner = CliRunner()
     result = runner.invoke(app, ["status", "--session", "test-prompt", "--json"])
 
     assert result.exit_code == 0
@@ -160,7 +151,7 @@ def test_status_prompts_feedback_when_all_done(tmp_path, monkeypatch):
     assert "difficult" in feedback_req["prompt"].lower() or "friction" in feedback_req["prompt"].lower()
 
 
-def test_feedback_not_prompted_when_tasks_remain(tmp_path, monkeypatch):
+def test_feedback_not_prompted_when_tasks_remain(tmp_path, monkeypatch, runner):
     """Feedback not prompted when tasks still TODO."""
     monkeypatch.setenv("PLANLOOP_HOME", str(tmp_path))
 
@@ -185,11 +176,8 @@ def test_feedback_not_prompted_when_tasks_remain(tmp_path, monkeypatch):
     session_dir.mkdir(parents=True)
     save_session_state(session_dir, state)
 
-    from typer.testing import CliRunner
-
     from planloop.cli import app
 
-    runner = CliRunner()
     result = runner.invoke(app, ["status", "--session", "test-no-prompt", "--json"])
 
     assert result.exit_code == 0
@@ -199,7 +187,7 @@ def test_feedback_not_prompted_when_tasks_remain(tmp_path, monkeypatch):
     assert output.get("feedback_request") is None
 
 
-def test_feedback_includes_session_metadata(tmp_path, monkeypatch):
+def test_feedback_includes_session_metadata(tmp_path, monkeypatch, runner):
     """Feedback automatically includes session context."""
     monkeypatch.setenv("PLANLOOP_HOME", str(tmp_path))
 
@@ -223,11 +211,8 @@ def test_feedback_includes_session_metadata(tmp_path, monkeypatch):
     session_dir.mkdir(parents=True)
     save_session_state(session_dir, state)
 
-    from typer.testing import CliRunner
-
     from planloop.cli import app
 
-    runner = CliRunner()
     result = runner.invoke(
         app,
         [
@@ -85,7 +85,7 @@ def test_guide_update_preserves_custom_content(tmp_path):
     assert "User-specific notes" in content_after
 
 
-def test_guide_cli_apply_respects_version(tmp_path, monkeypatch):
+def test_guide_cli_apply_respects_version(tmp_path, monkeypatch, runner):
     """planloop guide --apply should update when version changes."""
     import os
 
@@ -98,12 +98,8 @@ def test_guide_cli_apply_respects_version(tmp_path, monkeypatch):
         agents_md = tmp_path / "docs" / "agents.md"
         agents_md.parent.mkdir(parents=True)
 
-        from typer.testing import CliRunner
-
         from planloop.cli import app
 
-        runner = CliRunner()
-
         # First apply (using default path)
         result = runner.invoke(app, ["guide", "--apply"])
         assert result.exit_code == 0
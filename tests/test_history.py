@@ -0,0 +1,117 @@
+"""Tests for session history with the git CLI and pygit2 backends."""
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from planloop import history
+
+from ._config_helpers import update_config
+
+
+@pytest.fixture(params=["git", "pygit2"])
+def backend(request, monkeypatch) -> str:
+    """Run the test against each history backend; pygit2 is optional."""
+    if request.param == "pygit2":
+        monkeypatch.setattr(history, "pygit2", pytest.importorskip("pygit2"))
+    else:
+        monkeypatch.setattr(history, "pygit2", None)
+    return request.param
+
+
+@pytest.fixture
+def session_dir(planloop_home, tmp_path) -> Path:
+    update_config({"history": {"enabled": True}})
+    session_dir = tmp_path / "session"
+    session_dir.mkdir()
+    (session_dir / "state.json").write_text('{"version": 1}\n', encoding="utf-8")
+    (session_dir / "PLAN.md").write_text("# Plan\n", encoding="utf-8")
+    (session_dir / "summary.json").write_text('{"task_count": 0}', encoding="utf-8")
+    return session_dir
+
+
+def _git(session_dir: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=session_dir, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def _record_history(session_dir: Path) -> list[str]:
+    """Commit, snapshot, change, and restore; return the log as the git CLI sees it."""
+    history.commit_state(session_dir, "Initial state")
+    # Unchanged files and allow_empty=False: no new commit
+    history.commit_state(session_dir, "No-op")
+    snapshot = history.create_snapshot(session_dir, "before edit")
+    (session_dir / "state.json").write_text('{"version": 2}\n', encoding="utf-8")
+    history.commit_state(session_dir, "Edit state")
+    history.restore_snapshot(session_dir, snapshot)
+    return _git(session_dir, "log", "--format=%an <%ae> %T %s").splitlines()
+
+
+def test_ensure_repo_initializes_repo(backend, session_dir):
+    assert history.ensure_repo(session_dir)
+
+    assert (session_dir / ".git").is_dir()
+    assert (session_dir / ".gitignore").read_text(encoding="utf-8") == history.GITIGNORE_CONTENT
+    assert _git(session_dir, "config", "user.name") == history.GIT_AUTHOR
+    assert _git(session_dir, "config", "user.email") == history.GIT_EMAIL
+
+
+def test_ensure_repo_requires_history_enabled(backend, session_dir):
+    update_config({"history": {"enabled": False}})
+
+    assert not history.ensure_repo(session_dir)
+    assert not (session_dir / ".git").exists()
+    with pytest.raises(RuntimeError, match="History not enabled"):
+        history.create_snapshot(session_dir, "note")
+
+
+def test_commit_and_snapshot(backend, session_dir):
+    history.commit_state(session_dir, "Initial state")
+    history.commit_state(session_dir, "No-op")
+    sha = history.create_snapshot(session_dir, "checkpoint")
+
+    assert sha == _git(session_dir, "rev-parse", "HEAD")
+    assert _git(session_dir, "log", "--format=%s").splitlines() == [
+        "Snapshot: checkpoint",
+        "Initial state",
+    ]
+    assert _git(session_dir, "ls-tree", "--name-only", "HEAD").splitlines() == [
+        ".gitignore",
+        "PLAN.md",
+        "state.json",
+    ]
+    # The derived summary.json is ignored, so snapshots leave a clean tree
+    assert _git(session_dir, "status", "--porcelain") == ""
+
+
+def test_restore_snapshot(backend, session_dir):
+    history.commit_state(session_dir, "Initial state")
+    sha = history.create_snapshot(session_dir, "before edit")
+    (session_dir / "state.json").write_text('{"version": 2}\n', encoding="utf-8")
+    history.commit_state(session_dir, "Edit state")
+
+    history.restore_snapshot(session_dir, sha)
+
+    assert _git(session_dir, "rev-parse", "HEAD") == sha
+    assert (session_dir / "state.json").read_text(encoding="utf-8") == '{"version": 1}\n'
+    assert _git(session_dir, "status", "--porcelain") == ""
+
+
+def test_pygit2_history_matches_git_cli(session_dir, tmp_path, monkeypatch):
+    pygit2 = pytest.importorskip("pygit2")
+    cli_dir = tmp_path / "cli-session"
+    cli_dir.mkdir()
+    for name in ("state.json", "PLAN.md"):
+        (cli_dir / name).write_bytes((session_dir / name).read_bytes())
+
+    monkeypatch.setattr(history, "pygit2", None)
+    cli_log = _record_history(cli_dir)
+    monkeypatch.setattr(history, "pygit2", pygit2)
+    pygit2_log = _record_history(session_dir)
+
+    # Same author, subjects, and tree hashes, so the same tracked content
+    assert pygit2_log == cli_log
@@ -88,3 +88,19 @@ def test_initialize_home_is_idempotent(tmp_path, monkeypatch):
     home.initialize_home()
 
     assert config_path.read_text(encoding="utf-8") == "custom: true"
+
+
+def test_get_home_caches_per_override(tmp_path, monkeypatch):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    monkeypatch.setenv(home.PLANLOOP_HOME_ENV, str(first))
+    assert home.get_home() == first.resolve()
+
+    monkeypatch.setenv(home.PLANLOOP_HOME_ENV, str(second))
+    assert home.get_home() == second.resolve()
+
+    # The resolution is cached, but a removed home is still recreated
+    first.rmdir()
+    monkeypatch.setenv(home.PLANLOOP_HOME_ENV, str(first))
+    assert home.get_home() == first.resolve()
+    assert first.is_dir()
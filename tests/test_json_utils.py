@@ -0,0 +1,52 @@
+"""Tests for the optional-orjson JSON helpers."""
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+
+import pytest
+
+from planloop import json_utils
+from planloop.core.state import Task, TaskStatus, TaskType
+
+PAYLOAD = {"id": "s1", "description": "café ✓", "tasks": [1, 2], "done": None}
+
+
+@pytest.mark.parametrize("indent", [False, True], ids=["compact", "indented"])
+def test_dumps_matches_stdlib_fallback(monkeypatch, indent):
+    encoded = json_utils.dumps(PAYLOAD, indent=indent)
+    monkeypatch.setattr(json_utils, "orjson", None)
+
+    assert json_utils.dumps(PAYLOAD, indent=indent) == encoded
+    assert json.loads(encoded) == PAYLOAD
+
+
+def test_loads_accepts_bytes_and_str():
+    encoded = json_utils.dumps(PAYLOAD)
+
+    assert json_utils.loads(encoded) == PAYLOAD
+    assert json_utils.loads(encoded.decode("utf-8")) == PAYLOAD
+
+
+@pytest.mark.parametrize("backend", ["orjson", "stdlib"])
+def test_dumps_encodes_model_dump_datetimes(monkeypatch, backend):
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_utils, "orjson", None)
+    updated = datetime(2025, 1, 2, 3, 4, 5, 678000, tzinfo=UTC)
+    task = Task(
+        id=1, title="T", type=TaskType.FIX, status=TaskStatus.DONE, last_updated_at=updated
+    )
+
+    encoded = json.loads(json_utils.dumps(task.model_dump()))
+
+    assert encoded["last_updated_at"] == "2025-01-02T03:04:05.678000+00:00"
+    assert (encoded["type"], encoded["status"]) == ("fix", "DONE")
+
+
+def test_dumps_rejects_unknown_types_without_orjson(monkeypatch):
+    monkeypatch.setattr(json_utils, "orjson", None)
+
+    with pytest.raises(TypeError, match="object is not JSON serializable"):
+        json_utils.dumps({"value": object()})
@@ -159,3 +159,20 @@ def test_llm_client_loads_api_key_from_env(monkeypatch):
         mock_openai.assert_called_once()
         call_kwargs = mock_openai.call_args[1]
         assert call_kwargs["api_key"] == "env-test-key"
+
+
+def test_llm_client_defers_provider_client_creation():
+    """LLMClient should not construct the provider client until first use."""
+    mock_client = Mock()
+    mock_response = Mock()
+    mock_response.choices = [Mock(message=Mock(content="Lazy"))]
+    mock_client.chat.completions.create.return_value = mock_response
+
+    with patch("planloop.core.llm_client.OpenAI", return_value=mock_client) as mock_openai:
+        config = LLMConfig(provider="openai", model="gpt-4", api_key="test-key")
+        client = LLMClient(config)
+        mock_openai.assert_not_called()
+
+        assert client.generate("Test prompt") == "Lazy"
+        assert client.generate("Again") == "Lazy"
+        mock_openai.assert_called_once()
@@ -102,6 +102,27 @@ def test_get_lock_queue_status_prunes_stale(tmp_path):
     assert not stale.exists()
 
 
+def test_get_lock_queue_status_judges_staleness_at_now(tmp_path):
+    queue_dir = tmp_path / LOCK_QUEUE_DIR
+    queue_dir.mkdir()
+    requested_at = 1_700_000_000.0
+    entry = queue_dir / "entry.json"
+    entry.write_text(
+        json.dumps(
+            {"id": "entry", "agent": "pid:1", "operation": "update", "requested_at": requested_at}
+        ),
+        encoding="utf-8",
+    )
+
+    status = get_lock_queue_status(tmp_path, agent="pid:1", max_age=60, now=requested_at + 1)
+    assert status.position == 1
+    assert entry.exists()
+
+    status = get_lock_queue_status(tmp_path, max_age=60, now=requested_at + 61)
+    assert status.pending == []
+    assert not entry.exists()
+
+
 def test_get_lock_queue_status_reports_position(tmp_path):
     session_dir = tmp_path
     queue_dir = session_dir / LOCK_QUEUE_DIR
@@ -2,10 +2,16 @@
 from __future__ import annotations
 
 import json
+import os
 import time
+from collections import OrderedDict
 from pathlib import Path
 
+import pytest
+
 from planloop.core.lock import acquire_lock
+from planloop.dev_mode import lock_logger
+from planloop.dev_mode.lock_logger import flush_lock_events, log_lock_event
 from planloop.dev_mode.observability import set_trace_id
 
 
@@ -23,6 +29,8 @@ class TestLockOperationLogging:
         with acquire_lock(session_dir, "test_operation", timeout=5):
             time.sleep(0.01)  # Brief hold time
 
+        flush_lock_events()
+
         # Check log file exists
         log_file = session_dir / "logs" / "planloop.jsonl"
         assert log_file.exists(), "Lock log file should be created"
@@ -56,6 +64,8 @@ class TestLockOperationLogging:
         with acquire_lock(session_dir, "traced_operation", timeout=5):
             pass
 
+        flush_lock_events()
+
         log_file = session_dir / "logs" / "planloop.jsonl"
         log_entries = []
         with open(log_file) as f:
@@ -80,6 +90,8 @@ class TestLockOperationLogging:
         with acquire_lock(session_dir, "timed_operation", timeout=5):
             time.sleep(0.05)  # Hold for 50ms
 
+        flush_lock_events()
+
         log_file = session_dir / "logs" / "planloop.jsonl"
         log_entries = []
         with open(log_file) as f:
@@ -111,6 +123,8 @@ class TestLockOperationLogging:
         with acquire_lock(session_dir, "update_task_status", timeout=5):
             pass
 
+        flush_lock_events()
+
         log_file = session_dir / "logs" / "planloop.jsonl"
         log_entries = []
         with open(log_file) as f:
@@ -135,6 +149,8 @@ class TestLockOperationLogging:
         with acquire_lock(session_dir, "test_operation", timeout=5):
             pass
 
+        flush_lock_events()
+
         log_file = session_dir / "logs" / "planloop.jsonl"
         log_entries = []
         with open(log_file) as f:
@@ -153,3 +169,96 @@ class TestLockOperationLogging:
         # All events should have same entry_id
         for event in lock_events:
             assert event.get("lock_entry_id") == entry_id
+
+
+class TestLockEventWriter:
+    """Test the background writer behind log_lock_event."""
+
+    def test_write_batch_groups_lines_per_session(self, tmp_path: Path, monkeypatch):
+        """One os.write per session log, carrying every line for that session."""
+        writes = []
+        real_write = lock_logger.os.write
+
+        def recording_write(fd, data):
+            writes.append(data)
+            return real_write(fd, data)
+
+        monkeypatch.setattr(lock_logger.os, "write", recording_write)
+        first, second = tmp_path / "a", tmp_path / "b"
+        lock_logger._write_batch([
+            (first, {"event": "lock_requested"}),
+            (second, {"event": "lock_requested"}),
+            (first, {"event": "lock_acquired"}),
+        ])
+
+        assert len(writes) == 2
+        first_log = (first / "logs" / "planloop.jsonl").read_text().splitlines()
+        assert [json.loads(line)["event"] for line in first_log] == [
+            "lock_requested",
+            "lock_acquired",
+        ]
+        assert (second / "logs" / "planloop.jsonl").exists()
+
+    def test_write_batch_swallows_os_errors(self, tmp_path: Path, monkeypatch):
+        """A failing session log must not stop the others from being written."""
+        broken, healthy = tmp_path / "broken", tmp_path / "healthy"
+        real_get_log_fd = lock_logger._get_log_fd
+
+        def flaky_get_log_fd(session_dir):
+            if session_dir == broken:
+                raise OSError("disk full")
+            return real_get_log_fd(session_dir)
+
+        monkeypatch.setattr(lock_logger, "_get_log_fd", flaky_get_log_fd)
+        lock_logger._write_batch([
+            (broken, {"event": "lock_requested"}),
+            (healthy, {"event": "lock_requested"}),
+        ])
+
+        assert not (broken / "logs").exists()
+        assert (healthy / "logs" / "planloop.jsonl").read_text().count("\n") == 1
+
+    def test_worker_drains_queue_in_bounded_batches(self, tmp_path: Path, monkeypatch):
+        """Queued events are all written, never more than MAX_BATCH at a time."""
+        batch_sizes = []
+        real_write_batch = lock_logger._write_batch
+
+        def recording_write_batch(batch):
+            batch_sizes.append(len(batch))
+            real_write_batch(batch)
+
+        monkeypatch.setattr(lock_logger, "_write_batch", recording_write_batch)
+        total = lock_logger.MAX_BATCH * 2 + 1
+        for i in range(total):
+            log_lock_event(tmp_path, "lock_requested", "batch_test", f"entry-{i}")
+        flush_lock_events()
+
+        assert sum(batch_sizes) == total
+        assert max(batch_sizes) <= lock_logger.MAX_BATCH
+        log_lines = (tmp_path / "logs" / "planloop.jsonl").read_text().splitlines()
+        assert [json.loads(line)["lock_entry_id"] for line in log_lines] == [
+            f"entry-{i}" for i in range(total)
+        ]
+
+    def test_log_fd_cache_evicts_and_closes_oldest(self, tmp_path: Path, monkeypatch):
+        """The descriptor cache is bounded and closes what it evicts."""
+        flush_lock_events()
+        monkeypatch.setattr(lock_logger, "MAX_OPEN_LOG_FDS", 2)
+        monkeypatch.setattr(lock_logger, "_LOG_FDS", OrderedDict())
+        sessions = [tmp_path / name for name in ("a", "b", "c")]
+
+        oldest = lock_logger._get_log_fd(sessions[0])
+        lock_logger._get_log_fd(sessions[1])
+        lock_logger._get_log_fd(sessions[2])
+        try:
+            assert len(lock_logger._LOG_FDS) == 2
+            assert sessions[0] / "logs" / "planloop.jsonl" not in lock_logger._LOG_FDS
+            with pytest.raises(OSError):
+                os.fstat(oldest)
+
+            # An evicted log is transparently reopened on the next write
+            lock_logger._write_batch([(sessions[0], {"event": "lock_released"})])
+            assert (sessions[0] / "logs" / "planloop.jsonl").read_text().count("\n") == 1
+        finally:
+            for fd in lock_logger._LOG_FDS.values():
+                os.close(fd)
@@ -0,0 +1,26 @@
+"""Tests for session log handler lifecycle."""
+from __future__ import annotations
+
+import logging
+
+from planloop import logging_utils
+
+
+def test_close_session_log_detaches_handler(tmp_path):
+    session_dir = tmp_path / "session"
+    session_dir.mkdir()
+
+    logging_utils.log_session_event(session_dir, "hello", level=logging.WARNING)
+    handler = logging_utils._SESSION_HANDLERS[session_dir.resolve()]
+    assert handler in logging_utils.get_logger().handlers
+
+    logging_utils.close_session_log(session_dir)
+
+    assert session_dir.resolve() not in logging_utils._SESSION_HANDLERS
+    assert handler not in logging_utils.get_logger().handlers
+    log_text = (session_dir / "logs" / logging_utils.LOG_FILENAME).read_text()
+    assert "hello" in log_text
+
+
+def test_close_session_log_without_handler_is_noop(tmp_path):
+    logging_utils.close_session_log(tmp_path / "never-logged")
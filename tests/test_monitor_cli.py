@@ -4,7 +4,6 @@ Tests the 'planloop monitor bash-health' command.
 """
 
 import pytest
-from typer.testing import CliRunner
 from unittest.mock import patch, Mock
 import json
 
@@ -12,18 +11,17 @@ import json
 class TestMonitorBashHealthCLI:
     """Test suite for monitor bash-health CLI command."""
     
-    def test_bash_health_command_exists(self):
+    def test_bash_health_command_exists(self, runner):
         """Test that monitor bash-health command is registered."""
         from planloop.cli import cli
         
-        runner = CliRunner()
         result = runner.invoke(cli, ['monitor', 'bash-health', '--help'])
         
         assert result.exit_code == 0
         assert 'bash-health' in result.output.lower() or 'Check health' in result.output
     
     @patch('planloop.diagnostics.bash_health.BashHealthMonitor')
-    def test_bash_health_human_output(self, mock_monitor_class):
+    def test_bash_health_human_output(self, mock_monitor_class, runner):
         """Test human-readable output format."""
         from planloop.cli import cli
         
@@ -54,14 +52,13 @@ class TestMonitorBashHealthCLI:
         }
         mock_monitor_class.return_value = mock_monitor
         
-        runner = CliRunner()
         result = runner.invoke(cli, ['monitor', 'bash-health'])
         
         assert result.exit_code == 0
         assert 'healthy' in result.output.lower() or '85' in result.output
         
     @patch('planloop.diagnostics.bash_health.BashHealthMonitor')
-    def test_bash_health_json_output(self, mock_monitor_class):
+    def test_bash_health_json_output(self, mock_monitor_class, runner):
         """Test JSON output format."""
         from planloop.cli import cli
         
@@ -92,7 +89,6 @@ class TestMonitorBashHealthCLI:
         mock_monitor.check_health.return_value = health_data
         mock_monitor_class.return_value = mock_monitor
         
-        runner = CliRunner()
         result = runner.invoke(cli, ['monitor', 'bash-health', '--json'])
         
         assert result.exit_code == 0
@@ -104,7 +100,7 @@ class TestMonitorBashHealthCLI:
         assert output_data["pid"] == 12345
     
     @patch('planloop.diagnostics.bash_health.BashHealthMonitor')
-    def test_bash_health_degraded_status(self, mock_monitor_class):
+    def test_bash_health_degraded_status(self, mock_monitor_class, runner):
         """Test output for degraded session."""
         from planloop.cli import cli
         
@@ -138,7 +134,6 @@ class TestMonitorBashHealthCLI:
         }
         mock_monitor_class.return_value = mock_monitor
         
-        runner = CliRunner()
         result = runner.invoke(cli, ['monitor', 'bash-health'])
         
         assert result.exit_code == 0
@@ -146,7 +141,7 @@ class TestMonitorBashHealthCLI:
         assert 'warning' in result.output.lower() or 'rotate' in result.output.lower()
     
     @patch('planloop.diagnostics.bash_health.BashHealthMonitor')
-    def test_bash_health_error_handling(self, mock_monitor_class):
+    def test_bash_health_error_handling(self, mock_monitor_class, runner):
         """Test error handling when health check fails."""
         from planloop.cli import cli
         
@@ -155,7 +150,6 @@ class TestMonitorBashHealthCLI:
         mock_monitor.check_health.side_effect = ValueError("Cannot determine bash session PID")
         mock_monitor_class.return_value = mock_monitor
         
-        runner = CliRunner()
         result = runner.invoke(cli, ['monitor', 'bash-health'])
         
         # Should handle error gracefully
@@ -163,7 +157,7 @@ class TestMonitorBashHealthCLI:
         assert 'error' in result.output.lower() or 'cannot' in result.output.lower()
     
     @patch('planloop.diagnostics.bash_health.BashHealthMonitor')
-    def test_bash_health_with_session_id(self, mock_monitor_class):
+    def test_bash_health_with_session_id(self, mock_monitor_class, runner):
         """Test providing explicit session ID."""
         from planloop.cli import cli
         
@@ -190,7 +184,6 @@ class TestMonitorBashHealthCLI:
         }
         mock_monitor_class.return_value = mock_monitor
         
-        runner = CliRunner()
         result = runner.invoke(cli, ['monitor', 'bash-health', '--session-id', 'custom-session'])
         
         assert result.exit_code == 0
@@ -8,19 +8,17 @@ from pathlib import Path
 import pytest
 
 
-def test_sessions_create_accepts_plan_file_flag():
+def test_sessions_create_accepts_plan_file_flag(runner):
     """Sessions create should accept --plan-file flag."""
-    from typer.testing import CliRunner
     from planloop.cli import app
     
-    runner = CliRunner()
     result = runner.invoke(app, ["sessions", "create", "--help"])
     
     assert result.exit_code == 0
     assert "--plan-file" in result.stdout
 
 
-def test_sessions_create_loads_existing_plan(tmp_path, monkeypatch):
+def test_sessions_create_loads_existing_plan(tmp_path, monkeypatch, runner):
     """Sessions create should load tasks from existing PLAN.md."""
     import os
     
@@ -39,10 +37,8 @@ def test_sessions_create_loads_existing_plan(tmp_path, monkeypatch):
 - [x] Task 3: Document feature A
 """)
     
-    from typer.testing import CliRunner
     from planloop.cli import app
     
-    runner = CliRunner()
     result = runner.invoke(app, [
         "sessions", "create",
         "--name", "test-session",
@@ -112,17 +108,15 @@ def test_plan_file_parser_handles_various_formats():
     assert tasks[4].status == "DONE"
 
 
-def test_sessions_create_with_invalid_plan_file_fails(tmp_path, monkeypatch):
+def test_sessions_create_with_invalid_plan_file_fails(tmp_path, monkeypatch, runner):
     """Sessions create should fail gracefully with invalid plan file."""
     import os
     
     home = tmp_path / ".planloop"
     monkeypatch.setenv("PLANLOOP_HOME", str(home))
     
-    from typer.testing import CliRunner
     from planloop.cli import app
     
-    runner = CliRunner()
     result = runner.invoke(app, [
         "sessions", "create",
         "--name", "test",
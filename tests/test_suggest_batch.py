@@ -9,12 +9,10 @@ from pathlib import Path
 import pytest
 
 
-def test_suggest_cli_accepts_weekly_flag():
+def test_suggest_cli_accepts_weekly_flag(runner):
     """planloop suggest should accept --weekly flag."""
-    from typer.testing import CliRunner
     from planloop.cli import app
     
-    runner = CliRunner()
     result = runner.invoke(app, ["suggest", "--help"])
     
     assert result.exit_code == 0
@@ -5,7 +5,6 @@ from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
-from typer.testing import CliRunner
 
 from planloop import cli
 from planloop.config import SuggestConfig
@@ -14,8 +13,6 @@ from planloop.core.llm_client import LLMClient, LLMConfig
 from planloop.core.session import create_session
 from planloop.core.suggest import SuggestionEngine
 
-runner = CliRunner()
-
 
 def test_llm_client_missing_api_key_error(monkeypatch):
     """Missing API key should raise clear error."""
@@ -112,7 +109,7 @@ def test_context_builder_permission_denied(tmp_path):
     assert context is not None
 
 
-def test_suggest_cli_missing_api_key(monkeypatch, tmp_path):
+def test_suggest_cli_missing_api_key(monkeypatch, tmp_path, runner):
     """Suggest command should error clearly when API key is missing."""
     home = tmp_path / "home"
     monkeypatch.setenv("PLANLOOP_HOME", str(home))
@@ -4,15 +4,12 @@ from __future__ import annotations
 from unittest.mock import Mock, patch
 
 import pytest
-from typer.testing import CliRunner
 
 from planloop import cli
 from planloop.core.session import create_session
 from planloop.core.state import Task, TaskStatus, TaskType
 from planloop.core.suggest import TaskSuggestion
 
-runner = CliRunner()
-
 
 @pytest.fixture
 def sample_project(tmp_path):
@@ -47,7 +44,7 @@ def test_basic():
     return project
 
 
-def test_suggest_empty_plan_generates_tasks(monkeypatch, tmp_path, sample_project):
+def test_suggest_empty_plan_generates_tasks(monkeypatch, tmp_path, sample_project, runner):
     """Integration test: Empty plan → suggest generates and adds tasks."""
     home = tmp_path / "home"
     monkeypatch.setenv("PLANLOOP_HOME", str(home))
@@ -99,7 +96,7 @@ def test_suggest_empty_plan_generates_tasks(monkeypatch, tmp_path, sample_projec
                 assert "Added 2 task(s)" in result.stdout
 
 
-def test_suggest_with_existing_tasks_no_duplicates(monkeypatch, tmp_path, sample_project):
+def test_suggest_with_existing_tasks_no_duplicates(monkeypatch, tmp_path, sample_project, runner):
     """Integration test: Existing tasks → no duplicate suggestions."""
     home = tmp_path / "home"
     monkeypatch.setenv("PLANLOOP_HOME", str(home))
@@ -150,7 +147,7 @@ def test_suggest_with_existing_tasks_no_duplicates(monkeypatch, tmp_path, sample
         assert result.exit_code == 0
 
 
-def test_suggest_dry_run_no_modifications(monkeypatch, tmp_path, sample_project):
+def test_suggest_dry_run_no_modifications(monkeypatch, tmp_path, sample_project, runner):
     """Integration test: Dry-run mode should not modify state."""
     home = tmp_path / "home"
     monkeypatch.setenv("PLANLOOP_HOME", str(home))
@@ -190,7 +187,7 @@ def test_suggest_dry_run_no_modifications(monkeypatch, tmp_path, sample_project)
             assert len(state.tasks) == initial_task_count
 
 
-def test_suggest_focus_area(monkeypatch, tmp_path, sample_project):
+def test_suggest_focus_area(monkeypatch, tmp_path, sample_project, runner):
     """Integration test: Focus area limits analysis scope."""
     home = tmp_path / "home"
     monkeypatch.setenv("PLANLOOP_HOME", str(home))
@@ -218,7 +215,7 @@ def test_suggest_focus_area(monkeypatch, tmp_path, sample_project):
             assert result.exit_code == 0
 
 
-def test_suggest_depth_parameter(monkeypatch, tmp_path, sample_project):
+def test_suggest_depth_parameter(monkeypatch, tmp_path, sample_project, runner):
     """Integration test: Depth parameter controls analysis thoroughness."""
     home = tmp_path / "home"
     monkeypatch.setenv("PLANLOOP_HOME", str(home))
@@ -248,7 +245,7 @@ def test_suggest_depth_parameter(monkeypatch, tmp_path, sample_project):
                 assert call_kwargs["depth"] == depth
 
 
-def test_suggest_handles_invalid_llm_output(monkeypatch, tmp_path, sample_project):
+def test_suggest_handles_invalid_llm_output(monkeypatch, tmp_path, sample_project, runner):
     """Integration test: Invalid LLM output should be handled gracefully."""
     home = tmp_path / "home"
     monkeypatch.setenv("PLANLOOP_HOME", str(home))
@@ -276,7 +273,7 @@ def test_suggest_handles_invalid_llm_output(monkeypatch, tmp_path, sample_projec
             assert "error" in result.output.lower()
 
 
-def test_suggest_limit_option(monkeypatch, tmp_path, sample_project):
+def test_suggest_limit_option(monkeypatch, tmp_path, sample_project, runner):
     """Integration test: Limit option restricts number of suggestions."""
     home = tmp_path / "home"
     monkeypatch.setenv("PLANLOOP_HOME", str(home))
@@ -19,7 +19,7 @@ from planloop.core.state import (
 )
 
 
-def test_status_includes_tdd_checklist_when_task_active(tmp_path, monkeypatch):
+def test_status_includes_tdd_checklist_when_task_active(tmp_path, monkeypatch, runner):
     """Status includes TDD checklist when working on a task."""
     monkeypatch.setenv("PLANLOOP_HOME", str(tmp_path))
 
@@ -48,11 +48,8 @@ def test_status_includes_tdd_checklist_when_task_active(tmp_path, monkeypatch):
     session_dir.mkdir(parents=True)
     save_session_state(session_dir, state)
 
-    from typer.testing import CliRunner
-
     from planloop.cli import app
 
-    runner = CliRunner()
     result = runner.invoke(app, ["status", "--session", "test-tdd-checklist", "--json"])
     assert result.exit_code == 0
     output = json.loads(result.stdout)
@@ -74,7 +71,7 @@ def test_status_includes_tdd_checklist_when_task_active(tmp_path, monkeypatch):
     assert "commit" in checklist_text
 
 
-def test_status_omits_tdd_checklist_when_no_tasks(tmp_path, monkeypatch):
+def test_status_omits_tdd_checklist_when_no_tasks(tmp_path, monkeypatch, runner):
     """Status omits TDD checklist when no tasks are active."""
     monkeypatch.setenv("PLANLOOP_HOME", str(tmp_path))
 
@@ -96,11 +93,8 @@ def test_status_omits_tdd_checklist_when_no_tasks(tmp_path, monkeypatch):
     session_dir.mkdir(parents=True)
     save_session_state(session_dir, state)
 
-    from typer.testing import CliRunner
-
     from planloop.cli import app
 
-    runner = CliRunner()
     result = runner.invoke(app, ["status", "--session", "test-no-tdd", "--json"])
     assert result.exit_code == 0
     output = json.loads(result.stdout)
@@ -109,7 +103,7 @@ def test_status_omits_tdd_checklist_when_no_tasks(tmp_path, monkeypatch):
     assert "tdd_checklist" not in output or output["tdd_checklist"] is None
 
 
-def test_tdd_checklist_is_actionable(tmp_path, monkeypatch):
+def test_tdd_checklist_is_actionable(tmp_path, monkeypatch, runner):
     """TDD checklist provides clear, actionable steps."""
     monkeypatch.setenv("PLANLOOP_HOME", str(tmp_path))
 
@@ -133,11 +127,8 @@ def test_tdd_checklist_is_actionable(tmp_path, monkeypatch):
     session_dir.mkdir(parents=True)
     save_session_state(session_dir, state)
 
-    from typer.testing import CliRunner
-
     from planloop.cli import app
 
-    runner = CliRunner()
     result = runner.invoke(app, ["status", "--session", "test-actionable-tdd", "--json"])
     assert result.exit_code == 0
     output = json.loads(result.stdout)
@@ -35,6 +35,55 @@ class TestTranscriptAnalyzer:
         assert events[1]["event"] == "bash_command"
         assert events[2]["event"] == "bash_output"
 
+    def test_iter_events_skips_blank_and_malformed_lines(self, tmp_path):
+        """Test lazily iterating transcript events from disk."""
+        from planloop.diagnostics.transcript_analyzer import TranscriptAnalyzer
+        
+        transcript = tmp_path / "agent-transcript.jsonl"
+        transcript.write_bytes(
+            b'{"event": "command", "command": "planloop status"}\n'
+            b"\n"
+            b"not json\n"
+            b'{"event": "bash_command", "command": "ls", "cmd_number": 1}\n'
+        )
+        
+        analyzer = TranscriptAnalyzer()
+        events = analyzer.iter_events(str(transcript))
+        
+        assert not isinstance(events, list)
+        assert [e["event"] for e in events] == ["command", "bash_command"]
+
+    def test_iter_events_projects_fields(self, tmp_path):
+        """Test keeping only requested event fields."""
+        from planloop.diagnostics.transcript_analyzer import TranscriptAnalyzer
+        
+        transcript = tmp_path / "agent-transcript.jsonl"
+        transcript.write_text(
+            json.dumps({"event": "bash_output", "output": "x" * 1000, "cmd_number": 1}) + "\n"
+        )
+        
+        analyzer = TranscriptAnalyzer()
+        events = analyzer.parse_transcript(str(transcript), fields={"event", "cmd_number"})
+        
+        assert events == [{"event": "bash_output", "cmd_number": 1}]
+
+    def test_parse_transcript_streams_large_files(self, tmp_path, monkeypatch):
+        """Test that files over the bulk-read limit are parsed line by line."""
+        from planloop.diagnostics import transcript_analyzer
+        from planloop.diagnostics.transcript_analyzer import TranscriptAnalyzer
+        
+        transcript = tmp_path / "agent-transcript.jsonl"
+        transcript.write_bytes(b'{"event": "command"}\r\n\n{"event": "bash_command"}')
+        
+        analyzer = TranscriptAnalyzer()
+        bulk = analyzer.parse_transcript(str(transcript))
+        
+        monkeypatch.setattr(transcript_analyzer, "BULK_READ_MAX_BYTES", 0)
+        with patch.object(analyzer, "iter_events", wraps=analyzer.iter_events) as streamed:
+            assert analyzer.parse_transcript(str(transcript)) == bulk
+        streamed.assert_called_once()
+        assert [e["event"] for e in bulk] == ["command", "bash_command"]
+
     def test_extract_bash_commands(self):
         """Test extracting only bash commands from events."""
         from planloop.diagnostics.transcript_analyzer import TranscriptAnalyzer
@@ -72,6 +121,23 @@ class TestTranscriptAnalyzer:
         assert "duration_minutes" in stats
         assert "avg_command_interval_seconds" in stats
 
+    def test_calculate_statistics_average_interval(self):
+        """Test average interval spans first to last timestamp."""
+        from planloop.diagnostics.transcript_analyzer import TranscriptAnalyzer
+        
+        analyzer = TranscriptAnalyzer()
+        
+        commands = [
+            {"timestamp": "2025-11-18T19:00:00Z", "cmd_number": 1},
+            {"timestamp": "2025-11-18T19:01:00Z", "cmd_number": 2},
+            {"timestamp": "2025-11-18T19:02:30Z", "cmd_number": 3},
+        ]
+        
+        stats = analyzer.calculate_statistics(commands)
+        
+        assert stats["duration_minutes"] == 2.5
+        assert stats["avg_command_interval_seconds"] == 75.0
+
     def test_detect_pty_failure_pattern(self):
         """Test detecting PTY failure in transcript."""
         from planloop.diagnostics.transcript_analyzer import TranscriptAnalyzer
@@ -110,6 +176,75 @@ class TestTranscriptAnalyzer:
         
         assert failure_analysis["failure_detected"] is False
 
+    @pytest.mark.parametrize(
+        "error,expect_check",
+        [
+            # Every bash_command carries pty_count; "empty" must not match either
+            (None, False),
+            ("posix_spawnp failed: Device not configured", True),
+        ],
+        ids=["healthy", "posix_spawnp"],
+    )
+    def test_analyze_session_failure_prescan(self, tmp_path, monkeypatch, error, expect_check):
+        """Test that only real failure payloads turn on per-command checks."""
+        from planloop.diagnostics.transcript_analyzer import TranscriptAnalyzer
+
+        logs = tmp_path / ".planloop" / "sessions" / "work" / "logs"
+        logs.mkdir(parents=True)
+        event = {
+            "timestamp": "2025-11-18T19:00:00Z",
+            "event": "bash_command",
+            "command": "ls empty_dir",
+            "cmd_number": 1,
+            "pty_count": 3,
+            "exit_code": 1 if error else 0,
+        }
+        if error:
+            event["error"] = error
+        transcript = logs / "agent-transcript.jsonl"
+        transcript.write_text(json.dumps(event) + "\n")
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+
+        analyzer = TranscriptAnalyzer()
+        seen = []
+        scan_commands = analyzer._scan_commands
+
+        def spy(commands, check_failures=True):
+            seen.append(check_failures)
+            return scan_commands(commands, check_failures=check_failures)
+
+        monkeypatch.setattr(analyzer, "_scan_commands", spy)
+        analysis = analyzer.analyze_session("work")
+
+        assert analyzer._quick_failure_scan(str(transcript)) is expect_check
+        assert seen == [expect_check]
+        assert analysis["failure_analysis"]["failure_detected"] is expect_check
+
+    def test_analyze_session_bulk_reads_small_transcripts(self, tmp_path, monkeypatch):
+        """Test that analyze_session only streams transcripts over the bulk-read limit."""
+        from planloop.diagnostics import transcript_analyzer
+        from planloop.diagnostics.transcript_analyzer import TranscriptAnalyzer
+
+        logs = tmp_path / ".planloop" / "sessions" / "work" / "logs"
+        logs.mkdir(parents=True)
+        events = [
+            {"timestamp": f"2025-11-18T19:00:0{i}Z", "event": "bash_command", "cmd_number": i}
+            for i in range(1, 4)
+        ]
+        (logs / "agent-transcript.jsonl").write_text(
+            "\n".join(json.dumps(e) for e in events) + '\n{"event": "bash_output"}\n'
+        )
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        analyzer = TranscriptAnalyzer()
+
+        with patch.object(analyzer, "iter_events", wraps=analyzer.iter_events) as streamed:
+            bulk = analyzer.analyze_session("work")
+            streamed.assert_not_called()
+            monkeypatch.setattr(transcript_analyzer, "BULK_READ_MAX_BYTES", 0)
+            assert analyzer.analyze_session("work") == bulk
+            streamed.assert_called_once()
+        assert bulk["statistics"]["total_commands"] == 3
+
     def test_generate_text_report(self):
         """Test generating human-readable text report."""
         from planloop.diagnostics.transcript_analyzer import TranscriptAnalyzer
@@ -265,3 +400,143 @@ class TestTranscriptAnalyzer:
         
         assert "complex_command_chains" in factors
         assert factors["complex_command_chains"] is True
+
+
+# Reference versions of the analyzers as they were before the single-pass
+# scan: each walks the commands itself. The scan-based analyzers must agree
+# with them on any command list.
+def _reference_analysis(commands: list[dict]) -> dict:
+    from planloop.diagnostics.transcript_analyzer import _parse_ts
+
+    def rate(cmds: list[dict]) -> float:
+        timestamps = [ts for c in cmds if (ts := _parse_ts(c.get("timestamp"))) is not None]
+        if len(cmds) < 2 or len(timestamps) < 2:
+            return 0
+        duration = (timestamps[-1] - timestamps[0]).total_seconds() / 60
+        return len(cmds) / duration if duration > 0 else 0
+
+    timestamps = [ts for c in commands if (ts := _parse_ts(c.get("timestamp"))) is not None]
+    duration = (timestamps[-1] - timestamps[0]).total_seconds() if len(timestamps) >= 2 else 0
+    statistics = {
+        "total_commands": len(commands),
+        "duration_minutes": round(duration / 60, 1),
+        "avg_command_interval_seconds": round(duration / (len(timestamps) - 1), 1)
+        if len(timestamps) >= 2
+        else 0,
+        "first_command": commands[0].get("timestamp"),
+        "last_command": commands[-1].get("timestamp"),
+    }
+
+    failing = [
+        c for c in commands
+        if (e := c.get("error")) and ("posix_spawnp" in e or "pty" in e.lower())
+    ]
+    failure = {
+        "failure_detected": bool(failing),
+        "failure_type": "pty_exhaustion" if failing else None,
+        "first_failure_command": failing[0].get("cmd_number") if failing else None,
+    }
+
+    if len(commands) < 10:
+        frequency: dict = {"phases": [], "rate_increased": False}
+    else:
+        mid = len(commands) // 2
+        first_rate, second_rate = rate(commands[:mid]), rate(commands[mid:])
+        frequency = {
+            "phases": [
+                {"commands": mid, "rate_per_minute": round(first_rate, 2)},
+                {"commands": len(commands) - mid, "rate_per_minute": round(second_rate, 2)},
+            ],
+            "rate_increased": second_rate > first_rate * 1.5,
+        }
+
+    pty_counts = [c["pty_count"] for c in commands if c.get("pty_count") is not None]
+    growth = (
+        {
+            "start_pty_count": pty_counts[0],
+            "end_pty_count": pty_counts[-1],
+            "growth_rate": round((pty_counts[-1] - pty_counts[0]) / len(pty_counts), 2),
+        }
+        if pty_counts
+        else {"start_pty_count": 0, "end_pty_count": 0, "growth_rate": 0}
+    )
+
+    command_strs = [c.get("command", "") for c in commands]
+    factors = {
+        "complex_command_chains": any(
+            s.count("&&") >= 2 or s.count(";") >= 2 for s in command_strs
+        ),
+        "subprocess_spawning": any(
+            "source" in s and ("&&" in s or ";" in s) for s in command_strs
+        ),
+        "no_session_rotation": True,
+    }
+    return {
+        "statistics": statistics,
+        "failure": failure,
+        "frequency": frequency,
+        "growth": growth,
+        "factors": factors,
+    }
+
+
+try:  # pragma: no cover - optional dev dependency
+    from hypothesis import given
+    from hypothesis import strategies as st
+except ImportError:  # pragma: no cover
+    st = None
+
+if st is not None:
+
+    _timestamps = st.one_of(
+        st.datetimes(
+            min_value=datetime(2025, 1, 1), max_value=datetime(2025, 1, 2)
+        ).map(lambda d: d.isoformat() + "Z"),
+        st.sampled_from([None, "not-a-timestamp"]),
+    )
+    _command_strings = st.lists(
+        st.sampled_from(["cd /repo", "source .venv/bin/activate", "pytest", " && ", "; "]),
+        max_size=6,
+    ).map("".join)
+    _commands = st.lists(
+        st.fixed_dictionaries(
+            {"cmd_number": st.integers(min_value=1, max_value=500), "timestamp": _timestamps},
+            optional={
+                "pty_count": st.integers(min_value=0, max_value=64),
+                "error": st.sampled_from(
+                    ["", "timeout", "posix_spawnp failed", "out of PTY devices", "ENOENT"]
+                ),
+                "command": _command_strings,
+            },
+        ),
+        min_size=1,
+        max_size=40,
+    )
+
+    @given(_commands)
+    def test_scan_based_analyzers_match_reference(commands):
+        from planloop.diagnostics.transcript_analyzer import TranscriptAnalyzer
+
+        analyzer = TranscriptAnalyzer()
+        scan = analyzer._scan_commands(commands)
+        expected = _reference_analysis(commands)
+
+        # Both with an explicit shared scan and with each analyzer scanning itself
+        for explicit in (scan, None):
+            results = {
+                "statistics": analyzer.calculate_statistics(commands, scan=explicit),
+                "failure": analyzer.detect_failure_pattern(commands, scan=explicit),
+                "frequency": analyzer.analyze_command_frequency(commands, scan=explicit),
+                "growth": analyzer.analyze_pty_growth(commands, scan=explicit),
+                "factors": analyzer.identify_contributing_factors(commands, scan=explicit),
+            }
+            assert results == expected
+
+        # A scan that skips error checks reports no failure
+        quiet = analyzer._scan_commands(commands, check_failures=False)
+        assert analyzer.detect_failure_pattern(commands, scan=quiet)["failure_detected"] is False
+
+else:  # pragma: no cover - executed only without hypothesis installed
+
+    def test_scan_based_analyzers_match_reference():
+        pytest.skip("hypothesis not installed")
@@ -19,7 +19,7 @@ from planloop.core.state import (
 )
 
 
-def test_transition_detected_when_task_just_completed(tmp_path, monkeypatch):
+def test_transition_detected_when_task_just_completed(tmp_path, monkeypatch, runner):
     """Status detects transition when a task moves from IN_PROGRESS to DONE."""
     monkeypatch.setenv("PLANLOOP_HOME", str(tmp_path))
 
@@ -50,12 +50,8 @@ def test_transition_detected_when_task_just_completed(tmp_path, monkeypatch):
     session_dir.mkdir(parents=True)
     save_session_state(session_dir, state)
 
-    from typer.testing import CliRunner
-
     from planloop.cli import app
 
-    runner = CliRunner()
-
     # First call - task 1 still IN_PROGRESS
     result = runner.invoke(app, ["status", "--session", "test-transition", "--json"])
     assert result.exit_code == 0
@@ -88,7 +84,7 @@ def test_transition_detected_when_task_just_completed(tmp_path, monkeypatch):
     assert output2["next_action"]["task_id"] == 2
 
 
-def test_no_transition_when_task_was_already_done(tmp_path, monkeypatch):
+def test_no_transition_when_task_was_already_done(tmp_path, monkeypatch, runner):
     """No transition detected if task was already DONE in previous call."""
     monkeypatch.setenv("PLANLOOP_HOME", str(tmp_path))
 
@@ -114,12 +110,8 @@ def test_no_transition_when_task_was_already_done(tmp_path, monkeypatch):
     session_dir.mkdir(parents=True)
     save_session_state(session_dir, state)
 
-    from typer.testing import CliRunner
-
     from planloop.cli import app
 
-    runner = CliRunner()
-
     # Call status - task 1 was already done
     result = runner.invoke(app, ["status", "--session", "test-no-transition", "--json"])
     assert result.exit_code == 0
@@ -130,7 +122,7 @@ def test_no_transition_when_task_was_already_done(tmp_path, monkeypatch):
     assert output["completed_task_id"] is None
 
 
-def test_transition_requires_state_tracking(tmp_path, monkeypatch):
+def test_transition_requires_state_tracking(tmp_path, monkeypatch, runner):
     """Transition detection uses last_updated_at timestamp."""
     monkeypatch.setenv("PLANLOOP_HOME", str(tmp_path))
 
@@ -165,11 +157,8 @@ def test_transition_requires_state_tracking(tmp_path, monkeypatch):
     session_dir.mkdir(parents=True)
     save_session_state(session_dir, state)
 
-    from typer.testing import CliRunner
-
     from planloop.cli import app
 
-    runner = CliRunner()
     result = runner.invoke(app, ["status", "--session", "test-state-tracking", "--json"])
     assert result.exit_code == 0
     output = json.loads(result.stdout)
@@ -0,0 +1,357 @@
+"""Tests for the web server's helpers and routes."""
+from __future__ import annotations
+
+import json
+import os
+from datetime import UTC, datetime
+from email.utils import formatdate
+from pathlib import Path
+
+import pytest
+
+from planloop import json_utils
+from planloop.core.session import create_session, save_session_state
+from planloop.core.state import Task, TaskType
+from planloop.tui.app import SessionViewModel
+from planloop.web import server
+
+
+def test_read_session_state_reuses_parse_until_file_changes(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLANLOOP_HOME", str(tmp_path / "home"))
+    state = create_session(name="Foo", title="First", project_root=Path("/repo"))
+    state_path = tmp_path / "home" / "sessions" / state.session / "state.json"
+
+    first = server._read_session_state(state_path)
+    assert server._read_session_state(state_path) is first
+
+    state.title = "Second title"
+    state_path.write_text(state.model_dump_json(), encoding="utf-8")
+    stat = state_path.stat()
+    os.utime(state_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = server._read_session_state(state_path)
+    assert second is not first
+    assert second.title == "Second title"
+
+
+def test_read_session_summary_prefers_fresh_summary_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLANLOOP_HOME", str(tmp_path / "home"))
+    state = create_session(name="Foo", title="Listed", project_root=Path("/repo"))
+    session_dir = tmp_path / "home" / "sessions" / state.session
+
+    summary = server._read_session_summary(session_dir)
+    assert summary == {
+        "id": state.session,
+        "description": "Listed",
+        "task_count": 0,
+        "signal_count": 0,
+    }
+
+    # A state.json newer than summary.json forces a full parse
+    state.title = "Edited by hand"
+    state_path = session_dir / "state.json"
+    state_path.write_text(state.model_dump_json(), encoding="utf-8")
+    stat = (session_dir / "summary.json").stat()
+    os.utime(state_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert server._read_session_summary(session_dir)["description"] == "Edited by hand"
+    assert server._read_session_summary(tmp_path) is None
+
+
+def test_iter_session_summaries_json_streams_newest_first(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLANLOOP_HOME", str(tmp_path / "home"))
+    sessions_path = tmp_path / "home" / "sessions"
+    first = create_session(name="Alpha", title="A", project_root=Path("/repo"))
+    second = create_session(name="Beta", title="B", project_root=Path("/repo"))
+    (sessions_path / "not-a-session").mkdir()
+    (sessions_path / "stray.txt").write_text("x", encoding="utf-8")
+
+    chunks = list(server._iter_session_summaries_json(sessions_path))
+
+    assert chunks[0] == b"[" and chunks[-1] == b"]"
+    listed = json.loads(b"".join(chunks))
+    expected_ids = sorted([first.session, second.session], reverse=True)
+    assert [s["id"] for s in listed] == expected_ids
+    assert list(server._iter_session_summaries_json(tmp_path / "home" / "prompts")) == [b"[", b"]"]
+
+
+def test_render_state_json_is_cached_per_parse(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLANLOOP_HOME", str(tmp_path / "home"))
+    state = create_session(name="Foo", title="Rendered", project_root=Path("/repo"))
+    session_dir = tmp_path / "home" / "sessions" / state.session
+    updated = datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC)
+    state.tasks.append(
+        Task(id=1, title="Render", type=TaskType.FEATURE, last_updated_at=updated)
+    )
+    save_session_state(session_dir, state)
+    state_path = session_dir / "state.json"
+
+    body = server._render_state_json(state_path, "session")
+    parsed = server._read_session_state(state_path)
+
+    session = json.loads(body)
+    assert session["title"] == "Rendered"
+    # isoformat(), as FastAPI's jsonable_encoder and the task endpoints write it
+    assert session["created_at"] == parsed.created_at.isoformat()
+    assert server._render_state_json(state_path, "session") is body
+    tasks = server._render_state_json(state_path, "tasks")
+    assert json.loads(tasks) == [
+        {**task.model_dump(mode="json"), "last_updated_at": "2025-01-02T03:04:05+00:00"}
+        for task in parsed.tasks
+    ]
+    assert server._render_state_json(state_path, "tasks") is tasks
+    assert json.loads(server._render_state_json(state_path, "signals")) == []
+
+
+def test_render_legacy_session_tables():
+    model = SessionViewModel(
+        session="s1",
+        title="Demo",
+        now_reason="idle",
+        tasks=[("1", "Write tests", "TODO"), ("2", "Ship", "DONE")],
+        signals=[("CI failed", "OPEN")],
+    )
+
+    html = server._render_legacy_session(model)
+
+    assert "<h1>Demo</h1>" in html
+    assert "<tr><td>1</td><td>Write tests</td><td>TODO</td></tr><tr><td>2</td>" in html
+    assert "<tr><td>CI failed</td><td>OPEN</td></tr></table>" in html
+    assert server._render_legacy_index(["a", "b"]) == (
+        "<h1>planloop Sessions</h1><ul>"
+        "<li><a href='/legacy/sessions/a'>a</a></li>"
+        "<li><a href='/legacy/sessions/b'>b</a></li></ul>"
+    )
+
+
+def test_render_legacy_pages_escape_html():
+    model = SessionViewModel(
+        session="s1",
+        title="<script>alert(1)</script>",
+        now_reason="idle",
+        tasks=[("1", "a & b", "TODO")],
+        signals=[("<b>", "OPEN")],
+    )
+
+    html = server._render_legacy_session(model)
+
+    assert "<script>" not in html
+    assert "&lt;script&gt;alert(1)&lt;/script&gt;" in html
+    assert "<td>a &amp; b</td>" in html
+    assert "<td>&lt;b&gt;</td>" in html
+    assert "href='/legacy/sessions/x&#x27;y'" in server._render_legacy_index(["x'y"])
+
+
+def test_file_etag_and_if_none_match(tmp_path):
+    asset = tmp_path / "index.html"
+    asset.write_text("<html></html>", encoding="utf-8")
+    etag = server._file_etag(asset.stat())
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert server._etag_matches(etag, etag)
+    assert server._etag_matches(f'"other", W/{etag}', etag)
+    assert server._etag_matches("*", etag)
+    assert not server._etag_matches(None, etag)
+    assert not server._etag_matches('"stale"', etag)
+    assert server._etag_matches(etag, f"W/{etag}")
+
+
+def test_iter_session_states_skips_dirs_without_state(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLANLOOP_HOME", str(tmp_path / "home"))
+    sessions_path = tmp_path / "home" / "sessions"
+    state = create_session(name="Foo", title="Tasks", project_root=Path("/repo"))
+    state.tasks.append(Task(id=1, title="Scan", type=TaskType.FEATURE))
+    save_session_state(sessions_path / state.session, state)
+    (sessions_path / "empty").mkdir()
+    (sessions_path / "broken").mkdir()
+    (sessions_path / "broken" / "state.json").write_text("{", encoding="utf-8")
+
+    listed = list(server._iter_session_states(sessions_path))
+
+    assert [name for name, _ in listed] == [state.session]
+    tasks = server._all_task_dicts(sessions_path)
+    assert [(t["title"], t["session"], t["session_name"]) for t in tasks] == [
+        ("Scan", state.session, "Tasks")
+    ]
+
+
+def test_home_initializes_once_per_override(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_initialize_home():
+        calls.append(os.environ["PLANLOOP_HOME"])
+        return Path(os.environ["PLANLOOP_HOME"])
+
+    monkeypatch.setattr(server, "initialize_home", fake_initialize_home)
+    server._initialized_home.cache_clear()
+    try:
+        monkeypatch.setenv("PLANLOOP_HOME", str(tmp_path / "a"))
+        assert server._home() == server._home() == tmp_path / "a"
+        monkeypatch.setenv("PLANLOOP_HOME", str(tmp_path / "b"))
+        assert server._home() == tmp_path / "b"
+    finally:
+        server._initialized_home.cache_clear()
+
+    assert calls == [str(tmp_path / "a"), str(tmp_path / "b")]
+
+
+def test_is_plain_relative_path_rejects_traversal():
+    assert server._is_plain_relative_path("favicon.ico")
+    assert server._is_plain_relative_path("icons/logo.svg")
+
+    for path in ["", "/etc/passwd", "../secret", "a/../../b", "a//b", "./x", "a\\..\\b", "x\x00y"]:
+        assert not server._is_plain_relative_path(path), path
+
+
+def test_iter_session_summaries_json_pages_by_name(tmp_path):
+    sessions_path = tmp_path / "sessions"
+    for name in ["a", "b", "c", "d"]:
+        (sessions_path / name).mkdir(parents=True)
+        (sessions_path / name / "state.json").write_text("{}", encoding="utf-8")
+        (sessions_path / name / "summary.json").write_text(
+            json.dumps({"id": name, "description": "", "task_count": 0, "signal_count": 0}),
+            encoding="utf-8",
+        )
+
+    def page(limit, offset=0):
+        body = b"".join(server._iter_session_summaries_json(sessions_path, limit, offset))
+        return [s["id"] for s in json.loads(body)]
+
+    assert page(None) == ["d", "c", "b", "a"]
+    assert page(2) == ["d", "c"]
+    assert page(2, offset=1) == ["c", "b"]
+    assert page(None, offset=3) == ["a"]
+    assert page(5, offset=4) == []
+
+
+def test_not_modified_since_compares_whole_seconds():
+    mtime = 1_700_000_000.7
+    header = formatdate(mtime, usegmt=True)
+
+    assert server._not_modified_since(header, mtime)
+    assert not server._not_modified_since(header, mtime + 1)
+    assert server._not_modified_since("Tue, 14 Nov 2023 22:13:20", mtime)
+    assert not server._not_modified_since(None, mtime)
+    assert not server._not_modified_since("not a date", mtime)
+
+
+@pytest.fixture
+def client(planloop_home):
+    """A TestClient for the app, with PLANLOOP_HOME pointing at a fresh home."""
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")  # TestClient's transport
+    from fastapi.testclient import TestClient
+
+    with TestClient(server.get_app()) as test_client:
+        yield test_client
+
+
+def test_session_route_answers_if_none_match_with_304(client):
+    state = create_session(name="Foo", title="Cached", project_root=Path("/repo"))
+    url = f"/api/sessions/{state.session}"
+
+    first = client.get(url)
+    assert first.status_code == 200
+    assert first.json()["title"] == "Cached"
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+
+    not_modified = client.get(url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+    # Weak comparison: the strong form of the same tag also matches
+    strong = client.get(f"{url}/tasks", headers={"If-None-Match": etag.removeprefix("W/")})
+    assert strong.status_code == 304
+
+    # Rewriting state.json changes the ETag, so the old one no longer matches
+    session_dir = server._home() / "sessions" / state.session
+    state.tasks.append(Task(id=1, title="New", type=TaskType.FEATURE))
+    save_session_state(session_dir, state)
+    stat = (session_dir / "state.json").stat()
+    os.utime(session_dir / "state.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    changed = client.get(f"{url}/tasks", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert [task["title"] for task in changed.json()] == ["New"]
+    assert changed.headers["etag"] != etag
+
+
+def test_legacy_index_honors_if_modified_since(client):
+    create_session(name="Foo", title="Legacy", project_root=Path("/repo"))
+
+    first = client.get("/legacy")
+    assert first.status_code == 200
+    last_modified = first.headers["last-modified"]
+    sessions_mtime = (server._home() / "sessions").stat().st_mtime
+    assert last_modified == formatdate(sessions_mtime, usegmt=True)
+
+    not_modified = client.get("/legacy", headers={"If-Modified-Since": last_modified})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["last-modified"] == last_modified
+
+    stale = formatdate(sessions_mtime - 60, usegmt=True)
+    assert client.get("/legacy", headers={"If-Modified-Since": stale}).status_code == 200
+
+
+def test_session_list_route_pages_newest_first(client):
+    sessions_path = server._home() / "sessions"
+    for name in ["a", "b", "c"]:
+        (sessions_path / name).mkdir(parents=True)
+        (sessions_path / name / "state.json").write_text("{}", encoding="utf-8")
+        (sessions_path / name / "summary.json").write_text(
+            json.dumps({"description": name.upper(), "task_count": 0, "signal_count": 0}),
+            encoding="utf-8",
+        )
+
+    def page(**params):
+        response = client.get("/api/sessions", params=params)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        return [session["id"] for session in response.json()]
+
+    assert page() == ["c", "b", "a"]
+    assert page(limit=2) == ["c", "b"]
+    assert page(limit=2, offset=2) == ["a"]
+    # Negative offsets are clamped to the first page
+    assert page(limit=1, offset=-5) == ["c"]
+
+
+@pytest.mark.parametrize("backend", ["orjson", "stdlib"])
+def test_task_routes_return_json(client, monkeypatch, backend):
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_utils, "orjson", None)
+    updated = datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC)
+    state = create_session(name="Foo", title="Tasks", project_root=Path("/repo"))
+    state.tasks.append(
+        Task(id=1, title="Write café docs", type=TaskType.DOC, last_updated_at=updated)
+    )
+    save_session_state(server._home() / "sessions" / state.session, state)
+
+    listed = client.get("/api/tasks", params={"search": "café"})
+    assert listed.status_code == 200
+    assert listed.headers["content-type"] == "application/json"
+    body = listed.json()
+    assert (body["total"], body["page"], body["pageSize"]) == (1, 1, 50)
+    assert body["tasks"][0]["session_name"] == "Tasks"
+    assert body["tasks"][0]["last_updated_at"] == "2025-01-02T03:04:05+00:00"
+
+    found = client.get("/api/tasks/search", params={"q": "CAFÉ"})
+    assert found.status_code == 200
+    assert [task["title"] for task in found.json()["tasks"]] == ["Write café docs"]
+
+
+def test_routes_share_datetime_format(client):
+    updated = datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC)
+    state = create_session(name="Foo", title="Dates", project_root=Path("/repo"))
+    state.tasks.append(Task(id=1, title="Dated", type=TaskType.DOC, last_updated_at=updated))
+    save_session_state(server._home() / "sessions" / state.session, state)
+
+    session_tasks = client.get(f"/api/sessions/{state.session}/tasks").json()
+    all_tasks = client.get("/api/tasks").json()["tasks"]
+
+    assert session_tasks[0]["last_updated_at"] == "2025-01-02T03:04:05+00:00"
+    assert all_tasks[0]["last_updated_at"] == session_tasks[0]["last_updated_at"]
+    session = client.get(f"/api/sessions/{state.session}").json()
+    assert session["last_updated_at"] == state.last_updated_at.isoformat()